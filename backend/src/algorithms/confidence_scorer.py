@@ -10,18 +10,22 @@ This algorithm evaluates the strength of relationships based on:
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from src.models.correlation_models import (
     EvidenceRelationship,
     DetectionMethod,
     RelationshipType
 )
 from src.models.unified_evidence import UnifiedEvidenceItem
+from src.algorithms.time_utils import to_epoch_microseconds, MICROSECONDS_PER_DAY
 
 logger = logging.getLogger(__name__)
 
+
 class ConfidenceScorer:
     """
     Calculate confidence scores for evidence relationships
@@ -33,6 +37,16 @@ class ConfidenceScorer:
     - Content similarity strength
     """
     
+    __slots__ = (
+        'method_confidence',
+        'type_bonuses',
+        '_method_index',
+        '_method_lut',
+        '_type_index',
+        '_type_lut',
+        'max_temporal_bonus_days'
+    )
+    
     def __init__(self):
         """Initialize the confidence scorer"""
         # Base confidence scores by detection method
@@ -45,14 +59,30 @@ class ConfidenceScorer:
             DetectionMethod.MANUAL: 1.0
         }
         
+        # Bonus by relationship type - some are stronger indicators than others
+        self.type_bonuses = {
+            RelationshipType.SOLVES: 0.1,      # Strong relationship
+            RelationshipType.REFERENCES: 0.05,  # Medium relationship
+            RelationshipType.RELATED_TO: 0.0,   # Neutral
+            RelationshipType.DUPLICATE: 0.1,    # Strong relationship
+            RelationshipType.SEQUENTIAL: 0.05,  # Medium relationship
+            RelationshipType.CAUSAL: 0.1        # Strong relationship
+        }
+        
+        # Lookup tables indexed by enum position for batch scoring
+        self._method_index = {method: index for index, method in enumerate(DetectionMethod)}
+        self._method_lut = np.array([self.method_confidence.get(method, 0.3) for method in DetectionMethod])
+        self._type_index = {rel_type: index for index, rel_type in enumerate(RelationshipType)}
+        self._type_lut = np.array([self.type_bonuses.get(rel_type, 0.0) for rel_type in RelationshipType])
+        
         # Maximum time difference for temporal bonus (7 days)
         self.max_temporal_bonus_days = 7
         
         logger.info("Confidence Scorer initialized")
     
-    async def score_relationship(self, relationship: EvidenceRelationship,
-                               primary_item: UnifiedEvidenceItem,
-                               related_item: UnifiedEvidenceItem) -> float:
+    def score_relationship(self, relationship: EvidenceRelationship,
+                         primary_item: UnifiedEvidenceItem,
+                         related_item: UnifiedEvidenceItem) -> float:
         """
         Calculate 0.0-1.0 confidence score for a relationship
         
@@ -64,58 +94,83 @@ class ConfidenceScorer:
         Returns:
             Confidence score between 0.0 and 1.0
         """
-        # Start with base confidence from detection method
-        base_confidence = self.method_confidence.get(relationship.detection_method, 0.3)
+        scores = self.score_relationships(
+            [relationship],
+            {relationship.primary_evidence_id: primary_item},
+            {relationship.related_evidence_id: related_item}
+        )
+        return float(scores[0])
+    
+    def score_relationships(self, relationships: List[EvidenceRelationship],
+                            primary_items_by_id: Dict[str, UnifiedEvidenceItem],
+                            related_items_by_id: Dict[str, UnifiedEvidenceItem]) -> np.ndarray:
+        """
+        Calculate 0.0-1.0 confidence scores for a batch of relationships
         
-        # Calculate temporal proximity bonus
-        temporal_bonus = self._calculate_temporal_bonus(primary_item, related_item)
+        Per-pair features are gathered into arrays and combined in a single
+        vectorized pass, so large relationship sets avoid per-item arithmetic.
         
-        # Calculate author correlation bonus
-        author_bonus = self._calculate_author_bonus(primary_item, related_item)
+        Args:
+            relationships: Relationships to score
+            primary_items_by_id: Evidence items keyed by id for primary_evidence_id lookups
+            related_items_by_id: Evidence items keyed by id for related_evidence_id lookups
+            
+        Returns:
+            Array of confidence scores aligned with relationships
+        """
+        count = len(relationships)
+        method_idx = np.empty(count, dtype=np.int8)
+        type_idx = np.empty(count, dtype=np.int8)
+        primary_times = np.empty(count, dtype=np.int64)
+        related_times = np.empty(count, dtype=np.int64)
+        same_author = np.empty(count, dtype=bool)
+        content_bonus = np.empty(count, dtype=np.float64)
         
-        # Calculate content similarity bonus (if available)
-        content_bonus = self._calculate_content_bonus(relationship, primary_item, related_item)
+        # Items usually appear in several relationships; convert each date once
+        epoch_times: Dict[str, int] = {}
         
-        # Calculate relationship type bonus
-        relationship_bonus = self._calculate_relationship_bonus(relationship.relationship_type)
+        for i, relationship in enumerate(relationships):
+            primary_item = primary_items_by_id[relationship.primary_evidence_id]
+            related_item = related_items_by_id[relationship.related_evidence_id]
+            
+            method_idx[i] = self._method_index[relationship.detection_method]
+            type_idx[i] = self._type_index[relationship.relationship_type]
+            primary_times[i] = self._epoch_time(primary_item, epoch_times)
+            related_times[i] = self._epoch_time(related_item, epoch_times)
+            
+            primary_author = self._extract_author(primary_item)
+            same_author[i] = bool(primary_author) and primary_author == self._extract_author(related_item)
+            
+            content_bonus[i] = self._calculate_content_bonus(relationship, primary_item, related_item)
         
-        # Combine all factors
-        total_confidence = base_confidence + temporal_bonus + author_bonus + content_bonus + relationship_bonus
+        # Start with base confidence from detection method
+        base_confidence = self._method_lut[method_idx]
         
-        # Ensure score is between 0.0 and 1.0
-        final_confidence = max(0.0, min(1.0, total_confidence))
+        # Temporal proximity bonus: linear decay over max_temporal_bonus_days.
+        # Floor division matches timedelta.days for the whole-day difference
+        time_diff_days = np.abs((primary_times - related_times) // MICROSECONDS_PER_DAY)
+        temporal_bonus = 0.1 * np.maximum(0.0, 1 - time_diff_days / self.max_temporal_bonus_days)
         
-        logger.debug(f"Confidence scoring: base={base_confidence:.2f}, "
-                    f"temporal={temporal_bonus:.2f}, author={author_bonus:.2f}, "
-                    f"content={content_bonus:.2f}, relationship={relationship_bonus:.2f}, "
-                    f"final={final_confidence:.2f}")
+        # Author correlation bonus
+        author_bonus = 0.1 * same_author
         
-        return final_confidence
-    
-    def _calculate_temporal_bonus(self, primary_item: UnifiedEvidenceItem,
-                                related_item: UnifiedEvidenceItem) -> float:
-        """Calculate bonus based on temporal proximity"""
-        time_diff = abs((primary_item.evidence_date - related_item.evidence_date).days)
-        
-        if time_diff == 0:
-            return 0.1  # Same day bonus
-        elif time_diff <= self.max_temporal_bonus_days:
-            # Linear decay over max_temporal_bonus_days
-            return 0.1 * (1 - time_diff / self.max_temporal_bonus_days)
-        else:
-            return 0.0  # No bonus for distant dates
-    
-    def _calculate_author_bonus(self, primary_item: UnifiedEvidenceItem,
-                              related_item: UnifiedEvidenceItem) -> float:
-        """Calculate bonus for same author"""
-        # Extract author information from metadata
-        primary_author = self._extract_author(primary_item)
-        related_author = self._extract_author(related_item)
+        # Relationship type bonus
+        relationship_bonus = self._type_lut[type_idx]
         
-        if primary_author and related_author and primary_author == related_author:
-            return 0.1  # Same author bonus
+        # Combine all factors and ensure scores are between 0.0 and 1.0
+        total_confidence = base_confidence + temporal_bonus + author_bonus + content_bonus + relationship_bonus
+        final_confidence = np.clip(total_confidence, 0.0, 1.0)
         
-        return 0.0
+        logger.debug(f"Scored {count} relationships in batch")
+        
+        return final_confidence
+    
+    def _epoch_time(self, item: UnifiedEvidenceItem, cache: Dict[str, int]) -> int:
+        """Get an item's evidence date in epoch microseconds, memoized per item"""
+        epoch_time = cache.get(item.id)
+        if epoch_time is None:
+            epoch_time = cache[item.id] = to_epoch_microseconds(item.evidence_date)
+        return epoch_time
     
     def _extract_author(self, item: UnifiedEvidenceItem) -> Optional[str]:
         """Extract author information from evidence item"""
@@ -149,23 +204,9 @@ class ConfidenceScorer:
         
         return 0.0
     
-    def _calculate_relationship_bonus(self, relationship_type: RelationshipType) -> float:
-        """Calculate bonus based on relationship type strength"""
-        # Some relationship types are stronger indicators than others
-        type_bonuses = {
-            RelationshipType.SOLVES: 0.1,      # Strong relationship
-            RelationshipType.REFERENCES: 0.05,  # Medium relationship
-            RelationshipType.RELATED_TO: 0.0,   # Neutral
-            RelationshipType.DUPLICATE: 0.1,    # Strong relationship
-            RelationshipType.SEQUENTIAL: 0.05,  # Medium relationship
-            RelationshipType.CAUSAL: 0.1        # Strong relationship
-        }
-        
-        return type_bonuses.get(relationship_type, 0.0)
-    
-    async def validate_relationship_logic(self, relationship: EvidenceRelationship,
-                                        primary_item: UnifiedEvidenceItem,
-                                        related_item: UnifiedEvidenceItem) -> bool:
+    def validate_relationship_logic(self, relationship: EvidenceRelationship,
+                                  primary_item: UnifiedEvidenceItem,
+                                  related_item: UnifiedEvidenceItem) -> bool:
         """
         Validate that relationship makes logical sense
         
@@ -177,27 +218,50 @@ class ConfidenceScorer:
         Returns:
             True if relationship is logically valid
         """
-        # Check for obvious logical inconsistencies
+        valid = self.validate_batch(
+            [relationship],
+            {relationship.primary_evidence_id: primary_item},
+            {relationship.related_evidence_id: related_item}
+        )
+        return bool(valid[0])
+    
+    def validate_batch(self, relationships: List[EvidenceRelationship],
+                       primary_items_by_id: Dict[str, UnifiedEvidenceItem],
+                       related_items_by_id: Dict[str, UnifiedEvidenceItem]) -> np.ndarray:
+        """
+        Validate a batch of relationships in one vectorized pass
+        
+        Args:
+            relationships: Relationships to validate
+            primary_items_by_id: Evidence items keyed by id for primary_evidence_id lookups
+            related_items_by_id: Evidence items keyed by id for related_evidence_id lookups
+            
+        Returns:
+            Boolean mask aligned with relationships, True where logically valid
+        """
+        count = len(relationships)
+        confidence = np.empty(count, dtype=np.float64)
+        self_reference = np.empty(count, dtype=bool)
+        same_platform = np.empty(count, dtype=bool)
+        is_duplicate = np.empty(count, dtype=bool)
+        
+        for i, relationship in enumerate(relationships):
+            primary_item = primary_items_by_id[relationship.primary_evidence_id]
+            related_item = related_items_by_id[relationship.related_evidence_id]
+            
+            confidence[i] = relationship.confidence_score
+            self_reference[i] = primary_item.id == related_item.id
+            same_platform[i] = primary_item.platform == related_item.platform
+            is_duplicate[i] = relationship.relationship_type == RelationshipType.DUPLICATE
         
         # 1. Items shouldn't relate to themselves
-        if primary_item.id == related_item.id:
-            return False
-        
-        # 2. Check temporal logic for certain relationship types
-        if relationship.relationship_type == RelationshipType.SOLVES:
-            # GitLab work should generally come after JIRA ticket creation
-            # (though this isn't always true, so we're lenient)
-            pass
-        
-        # 3. Check platform logic
-        # Cross-platform relationships are expected, same-platform might be duplicates
-        if primary_item.platform == related_item.platform:
-            # Same platform relationships should have high confidence or be duplicates
-            if relationship.confidence_score < 0.7 and relationship.relationship_type != RelationshipType.DUPLICATE:
-                return False
-        
-        # 4. Check confidence threshold
-        if relationship.confidence_score < 0.1:  # Very low confidence
-            return False
-        
-        return True 
\ No newline at end of file
+        # 2. Very low confidence relationships are dropped
+        # 3. Cross-platform relationships are expected; same-platform ones
+        #    should have high confidence or be duplicates
+        # (SOLVES ordering is deliberately not enforced: GitLab work usually
+        # follows the JIRA ticket, but not always)
+        return (
+            ~self_reference
+            & (confidence >= 0.1)
+            & (~same_platform | (confidence >= 0.7) | is_duplicate)
+        )
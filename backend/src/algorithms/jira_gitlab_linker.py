@@ -11,9 +11,18 @@ This algorithm implements multiple strategies to detect relationships:
 
 import re
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Pattern, FrozenSet
 from datetime import datetime, timedelta
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator for large JIRA key sets
+    ahocorasick = None
+
 from src.models.correlation_models import (
     EvidenceRelationship,
     RelationshipType,
@@ -23,6 +32,90 @@ from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType
 
 logger = logging.getLogger(__name__)
 
+# Common words ignored by keyword extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should'
+})
+
+# Common JIRA key patterns (PROJECT-123, PROJ-456, etc.)
+_JIRA_KEY_RE = re.compile(r'\b([A-Z]{2,10}-\d+)\b')
+
+# Key sets at least this large are matched with an Aho-Corasick automaton
+# (when pyahocorasick is installed) instead of a regex alternation
+_AUTOMATON_MIN_KEYS = 200
+
+# Keyword tokenizer; only words longer than three characters can be
+# keywords, so the regex engine drops shorter ones
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+
+@lru_cache(maxsize=10_000)
+def _key_for(title: str, description: str, metadata_key: Optional[str]) -> Optional[str]:
+    """Resolve the JIRA key of a ticket from its title, metadata key or description"""
+    # Try to find JIRA key in title first
+    title_match = _JIRA_KEY_RE.search(title)
+    if title_match:
+        return title_match.group(1)
+    
+    # Try metadata if available
+    if metadata_key is not None:
+        return metadata_key
+    
+    # Try description as last resort
+    desc_match = _JIRA_KEY_RE.search(description)
+    if desc_match:
+        return desc_match.group(1)
+    
+    return None
+
+
+@lru_cache(maxsize=32)
+def _compile_key_alternation(jira_keys: FrozenSet[str]) -> Pattern[str]:
+    """Compile a single alternation pattern matching any of the known JIRA keys"""
+    # Longest keys first so a key never shadows a longer key sharing its prefix
+    alternation = '|'.join(re.escape(key) for key in sorted(jira_keys, key=len, reverse=True))
+    return re.compile(r'\b(' + alternation + r')\b')
+
+
+@lru_cache(maxsize=32)
+def _build_key_automaton(jira_keys: FrozenSet[str]) -> Any:
+    """Build an Aho-Corasick automaton finding all known JIRA keys in one pass"""
+    automaton = ahocorasick.Automaton()
+    for key in jira_keys:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+def _compile_key_matcher(jira_keys: FrozenSet[str]) -> Any:
+    """Pick the matcher for a key set: an automaton for large sets, else a regex"""
+    if ahocorasick is not None and len(jira_keys) >= _AUTOMATON_MIN_KEYS:
+        return _build_key_automaton(jira_keys)
+    return _compile_key_alternation(jira_keys)
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character (\\w)"""
+    return char.isalnum() or char == '_'
+
+
+def _automaton_keys(automaton: Any, text: str) -> List[str]:
+    """Keys found by an automaton, in text order, honouring word boundaries like \\b"""
+    found = []
+    last_index = len(text) - 1
+    for end, key in automaton.iter(text):
+        start = end - len(key) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last_index and _is_word_char(text[end + 1]):
+            continue
+        found.append((start, key))
+    found.sort()
+    return [key for _, key in found]
+
+
 class JiraGitLabLinker:
     """
     Detect relationships between GitLab and JIRA evidence items
@@ -34,28 +127,34 @@ class JiraGitLabLinker:
     - Temporal proximity (low confidence)
     """
     
+    __slots__ = (
+        'jira_key_pattern',
+        'branch_pattern',
+        'solve_keywords',
+        'reference_keywords',
+        'solve_re',
+        'ref_re'
+    )
+    
     def __init__(self):
         """Initialize the JIRA-GitLab linker"""
         # Common JIRA key patterns (PROJECT-123, PROJ-456, etc.)
-        self.jira_key_pattern = re.compile(r'\b([A-Z]{2,10}-\d+)\b')
+        self.jira_key_pattern = _JIRA_KEY_RE
         
-        # Branch name patterns that might contain JIRA keys
-        self.branch_patterns = [
-            re.compile(r'feature/([A-Z]{2,10}-\d+)'),
-            re.compile(r'bugfix/([A-Z]{2,10}-\d+)'),
-            re.compile(r'hotfix/([A-Z]{2,10}-\d+)'),
-            re.compile(r'([A-Z]{2,10}-\d+)[-_]'),
-            re.compile(r'([A-Z]{2,10}-\d+)$')
-        ]
+        # Branch name pattern that might contain JIRA keys: an optional
+        # feature/bugfix/hotfix prefix, the key, then a -/_ suffix or the end
+        self.branch_pattern = re.compile(r'(?:feature/|bugfix/|hotfix/)?([A-Z]{2,10}-\d+)(?:[-_].*)?$')
         
         # Keywords that indicate relationship types
         self.solve_keywords = ['fix', 'fixes', 'fixed', 'resolve', 'resolves', 'resolved', 'close', 'closes', 'closed']
         self.reference_keywords = ['ref', 'refs', 'reference', 'references', 'related', 'see', 'regarding']
+        self.solve_re = re.compile(r'\b(?:' + '|'.join(self.solve_keywords) + r')\b')
+        self.ref_re = re.compile(r'\b(?:' + '|'.join(self.reference_keywords) + r')\b')
         
         logger.info("JIRA-GitLab Linker initialized")
     
-    async def detect_relationships(self, gitlab_items: List[UnifiedEvidenceItem],
-                                 jira_items: List[UnifiedEvidenceItem]) -> List[EvidenceRelationship]:
+    def detect_relationships(self, gitlab_items: List[UnifiedEvidenceItem],
+                           jira_items: List[UnifiedEvidenceItem]) -> List[EvidenceRelationship]:
         """
         Main method to detect relationships between GitLab and JIRA items
         
@@ -73,25 +172,44 @@ class JiraGitLabLinker:
         # Create JIRA key lookup for efficient matching
         jira_key_map = self._create_jira_key_map(jira_items)
         
+        # One matcher over the known keys, reused for every GitLab item
+        key_matcher = _compile_key_matcher(frozenset(jira_key_map)) if jira_key_map else None
+        
+        # GitLab items without direct references, scored for content similarity in one batch
+        unmatched_gitlab_items = []
+        
         for gitlab_item in gitlab_items:
             # Strategy 1: Issue key detection
-            issue_key_relationships = await self._detect_issue_key_references(
-                gitlab_item, jira_items, jira_key_map
+            issue_key_relationships = self._detect_issue_key_references(
+                gitlab_item, jira_items, jira_key_map, key_matcher
             )
             relationships.extend(issue_key_relationships)
             
             # Strategy 2: Branch name pattern matching
-            branch_relationships = await self._detect_branch_name_patterns(
+            branch_relationships = self._detect_branch_name_patterns(
                 gitlab_item, jira_items, jira_key_map
             )
             relationships.extend(branch_relationships)
             
             # Strategy 3: Content similarity (if no direct references found)
             if not issue_key_relationships and not branch_relationships:
-                content_relationships = await self._detect_content_similarity(
-                    gitlab_item, jira_items
-                )
-                relationships.extend(content_relationships)
+                unmatched_gitlab_items.append(gitlab_item)
+        
+        if unmatched_gitlab_items and jira_items:
+            # Extract keywords once per item; the similarity pass only looks them up
+            gitlab_keywords = {
+                item.id: self._extract_keywords(item.title + " " + item.description)
+                for item in unmatched_gitlab_items
+            }
+            jira_keywords = {
+                item.id: self._extract_keywords(item.title + " " + item.description)
+                for item in jira_items
+            }
+            
+            content_relationships = self._detect_content_similarity(
+                unmatched_gitlab_items, jira_items, gitlab_keywords, jira_keywords
+            )
+            relationships.extend(content_relationships)
         
         # Remove duplicates
         unique_relationships = self._deduplicate_relationships(relationships)
@@ -103,9 +221,28 @@ class JiraGitLabLinker:
         """Create a map of JIRA keys to items for efficient lookup"""
         jira_map = {}
         
-        for item in jira_items:
-            # Extract JIRA key from title or metadata
-            jira_key = self._extract_jira_key_from_item(item)
+        if not jira_items:
+            return jira_map
+        
+        # Scan every title in one regex pass; the unit separator can never be
+        # part of a key, so no match crosses from one title into the next
+        titles = [item.title for item in jira_items]
+        joined_titles = "\x1f".join(titles)
+        title_starts = np.zeros(len(titles), dtype=np.int64)
+        title_starts[1:] = np.cumsum([len(title) + 1 for title in titles[:-1]])
+        
+        title_keys: List[Optional[str]] = [None] * len(jira_items)
+        matches = list(self.jira_key_pattern.finditer(joined_titles))
+        if matches:
+            owners = np.searchsorted(title_starts, [match.start() for match in matches], side='right') - 1
+            for match, owner in zip(matches, owners.tolist()):
+                # First key in a title wins, as with a per-title search
+                if title_keys[owner] is None:
+                    title_keys[owner] = match.group(1)
+        
+        for item, title_key in zip(jira_items, title_keys):
+            # Items without a key in their title fall back to metadata/description
+            jira_key = title_key or self._extract_jira_key_from_item(item)
             if jira_key:
                 jira_map[jira_key] = item
         
@@ -113,25 +250,20 @@ class JiraGitLabLinker:
     
     def _extract_jira_key_from_item(self, jira_item: UnifiedEvidenceItem) -> Optional[str]:
         """Extract JIRA key from a JIRA item"""
-        # Try to find JIRA key in title first
-        title_match = self.jira_key_pattern.search(jira_item.title)
-        if title_match:
-            return title_match.group(1)
-        
-        # Try metadata if available
-        if 'key' in jira_item.metadata:
-            return jira_item.metadata['key']
-        
-        # Try description as last resort
-        desc_match = self.jira_key_pattern.search(jira_item.description)
-        if desc_match:
-            return desc_match.group(1)
-        
-        return None
+        # Memoized on the fields that determine the key, so repeated lookups
+        # for the same ticket across calls skip the regex work; only string
+        # metadata keys are hashable cache arguments
+        metadata_key = jira_item.metadata.get('key')
+        return _key_for(
+            jira_item.title,
+            jira_item.description,
+            metadata_key if isinstance(metadata_key, str) else None
+        )
     
-    async def _detect_issue_key_references(self, gitlab_item: UnifiedEvidenceItem,
-                                         jira_items: List[UnifiedEvidenceItem],
-                                         jira_key_map: Dict[str, UnifiedEvidenceItem]) -> List[EvidenceRelationship]:
+    def _detect_issue_key_references(self, gitlab_item: UnifiedEvidenceItem,
+                                   jira_items: List[UnifiedEvidenceItem],
+                                   jira_key_map: Dict[str, UnifiedEvidenceItem],
+                                   key_matcher: Optional[Any] = None) -> List[EvidenceRelationship]:
         """
         Find JIRA issue keys in GitLab commits/MRs
         
@@ -142,76 +274,79 @@ class JiraGitLabLinker:
         """
         relationships = []
         
-        # Search in title
-        title_keys = self.jira_key_pattern.findall(gitlab_item.title)
+        if not jira_key_map:
+            return relationships
         
-        # Search in description
-        description_keys = self.jira_key_pattern.findall(gitlab_item.description)
+        if key_matcher is None:
+            key_matcher = _compile_key_matcher(frozenset(jira_key_map))
         
-        # Search in metadata (branch names, etc.)
-        metadata_keys = []
+        # Search title, description and metadata (branch names) with a single
+        # scan each, recording every field a key was found in
+        matches = self._scan(key_matcher, gitlab_item.title, "title")
+        matches += self._scan(key_matcher, gitlab_item.description, "description")
         if 'branch_name' in gitlab_item.metadata:
-            metadata_keys.extend(self.jira_key_pattern.findall(gitlab_item.metadata['branch_name']))
+            matches += self._scan(key_matcher, gitlab_item.metadata['branch_name'], "branch_name")
         
-        # Combine all found keys
-        all_keys = set(title_keys + description_keys + metadata_keys)
+        locations_by_key: Dict[str, List[str]] = {}
+        for jira_key, field in matches:
+            locations = locations_by_key.setdefault(jira_key, [])
+            if field not in locations:
+                locations.append(field)
         
-        for jira_key in all_keys:
-            if jira_key in jira_key_map:
-                jira_item = jira_key_map[jira_key]
-                
-                # Determine relationship type based on context
-                relationship_type = self._determine_relationship_type(gitlab_item, jira_key)
-                
-                relationship = EvidenceRelationship(
-                    primary_evidence_id=gitlab_item.id,
-                    related_evidence_id=jira_item.id,
-                    relationship_type=relationship_type,
-                    confidence_score=0.9,  # High confidence for direct key references
-                    detection_method=DetectionMethod.ISSUE_KEY,
-                    evidence_summary=f"GitLab item references JIRA key {jira_key}",
-                    metadata={
-                        "jira_key": jira_key,
-                        "found_in": self._get_reference_location(gitlab_item, jira_key)
-                    }
-                )
-                relationships.append(relationship)
+        if not locations_by_key:
+            return relationships
+        
+        # Lowercased once per item and shared by every key it references
+        content = f"{gitlab_item.title} {gitlab_item.description}".lower()
+        
+        for jira_key, locations in locations_by_key.items():
+            jira_item = jira_key_map[jira_key]
+            
+            # Determine relationship type based on context
+            relationship_type = self._determine_relationship_type(content, locations)
+            
+            relationship = EvidenceRelationship(
+                primary_evidence_id=gitlab_item.id,
+                related_evidence_id=jira_item.id,
+                relationship_type=relationship_type,
+                confidence_score=0.9,  # High confidence for direct key references
+                detection_method=DetectionMethod.ISSUE_KEY,
+                evidence_summary=f"GitLab item references JIRA key {jira_key}",
+                metadata={
+                    "jira_key": jira_key,
+                    "found_in": locations
+                }
+            )
+            relationships.append(relationship)
         
         return relationships
     
-    def _determine_relationship_type(self, gitlab_item: UnifiedEvidenceItem, jira_key: str) -> RelationshipType:
-        """Determine the type of relationship based on context"""
-        content = f"{gitlab_item.title} {gitlab_item.description}".lower()
+    def _determine_relationship_type(self, content: str, locations: List[str]) -> RelationshipType:
+        """Determine the type of relationship based on lowercased title/description content"""
+        # Keywords only describe the key when it appears in the title/description
+        if "title" not in locations and "description" not in locations:
+            return RelationshipType.RELATED_TO
         
         # Check for solve keywords
-        for keyword in self.solve_keywords:
-            if keyword in content and jira_key.lower() in content:
-                return RelationshipType.SOLVES
+        if self.solve_re.search(content):
+            return RelationshipType.SOLVES
         
         # Check for reference keywords
-        for keyword in self.reference_keywords:
-            if keyword in content and jira_key.lower() in content:
-                return RelationshipType.REFERENCES
+        if self.ref_re.search(content):
+            return RelationshipType.REFERENCES
         
         # Default to related
         return RelationshipType.RELATED_TO
     
-    def _get_reference_location(self, gitlab_item: UnifiedEvidenceItem, jira_key: str) -> List[str]:
-        """Get locations where JIRA key was found"""
-        locations = []
-        
-        if jira_key in gitlab_item.title:
-            locations.append("title")
-        if jira_key in gitlab_item.description:
-            locations.append("description")
-        if 'branch_name' in gitlab_item.metadata and jira_key in gitlab_item.metadata['branch_name']:
-            locations.append("branch_name")
-        
-        return locations
+    def _scan(self, key_matcher: Any, text: str, field: str) -> List[Tuple[str, str]]:
+        """Find JIRA keys in a text field, tagged with the field name"""
+        if isinstance(key_matcher, re.Pattern):
+            return [(match.group(1), field) for match in key_matcher.finditer(text)]
+        return [(key, field) for key in _automaton_keys(key_matcher, text)]
     
-    async def _detect_branch_name_patterns(self, gitlab_item: UnifiedEvidenceItem,
-                                         jira_items: List[UnifiedEvidenceItem],
-                                         jira_key_map: Dict[str, UnifiedEvidenceItem]) -> List[EvidenceRelationship]:
+    def _detect_branch_name_patterns(self, gitlab_item: UnifiedEvidenceItem,
+                                   jira_items: List[UnifiedEvidenceItem],
+                                   jira_key_map: Dict[str, UnifiedEvidenceItem]) -> List[EvidenceRelationship]:
         """
         Match GitLab branch names to JIRA tickets
         Patterns: feature/PROJ-123, bugfix/PROJ-456, PROJ-789-description
@@ -223,96 +358,110 @@ class JiraGitLabLinker:
         if not branch_name:
             return relationships
         
-        # Try each branch pattern
-        for pattern in self.branch_patterns:
-            matches = pattern.findall(branch_name)
-            for jira_key in matches:
-                if jira_key in jira_key_map:
-                    jira_item = jira_key_map[jira_key]
-                    
-                    relationship = EvidenceRelationship(
-                        primary_evidence_id=gitlab_item.id,
-                        related_evidence_id=jira_item.id,
-                        relationship_type=RelationshipType.RELATED_TO,
-                        confidence_score=0.7,  # High confidence for branch patterns
-                        detection_method=DetectionMethod.BRANCH_NAME,
-                        evidence_summary=f"Branch name '{branch_name}' contains JIRA key {jira_key}",
-                        metadata={
-                            "jira_key": jira_key,
-                            "branch_name": branch_name,
-                            "pattern_matched": pattern.pattern
-                        }
-                    )
-                    relationships.append(relationship)
+        # One structured match per branch; fall back to any key in the name
+        match = self.branch_pattern.search(branch_name)
+        if match:
+            jira_keys = [match.group(1)]
+            pattern_matched = self.branch_pattern.pattern
+        else:
+            jira_keys = self.jira_key_pattern.findall(branch_name)
+            pattern_matched = self.jira_key_pattern.pattern
+        
+        for jira_key in dict.fromkeys(jira_keys):
+            if jira_key in jira_key_map:
+                jira_item = jira_key_map[jira_key]
+                
+                relationship = EvidenceRelationship(
+                    primary_evidence_id=gitlab_item.id,
+                    related_evidence_id=jira_item.id,
+                    relationship_type=RelationshipType.RELATED_TO,
+                    confidence_score=0.7,  # High confidence for branch patterns
+                    detection_method=DetectionMethod.BRANCH_NAME,
+                    evidence_summary=f"Branch name '{branch_name}' contains JIRA key {jira_key}",
+                    metadata={
+                        "jira_key": jira_key,
+                        "branch_name": branch_name,
+                        "pattern_matched": pattern_matched
+                    }
+                )
+                relationships.append(relationship)
         
         return relationships
     
-    async def _detect_content_similarity(self, gitlab_item: UnifiedEvidenceItem,
-                                       jira_items: List[UnifiedEvidenceItem]) -> List[EvidenceRelationship]:
+    def _detect_content_similarity(self, gitlab_items: List[UnifiedEvidenceItem],
+                                 jira_items: List[UnifiedEvidenceItem],
+                                 gitlab_keywords_by_id: Dict[str, set],
+                                 jira_keywords_by_id: Dict[str, set]) -> List[EvidenceRelationship]:
         """
         Semantic similarity between GitLab descriptions and JIRA content
         Using simple keyword matching and basic similarity scoring
+        
+        An inverted keyword index limits each GitLab item to the JIRA items
+        sharing at least one keyword; the number of posting-list hits per
+        candidate is the size of the keyword intersection.
         """
         relationships = []
         
+        if not gitlab_items or not jira_items:
+            return relationships
+        
         # Simple keyword-based similarity for now
         # In a more advanced implementation, this could use NLP/embeddings
         
-        gitlab_keywords = self._extract_keywords(gitlab_item.title + " " + gitlab_item.description)
+        jira_keywords = [jira_keywords_by_id[item.id] for item in jira_items]
+        
+        inverted_index: Dict[str, List[int]] = {}
+        for position, keywords in enumerate(jira_keywords):
+            for keyword in keywords:
+                inverted_index.setdefault(keyword, []).append(position)
         
-        for jira_item in jira_items:
-            jira_keywords = self._extract_keywords(jira_item.title + " " + jira_item.description)
+        for gitlab_item in gitlab_items:
+            gitlab_keywords = gitlab_keywords_by_id[gitlab_item.id]
             
-            # Calculate simple similarity score
-            similarity_score = self._calculate_keyword_similarity(gitlab_keywords, jira_keywords)
+            shared_counts = Counter()
+            for keyword in gitlab_keywords:
+                postings = inverted_index.get(keyword)
+                if postings:
+                    shared_counts.update(postings)
             
-            # Only create relationship if similarity is above threshold
-            if similarity_score > 0.3:
-                relationship = EvidenceRelationship(
-                    primary_evidence_id=gitlab_item.id,
-                    related_evidence_id=jira_item.id,
-                    relationship_type=RelationshipType.RELATED_TO,
-                    confidence_score=similarity_score * 0.6,  # Scale down for content similarity
-                    detection_method=DetectionMethod.CONTENT_ANALYSIS,
-                    evidence_summary=f"Content similarity score: {similarity_score:.2f}",
-                    metadata={
-                        "similarity_score": similarity_score,
-                        "common_keywords": list(gitlab_keywords.intersection(jira_keywords))
-                    }
-                )
-                relationships.append(relationship)
+            for position in sorted(shared_counts):
+                jira_item = jira_items[position]
+                
+                # Jaccard similarity: |A & B| / (|A| + |B| - |A & B|)
+                intersection = shared_counts[position]
+                similarity_score = intersection / (len(gitlab_keywords) + len(jira_keywords[position]) - intersection)
+                
+                # Only create relationship if similarity is above threshold
+                if similarity_score > 0.3:
+                    relationship = EvidenceRelationship(
+                        primary_evidence_id=gitlab_item.id,
+                        related_evidence_id=jira_item.id,
+                        relationship_type=RelationshipType.RELATED_TO,
+                        confidence_score=similarity_score * 0.6,  # Scale down for content similarity
+                        detection_method=DetectionMethod.CONTENT_ANALYSIS,
+                        evidence_summary=f"Content similarity score: {similarity_score:.2f}",
+                        metadata={
+                            "similarity_score": similarity_score,
+                            "common_keywords": list(gitlab_keywords.intersection(jira_keywords[position]))
+                        }
+                    )
+                    relationships.append(relationship)
         
         return relationships
     
     def _extract_keywords(self, text: str) -> set:
         """Extract meaningful keywords from text"""
         # Simple keyword extraction - remove common words and short words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'}
-        
-        words = re.findall(r'\b\w+\b', text.lower())
-        keywords = {word for word in words if len(word) > 3 and word not in stop_words}
-        
-        return keywords
-    
-    def _calculate_keyword_similarity(self, keywords1: set, keywords2: set) -> float:
-        """Calculate similarity between two keyword sets"""
-        if not keywords1 or not keywords2:
-            return 0.0
-        
-        intersection = keywords1.intersection(keywords2)
-        union = keywords1.union(keywords2)
-        
-        # Jaccard similarity
-        return len(intersection) / len(union) if union else 0.0
+        return set(_WORD_RE.findall(text.lower())) - _STOP_WORDS
     
     def _deduplicate_relationships(self, relationships: List[EvidenceRelationship]) -> List[EvidenceRelationship]:
         """Remove duplicate relationships, keeping the highest confidence one"""
-        seen = {}
+        # Highest confidence first (stable, so ties keep detection order);
+        # the first relationship seen for a pair is then the one to keep
+        ranked = sorted(relationships, key=lambda rel: rel.confidence_score, reverse=True)
         
-        for rel in relationships:
-            key = (rel.primary_evidence_id, rel.related_evidence_id)
-            
-            if key not in seen or rel.confidence_score > seen[key].confidence_score:
-                seen[key] = rel
+        seen = {}
+        for rel in ranked:
+            seen.setdefault((rel.primary_evidence_id, rel.related_evidence_id), rel)
         
-        return list(seen.values()) 
\ No newline at end of file
+        return list(seen.values())
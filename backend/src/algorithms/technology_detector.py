@@ -9,16 +9,89 @@ This algorithm detects:
 4. Work complexity estimation
 """
 
+import os
 import re
+import sys
 import logging
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional, Tuple
+from datetime import datetime
 from collections import Counter
+from itertools import chain
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator for literal technology terms
+    ahocorasick = None
 
 from src.models.correlation_models import WorkStory, TechnologyInsight
 from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType
 
 logger = logging.getLogger(__name__)
 
+# Metadata fields that may carry file paths or labels
+_FILE_FIELDS = frozenset({'files_changed', 'file_paths', 'modified_files', 'added_files'})
+_LABEL_FIELDS = frozenset({'labels', 'tags', 'components', 'categories'})
+
+# Characters that make a technology pattern more than a plain literal
+_REGEX_METACHARS = frozenset('.^$*+?{}[]|()\\')
+_ESCAPED_LITERAL_RE = re.compile(r'\\([./@-])')
+
+
+def _literal_pattern(pattern: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Split a pattern into a literal keyword and its word-boundary anchors
+    
+    Args:
+        pattern: Technology regex such as r'\\breact\\b' or r'\\.vue'
+        
+    Returns:
+        (keyword, left_boundary, right_boundary), or None if the pattern
+        needs the regex engine
+    """
+    left = pattern.startswith(r'\b')
+    body = pattern[2:] if left else pattern
+    right = body.endswith(r'\b')
+    body = body[:-2] if right else body
+    
+    keyword = _ESCAPED_LITERAL_RE.sub(r'\1', body)
+    if not keyword or any(char in _REGEX_METACHARS for char in _ESCAPED_LITERAL_RE.sub('', body)):
+        return None
+    return keyword.lower(), left, right
+
+
+def _searchable_texts(items: List[UnifiedEvidenceItem]) -> Dict[str, str]:
+    """Lowercased title and description of each evidence item, built once per detector call"""
+    return {item.id: f"{item.title} {item.description}".lower() for item in items}
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character (\\w)"""
+    return char.isalnum() or char == '_'
+
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Whether a regex \\b would match just before text[index]"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _story_tech_summary(story: WorkStory) -> Tuple[List[str], List[str], Optional[datetime], Optional[datetime]]:
+    """Technology stack, evidence IDs and date range of one story"""
+    if not story.technology_stack:
+        return [], [], None, None
+    
+    story_first = story_last = None
+    for item in story.evidence_items:
+        date = item.evidence_date
+        if story_first is None or date < story_first:
+            story_first = date
+        if story_last is None or date > story_last:
+            story_last = date
+    
+    return list(story.technology_stack), [item.id for item in story.evidence_items], story_first, story_last
+
+
 class TechnologyDetector:
     """
     Identify technologies and skills from work evidence
@@ -69,6 +142,10 @@ class TechnologyDetector:
             '.dart': 'Dart'
         }
         
+        # Extension lookups are a single dict hit on the lowercased suffix
+        self._ext_map = {ext.lower(): sys.intern(tech) for ext, tech in self.file_extensions.items()}
+        self._dockerfile_lower = 'dockerfile'
+        
         # Framework and tool patterns
         self.technology_patterns = {
             # Web Frameworks
@@ -132,6 +209,41 @@ class TechnologyDetector:
             'Android': [r'\bandroid\b', r'\bkotlin\b']
         }
         
+        # Technology names are a fixed vocabulary: intern them so every set,
+        # Counter and lookup below shares one object per name
+        self.technology_patterns = {
+            sys.intern(tech): patterns for tech, patterns in self.technology_patterns.items()
+        }
+        self.technology_names = tuple(self.technology_patterns)
+        
+        # Compile every pattern once; the raw strings above stay for reference
+        self._compiled_patterns = {
+            tech: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for tech, patterns in self.technology_patterns.items()
+        }
+        
+        # With pyahocorasick, plain-literal patterns (most of them) go into one
+        # automaton and only the few real regexes are left for the engine
+        self._literal_automaton = None
+        self._residual_patterns = {}
+        if ahocorasick is not None:
+            self._literal_automaton = ahocorasick.Automaton()
+            for tech, patterns in self.technology_patterns.items():
+                for pattern in patterns:
+                    literal = _literal_pattern(pattern)
+                    if literal is None:
+                        self._residual_patterns.setdefault(tech, []).append(
+                            re.compile(pattern, re.IGNORECASE)
+                        )
+                        continue
+                    keyword, left, right = literal
+                    entry = self._literal_automaton.get(keyword, None)
+                    if entry is None:
+                        entry = (len(keyword), [])
+                        self._literal_automaton.add_word(keyword, entry)
+                    entry[1].append((tech, left, right))
+            self._literal_automaton.make_automaton()
+        
         # Complexity indicators
         self.complexity_indicators = {
             'high': ['microservice', 'distributed', 'scalable', 'architecture', 'performance', 'optimization'],
@@ -139,9 +251,20 @@ class TechnologyDetector:
             'low': ['bug', 'fix', 'update', 'minor', 'typo']
         }
         
+        # Reverse index keyword -> level, scanned in one pass; the lookahead
+        # keeps overlapping keywords from hiding each other, like `in` did
+        self._complexity_levels = {
+            keyword: level
+            for level, keywords in self.complexity_indicators.items()
+            for keyword in keywords
+        }
+        self._complexity_re = re.compile(
+            '(?=(' + '|'.join(map(re.escape, self._complexity_levels)) + '))'
+        )
+        
         logger.info("Technology Detector initialized")
     
-    async def detect_technologies(self, work_story: WorkStory) -> List[str]:
+    def detect_technologies(self, work_story: WorkStory) -> List[str]:
         """
         Detect technologies used in a work story
         
@@ -152,6 +275,7 @@ class TechnologyDetector:
             List of detected technologies
         """
         technologies = set()
+        texts = _searchable_texts(work_story.evidence_items)
         
         for item in work_story.evidence_items:
             # Detect from file extensions
@@ -159,7 +283,7 @@ class TechnologyDetector:
             technologies.update(file_techs)
             
             # Detect from content patterns
-            content_techs = self._detect_from_content(item)
+            content_techs = self._detect_from_content(item, texts[item.id])
             technologies.update(content_techs)
             
             # Detect from metadata
@@ -172,11 +296,10 @@ class TechnologyDetector:
         """Detect technologies from file extensions in metadata"""
         technologies = set()
         
-        # Check for file paths in metadata
-        file_fields = ['files_changed', 'file_paths', 'modified_files', 'added_files']
-        
-        for field in file_fields:
-            if field in item.metadata and item.metadata[field]:
+        # Check for file paths in metadata; the key intersection skips absent
+        # fields without a lookup each
+        for field in _FILE_FIELDS & item.metadata.keys():
+            if item.metadata[field]:
                 files = item.metadata[field]
                 if isinstance(files, str):
                     files = [files]
@@ -188,25 +311,55 @@ class TechnologyDetector:
                 for file_path in files:
                     if isinstance(file_path, str):
                         # Extract file extension
-                        for ext, tech in self.file_extensions.items():
-                            if file_path.lower().endswith(ext):
-                                technologies.add(tech)
+                        path_lower = file_path.lower()
+                        tech = self._ext_map.get(os.path.splitext(path_lower)[1])
+                        if tech:
+                            technologies.add(tech)
+                        elif os.path.basename(path_lower) == self._dockerfile_lower:
+                            technologies.add(self._ext_map['.dockerfile'])
         
         return technologies
     
-    def _detect_from_content(self, item: UnifiedEvidenceItem) -> Set[str]:
+    def _detect_from_content(self, item: UnifiedEvidenceItem, content: Optional[str] = None) -> Set[str]:
         """Detect technologies from content using pattern matching"""
+        # Combine title and description for analysis, unless the caller did
+        if content is None:
+            content = _searchable_texts([item])[item.id]
+        
+        return self._match_technologies(content)
+    
+    def _match_technologies(self, text: str) -> Set[str]:
+        """
+        Find every technology whose patterns match the text
+        
+        Args:
+            text: Lowercased text to scan
+            
+        Returns:
+            Set of matched technology names
+        """
+        if self._literal_automaton is None:
+            return {
+                tech for tech, compiled in self._compiled_patterns.items()
+                if any(cre.search(text) for cre in compiled)
+            }
+        
         technologies = set()
         
-        # Combine title and description for analysis
-        content = f"{item.title} {item.description}".lower()
+        for end, (length, entries) in self._literal_automaton.iter(text):
+            start = end - length + 1
+            for tech, left, right in entries:
+                if tech in technologies:
+                    continue
+                if left and not _at_word_boundary(text, start):
+                    continue
+                if right and not _at_word_boundary(text, end + 1):
+                    continue
+                technologies.add(tech)
         
-        # Check each technology pattern
-        for tech, patterns in self.technology_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    technologies.add(tech)
-                    break  # Found this tech, move to next
+        for tech, compiled in self._residual_patterns.items():
+            if tech not in technologies and any(cre.search(text) for cre in compiled):
+                technologies.add(tech)
         
         return technologies
     
@@ -215,10 +368,8 @@ class TechnologyDetector:
         technologies = set()
         
         # Check labels and tags
-        label_fields = ['labels', 'tags', 'components', 'categories']
-        
-        for field in label_fields:
-            if field in item.metadata and item.metadata[field]:
+        for field in _LABEL_FIELDS & item.metadata.keys():
+            if item.metadata[field]:
                 labels = item.metadata[field]
                 if isinstance(labels, str):
                     labels = [labels]
@@ -228,14 +379,11 @@ class TechnologyDetector:
                         label_lower = label.lower()
                         
                         # Check if label matches any technology
-                        for tech, patterns in self.technology_patterns.items():
-                            for pattern in patterns:
-                                if re.search(pattern, label_lower, re.IGNORECASE):
-                                    technologies.add(tech)
+                        technologies.update(self._match_technologies(label_lower))
         
         return technologies
     
-    async def calculate_complexity(self, work_story: WorkStory) -> float:
+    def calculate_complexity(self, work_story: WorkStory) -> float:
         """
         Calculate complexity score for a work story
         
@@ -278,17 +426,18 @@ class TechnologyDetector:
     def _analyze_content_complexity(self, work_story: WorkStory) -> float:
         """Analyze content for complexity indicators"""
         content_score = 0.0
-        all_content = ""
         
         # Combine all content
-        for item in work_story.evidence_items:
-            all_content += f" {item.title} {item.description}"
+        texts = _searchable_texts(work_story.evidence_items)
+        content_lower = "".join(f" {texts[item.id]}" for item in work_story.evidence_items)
         
-        content_lower = all_content.lower()
+        # Each distinct indicator counts once towards its level
+        found = {match.group(1) for match in self._complexity_re.finditer(content_lower)}
+        level_matches = Counter(self._complexity_levels[keyword] for keyword in found)
         
         # Check for complexity indicators
-        for complexity_level, keywords in self.complexity_indicators.items():
-            matches = sum(1 for keyword in keywords if keyword in content_lower)
+        for complexity_level in self.complexity_indicators:
+            matches = level_matches[complexity_level]
             
             if complexity_level == 'high':
                 content_score += matches * 0.05
@@ -299,42 +448,48 @@ class TechnologyDetector:
         
         return max(0.0, min(0.3, content_score))  # Cap at 0.3
     
-    async def generate_technology_insights(self, work_stories: List[WorkStory]) -> List[TechnologyInsight]:
+    def generate_technology_insights(self, work_stories: List[WorkStory]) -> List[TechnologyInsight]:
         """Generate technology usage insights across all work stories"""
         if not work_stories:
             return []
         
-        # Collect all technology usage
+        # Collect all technology usage, keeping only a running date range
+        # and ID set per technology instead of every date and ID seen
         tech_usage = Counter()
-        tech_evidence_map = {}
-        tech_dates = {}
+        tech_stats = {}
+        
+        # Stories are summarized independently and merged here in story order
+        story_summaries = [_story_tech_summary(story) for story in work_stories]
+        tech_usage.update(chain.from_iterable(summary[0] for summary in story_summaries))
         
-        for story in work_stories:
-            for tech in story.technology_stack:
-                tech_usage[tech] += 1
+        for technology_stack, story_ids, story_first, story_last in story_summaries:
+            for tech in technology_stack:
+                stats = tech_stats.get(tech)
+                if stats is None:
+                    stats = tech_stats[tech] = {'ids': set(), 'first': None, 'last': None}
                 
                 # Track evidence sources
-                if tech not in tech_evidence_map:
-                    tech_evidence_map[tech] = []
-                tech_evidence_map[tech].extend([item.id for item in story.evidence_items])
+                stats['ids'].update(story_ids)
                 
                 # Track dates
-                if tech not in tech_dates:
-                    tech_dates[tech] = []
-                tech_dates[tech].extend([item.evidence_date for item in story.evidence_items])
+                if story_first is not None:
+                    if stats['first'] is None or story_first < stats['first']:
+                        stats['first'] = story_first
+                    if stats['last'] is None or story_last > stats['last']:
+                        stats['last'] = story_last
         
         # Generate insights
         insights = []
         for tech, usage_count in tech_usage.most_common():
-            dates = tech_dates[tech]
+            stats = tech_stats[tech]
             
             insight = TechnologyInsight(
                 technology=tech,
                 usage_count=usage_count,
                 confidence_score=min(usage_count / 10.0, 1.0),  # Higher usage = higher confidence
-                evidence_sources=list(set(tech_evidence_map[tech])),  # Unique evidence IDs
-                first_seen=min(dates),
-                last_seen=max(dates)
+                evidence_sources=list(stats['ids']),  # Unique evidence IDs
+                first_seen=stats['first'],
+                last_seen=stats['last']
             )
             insights.append(insight)
         
@@ -355,8 +510,9 @@ class TechnologyDetector:
         tech_mentions = 0
         complex_work = False
         
+        texts = _searchable_texts(work_story.evidence_items)
         for item in work_story.evidence_items:
-            content = f"{item.title} {item.description}".lower()
+            content = texts[item.id]
             
             # Count mentions of this technology
             if technology.lower() in content:
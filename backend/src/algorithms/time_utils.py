@@ -0,0 +1,28 @@
+"""
+Time Utilities
+Phase 2.1 Implementation - Shared date arithmetic for the correlation algorithms
+"""
+
+from datetime import datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def to_epoch_microseconds(dt: datetime) -> int:
+    """
+    Convert a datetime to integer microseconds since the Unix epoch
+
+    Naive datetimes are measured from the naive epoch and aware ones from
+    the UTC epoch, so differences between values match datetime subtraction.
+
+    Args:
+        dt: Datetime to convert
+
+    Returns:
+        Microseconds since 1970-01-01
+    """
+    epoch = _EPOCH_UTC if dt.utcoffset() is not None else _EPOCH
+    return (dt - epoch) // timedelta(microseconds=1)
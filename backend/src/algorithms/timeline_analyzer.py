@@ -10,15 +10,102 @@ This algorithm analyzes:
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from operator import attrgetter
 
+import numpy as np
+
+from src.algorithms.time_utils import to_epoch_microseconds, MICROSECONDS_PER_DAY
 from src.models.correlation_models import WorkStory, WorkPattern
 from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType
 
 logger = logging.getLogger(__name__)
 
+# Day names indexed by datetime.weekday(), matching strftime('%A') in the C locale
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
+def _date_stats(dates: List[datetime]) -> Tuple[float, int, int]:
+    """
+    Summarize how activity spreads over calendar days
+    
+    Args:
+        dates: Non-empty list of activity timestamps
+        
+    Returns:
+        (average, max, min) number of activities per active day
+    """
+    ordinals = np.fromiter((date.toordinal() for date in dates), dtype=np.int64, count=len(dates))
+    daily_counts = np.bincount(ordinals - ordinals.min())
+    daily_counts = daily_counts[daily_counts > 0]
+    return float(daily_counts.mean()), int(daily_counts.max()), int(daily_counts.min())
+
+
+def _short_title(title: str, limit: int = 50) -> str:
+    """Title cut to `limit` characters plus an ellipsis; short titles are returned as-is"""
+    return title if len(title) <= limit else f"{title[:limit]}..."
+
+
+class _StoryTimeline(NamedTuple):
+    """Per-story inputs to the overall pattern analysis"""
+    gitlab_dates: List[datetime]
+    review_cycle_days: Optional[int]
+    resolution_days: Optional[int]
+
+
+def _partition(items: List[UnifiedEvidenceItem]) -> Tuple[List[UnifiedEvidenceItem],
+                                                        List[UnifiedEvidenceItem],
+                                                        List[UnifiedEvidenceItem]]:
+    """Split items into (gitlab, jira, other) lists in one pass"""
+    gitlab_items = []
+    jira_items = []
+    other_items = []
+    for item in items:
+        if item.platform == PlatformType.GITLAB:
+            gitlab_items.append(item)
+        elif item.platform == PlatformType.JIRA:
+            jira_items.append(item)
+        else:
+            other_items.append(item)
+    return gitlab_items, jira_items, other_items
+
+
+def _date_bounds(items: List[UnifiedEvidenceItem]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Earliest and latest evidence date of the items, or (None, None) if empty"""
+    first = last = None
+    for item in items:
+        date = item.evidence_date
+        if first is None or date < first:
+            first = date
+        if last is None or date > last:
+            last = date
+    return first, last
+
+
+def _story_timeline(story: WorkStory) -> _StoryTimeline:
+    """Summarize one story for analyze_overall_patterns"""
+    gitlab_items, jira_items, _ = _partition(story.evidence_items)
+    gitlab_dates = [item.evidence_date for item in gitlab_items]
+    
+    # Look for MR creation to merge patterns
+    mrs = [item for item in gitlab_items if 'merge_request' in item.source.lower()]
+    review_cycle_days = None
+    if len(mrs) >= 2:
+        # Calculate time between MR creation and merge
+        first_mr, last_mr = _date_bounds(mrs)
+        review_cycle_days = (last_mr - first_mr).days
+    
+    # Calculate time from first to last JIRA activity
+    resolution_days = None
+    if jira_items:
+        first_jira, last_jira = _date_bounds(jira_items)
+        resolution_days = (last_jira - first_jira).days
+    
+    return _StoryTimeline(gitlab_dates, review_cycle_days, resolution_days)
+
+
 class TimelineAnalyzer:
     """
     Analyze temporal patterns in work evidence
@@ -37,7 +124,7 @@ class TimelineAnalyzer:
         
         logger.info("Timeline Analyzer initialized")
     
-    async def analyze_work_story(self, work_story: WorkStory) -> Dict[str, Any]:
+    def analyze_work_story(self, work_story: WorkStory) -> Dict[str, Any]:
         """
         Analyze timeline patterns for a single work story
         
@@ -50,8 +137,15 @@ class TimelineAnalyzer:
         if not work_story.evidence_items:
             return {"timeline": {}, "patterns": {}}
         
+        # Sort once; the sequence helper and the platform partitions (which
+        # keep input order) all rely on date order
+        sorted_items = sorted(work_story.evidence_items, key=attrgetter('evidence_date'))
+        
+        # Split by platform once for the helpers that need it
+        gitlab_items, jira_items, _ = _partition(sorted_items)
+        
         # Analyze work sequence
-        work_sequence = self._analyze_work_sequence(work_story.evidence_items)
+        work_sequence = self._analyze_work_sequence(sorted_items)
         
         # Detect development patterns
         dev_patterns = self._detect_development_patterns(work_story.evidence_items)
@@ -60,7 +154,7 @@ class TimelineAnalyzer:
         velocity_metrics = self._calculate_work_velocity(work_story.evidence_items)
         
         # Analyze cross-platform timing
-        cross_platform_timing = self._analyze_cross_platform_timing(work_story.evidence_items)
+        cross_platform_timing = self._analyze_cross_platform_timing(gitlab_items, jira_items)
         
         return {
             "timeline": {
@@ -73,18 +167,15 @@ class TimelineAnalyzer:
             }
         }
     
-    def _analyze_work_sequence(self, items: List[UnifiedEvidenceItem]) -> Dict[str, Any]:
-        """Analyze the sequence of work activities"""
-        # Sort items by date
-        sorted_items = sorted(items, key=lambda x: x.evidence_date)
-        
+    def _analyze_work_sequence(self, sorted_items: List[UnifiedEvidenceItem]) -> Dict[str, Any]:
+        """Analyze the sequence of work activities (items must be sorted by date)"""
         sequence = []
         for item in sorted_items:
             sequence.append({
                 "date": item.evidence_date,
                 "platform": item.platform,
                 "type": item.source,
-                "title": item.title[:50] + "..." if len(item.title) > 50 else item.title
+                "title": _short_title(item.title)
             })
         
         # Detect typical patterns
@@ -133,25 +224,28 @@ class TimelineAnalyzer:
         """Detect development patterns from evidence"""
         patterns = {}
         
-        # Analyze activity by day of week
+        # One pass collects day and platform counts and the date range
         day_distribution = defaultdict(int)
+        platform_distribution = defaultdict(int)
+        min_date = max_date = None
         for item in items:
-            day_of_week = item.evidence_date.strftime('%A')
-            day_distribution[day_of_week] += 1
+            date = item.evidence_date
+            day_distribution[_DAY_NAMES[date.weekday()]] += 1
+            platform_distribution[item.platform] += 1
+            if min_date is None or date < min_date:
+                min_date = date
+            if max_date is None or date > max_date:
+                max_date = date
         
+        # Analyze activity by day of week
         patterns["day_distribution"] = dict(day_distribution)
         
         # Analyze activity by platform
-        platform_distribution = defaultdict(int)
-        for item in items:
-            platform_distribution[item.platform] += 1
-        
         patterns["platform_distribution"] = dict(platform_distribution)
         
         # Detect work intensity (activities per day)
         if items:
-            date_range = (max(item.evidence_date for item in items) - 
-                         min(item.evidence_date for item in items)).days + 1
+            date_range = (max_date - min_date).days + 1
             patterns["activities_per_day"] = len(items) / max(date_range, 1)
         
         return patterns
@@ -161,117 +255,103 @@ class TimelineAnalyzer:
         if not items:
             return {}
         
-        # Group items by week
-        weekly_activity = defaultdict(int)
-        for item in items:
-            week_start = item.evidence_date - timedelta(days=item.evidence_date.weekday())
-            week_key = week_start.strftime('%Y-W%U')
-            weekly_activity[week_key] += 1
+        # Group items by Monday-aligned calendar week: day ordinal 1 is a
+        # Monday, so (ordinal - 1) // 7 numbers the weeks
+        ordinals = np.fromiter((item.evidence_date.toordinal() for item in items),
+                               dtype=np.int64, count=len(items))
+        weeks = (ordinals - 1) // 7
+        weekly_counts = np.bincount(weeks - weeks.min())
+        weekly_counts = weekly_counts[weekly_counts > 0]  # Only weeks with activity
         
         # Calculate velocity metrics
-        weekly_counts = list(weekly_activity.values())
+        max_weekly = int(weekly_counts.max())
+        min_weekly = int(weekly_counts.min())
         
         return {
-            "avg_weekly_activity": sum(weekly_counts) / len(weekly_counts) if weekly_counts else 0,
-            "max_weekly_activity": max(weekly_counts) if weekly_counts else 0,
-            "min_weekly_activity": min(weekly_counts) if weekly_counts else 0,
-            "velocity_consistency": 1.0 - (max(weekly_counts) - min(weekly_counts)) / max(max(weekly_counts), 1) if weekly_counts else 0
+            "avg_weekly_activity": float(weekly_counts.mean()),
+            "max_weekly_activity": max_weekly,
+            "min_weekly_activity": min_weekly,
+            "velocity_consistency": 1.0 - (max_weekly - min_weekly) / max(max_weekly, 1)
         }
     
-    def _analyze_cross_platform_timing(self, items: List[UnifiedEvidenceItem]) -> Dict[str, Any]:
-        """Analyze timing relationships between platforms"""
-        gitlab_items = [item for item in items if item.platform == PlatformType.GITLAB]
-        jira_items = [item for item in items if item.platform == PlatformType.JIRA]
-        
+    def _analyze_cross_platform_timing(self, gitlab_items: List[UnifiedEvidenceItem],
+                                       jira_items: List[UnifiedEvidenceItem]) -> Dict[str, Any]:
+        """Analyze timing relationships between platforms (items must be sorted by date)"""
         if not gitlab_items or not jira_items:
             return {}
         
-        # Calculate time differences
-        first_jira = min(item.evidence_date for item in jira_items)
-        first_gitlab = min(item.evidence_date for item in gitlab_items)
-        last_jira = max(item.evidence_date for item in jira_items)
-        last_gitlab = max(item.evidence_date for item in gitlab_items)
+        first_jira, last_jira = jira_items[0].evidence_date, jira_items[-1].evidence_date
+        first_gitlab, last_gitlab = gitlab_items[0].evidence_date, gitlab_items[-1].evidence_date
         
+        # Calculate time differences
         return {
             "jira_to_gitlab_delay_days": (first_gitlab - first_jira).days,
             "development_duration_days": (last_gitlab - first_gitlab).days,
             "total_cycle_time_days": (max(last_jira, last_gitlab) - first_jira).days
         }
     
-    async def analyze_overall_patterns(self, work_stories: List[WorkStory]) -> List[WorkPattern]:
+    def analyze_overall_patterns(self, work_stories: List[WorkStory]) -> List[WorkPattern]:
         """Analyze patterns across all work stories"""
         patterns = []
         
         if not work_stories:
             return patterns
         
+        # Summarize each story once for all three pattern helpers
+        story_timelines = [_story_timeline(story) for story in work_stories]
+        
         # Analyze commit frequency pattern
-        commit_pattern = await self._analyze_commit_frequency(work_stories)
+        commit_pattern = self._analyze_commit_frequency(story_timelines)
         if commit_pattern:
             patterns.append(commit_pattern)
         
         # Analyze review cycle pattern
-        review_pattern = await self._analyze_review_cycles(work_stories)
+        review_pattern = self._analyze_review_cycles(story_timelines)
         if review_pattern:
             patterns.append(review_pattern)
         
         # Analyze ticket resolution pattern
-        resolution_pattern = await self._analyze_ticket_resolution(work_stories)
+        resolution_pattern = self._analyze_ticket_resolution(story_timelines)
         if resolution_pattern:
             patterns.append(resolution_pattern)
         
         return patterns
     
-    async def _analyze_commit_frequency(self, work_stories: List[WorkStory]) -> Optional[WorkPattern]:
+    def _analyze_commit_frequency(self, story_timelines: List[_StoryTimeline]) -> Optional[WorkPattern]:
         """Analyze commit frequency patterns"""
-        all_gitlab_items = []
-        for story in work_stories:
-            gitlab_items = [item for item in story.evidence_items if item.platform == PlatformType.GITLAB]
-            all_gitlab_items.extend(gitlab_items)
+        gitlab_dates = []
+        for timeline in story_timelines:
+            gitlab_dates.extend(timeline.gitlab_dates)
         
-        if not all_gitlab_items:
+        if not gitlab_dates:
             return None
         
         # Calculate commits per day
-        date_counts = defaultdict(int)
-        for item in all_gitlab_items:
-            date_key = item.evidence_date.date()
-            date_counts[date_key] += 1
-        
-        daily_commits = list(date_counts.values())
-        avg_commits_per_day = sum(daily_commits) / len(daily_commits) if daily_commits else 0
+        avg_commits_per_day, _, _ = _date_stats(gitlab_dates)
         
         return WorkPattern(
             pattern_type="commit_frequency",
             description=f"Average {avg_commits_per_day:.1f} commits per active day",
             frequency=avg_commits_per_day,
             confidence_score=0.8,
-            evidence_count=len(all_gitlab_items),
+            evidence_count=len(gitlab_dates),
             time_period={
-                "start": min(item.evidence_date for item in all_gitlab_items),
-                "end": max(item.evidence_date for item in all_gitlab_items)
+                "start": min(gitlab_dates),
+                "end": max(gitlab_dates)
             }
         )
     
-    async def _analyze_review_cycles(self, work_stories: List[WorkStory]) -> Optional[WorkPattern]:
+    def _analyze_review_cycles(self, story_timelines: List[_StoryTimeline]) -> Optional[WorkPattern]:
         """Analyze code review cycle patterns"""
-        review_cycles = []
-        
-        for story in work_stories:
-            # Look for MR creation to merge patterns
-            mrs = [item for item in story.evidence_items 
-                  if item.platform == PlatformType.GITLAB and 'merge_request' in item.source.lower()]
-            
-            if len(mrs) >= 2:
-                # Calculate time between MR creation and merge
-                mr_dates = [item.evidence_date for item in mrs]
-                cycle_time = (max(mr_dates) - min(mr_dates)).days
-                review_cycles.append(cycle_time)
+        review_cycles = [
+            timeline.review_cycle_days for timeline in story_timelines
+            if timeline.review_cycle_days is not None
+        ]
         
         if not review_cycles:
             return None
         
-        avg_cycle_time = sum(review_cycles) / len(review_cycles)
+        avg_cycle_time = float(np.mean(review_cycles))
         
         return WorkPattern(
             pattern_type="review_cycle",
@@ -285,23 +365,17 @@ class TimelineAnalyzer:
             }
         )
     
-    async def _analyze_ticket_resolution(self, work_stories: List[WorkStory]) -> Optional[WorkPattern]:
+    def _analyze_ticket_resolution(self, story_timelines: List[_StoryTimeline]) -> Optional[WorkPattern]:
         """Analyze ticket resolution patterns"""
-        resolution_times = []
-        
-        for story in work_stories:
-            jira_items = [item for item in story.evidence_items if item.platform == PlatformType.JIRA]
-            
-            if jira_items:
-                # Calculate time from first to last JIRA activity
-                jira_dates = [item.evidence_date for item in jira_items]
-                resolution_time = (max(jira_dates) - min(jira_dates)).days
-                resolution_times.append(resolution_time)
+        resolution_times = [
+            timeline.resolution_days for timeline in story_timelines
+            if timeline.resolution_days is not None
+        ]
         
         if not resolution_times:
             return None
         
-        avg_resolution_time = sum(resolution_times) / len(resolution_times)
+        avg_resolution_time = float(np.mean(resolution_times))
         
         return WorkPattern(
             pattern_type="ticket_resolution",
@@ -315,46 +389,43 @@ class TimelineAnalyzer:
             }
         )
     
-    async def detect_sprint_boundaries(self, evidence_items: List[UnifiedEvidenceItem]) -> List[Dict[str, Any]]:
+    def detect_sprint_boundaries(self, evidence_items: List[UnifiedEvidenceItem]) -> List[Dict[str, Any]]:
         """Auto-detect sprint/milestone boundaries from evidence clustering"""
         if not evidence_items:
             return []
         
         # Sort items by date
-        sorted_items = sorted(evidence_items, key=lambda x: x.evidence_date)
+        sorted_items = sorted(evidence_items, key=attrgetter('evidence_date'))
+        
+        # Day gaps between consecutive items, floored like timedelta.days
+        stamps = np.fromiter(
+            (to_epoch_microseconds(item.evidence_date) for item in sorted_items),
+            dtype=np.int64, count=len(sorted_items)
+        )
+        gap_days = np.diff(stamps) // MICROSECONDS_PER_DAY
+        
+        # Only an item after a significant gap (more than 3 days with no
+        # activity) can start a new sprint; the end of the list closes the last
+        boundaries = (np.flatnonzero(gap_days > 3) + 1).tolist()
+        boundaries.append(len(sorted_items))
         
-        # Group items into potential sprints based on activity gaps
+        # Group items into sprints as [start, boundary) index ranges; a run
+        # with fewer than 3 items is not closed and carries into the next
         sprints = []
-        current_sprint_items = []
+        start = 0
         
-        for i, item in enumerate(sorted_items):
-            if not current_sprint_items:
-                current_sprint_items.append(item)
+        for boundary in boundaries:
+            if boundary - start < 3:
                 continue
             
-            # Check if there's a significant gap (more than 3 days with no activity)
-            last_date = current_sprint_items[-1].evidence_date
-            gap_days = (item.evidence_date - last_date).days
-            
-            if gap_days > 3 and len(current_sprint_items) >= 3:
-                # End current sprint
-                sprints.append({
-                    "start_date": current_sprint_items[0].evidence_date,
-                    "end_date": current_sprint_items[-1].evidence_date,
-                    "item_count": len(current_sprint_items),
-                    "duration_days": (current_sprint_items[-1].evidence_date - current_sprint_items[0].evidence_date).days
-                })
-                current_sprint_items = [item]
-            else:
-                current_sprint_items.append(item)
-        
-        # Add final sprint if it has enough items
-        if len(current_sprint_items) >= 3:
+            start_date = sorted_items[start].evidence_date
+            end_date = sorted_items[boundary - 1].evidence_date
             sprints.append({
-                "start_date": current_sprint_items[0].evidence_date,
-                "end_date": current_sprint_items[-1].evidence_date,
-                "item_count": len(current_sprint_items),
-                "duration_days": (current_sprint_items[-1].evidence_date - current_sprint_items[0].evidence_date).days
+                "start_date": start_date,
+                "end_date": end_date,
+                "item_count": boundary - start,
+                "duration_days": (end_date - start_date).days
             })
+            start = boundary
         
-        return sprints 
\ No newline at end of file
+        return sprints
@@ -4,11 +4,17 @@ Evidence Collection API Endpoints
 FastAPI endpoints for collecting evidence from GitLab using MCP-first hybrid approach
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from collections import Counter, defaultdict
+import asyncio
+import hashlib
 import logging
 import os
+import time
+import orjson
 
 from ...services.gitlab_hybrid_client import GitLabHybridClient, create_gitlab_client, EvidenceItem
 
@@ -27,48 +33,178 @@ if not GITLAB_TOKEN:
 if not GITLAB_PROJECT_ID:
     logger.warning("GITLAB_PROJECT_ID not configured")
 
-@router.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "evidence_collection"}
+# MCP and project health barely change between probes, so repeated
+# liveness checks within this window reuse the last answer
+HEALTH_CACHE_TTL_SECONDS = 10.0
+_health_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+_health_locks: Dict[Tuple[str, ...], asyncio.Lock] = defaultdict(asyncio.Lock)
 
-@router.get("/gitlab/health")
-async def gitlab_health_check():
-    """Check GitLab MCP and API health"""
+async def _cached_probe(key: Tuple[str, ...], probe: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return a recent probe result, or run the probe once for all waiting callers
+    
+    Args:
+        key: Cache key identifying the probe
+        probe: Coroutine function performing the real check; results are only
+               cached when it returns (exceptions propagate and are retried)
+        
+    Returns:
+        The cached or freshly probed value
+    """
+    cached = _health_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    
+    async with _health_locks[key]:
+        # Another request may have refreshed it while we waited
+        cached = _health_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        value = await probe()
+        _health_cache[key] = (time.monotonic() + HEALTH_CACHE_TTL_SECONDS, value)
+        return value
+
+def invalidate_health_cache():
+    """Forget cached health probes so the next check hits GitLab again"""
+    _health_cache.clear()
+
+# Recently counted evidence IDs are remembered for this long, and at most
+# this many, so re-collecting the same items is not counted twice
+STATS_DEDUP_TTL_SECONDS = 3600.0
+_STATS_DEDUP_MAX_ENTRIES = 10000
+
+class EvidenceStatsCache:
+    """
+    Evidence collection counters maintained as evidence is collected
+    
+    Each evidence item is counted once by source, category and collection
+    method, so /stats is served from memory instead of aggregating stored
+    evidence on every request. Duplicates are detected against a bounded
+    LRU of recently counted IDs that expire after STATS_DEDUP_TTL_SECONDS.
+    """
+    
+    def __init__(self):
+        self._seen_ids: Dict[str, float] = {}
+        self.total = 0
+        self.sources = Counter({"gitlab_mr": 0, "gitlab_issue": 0, "jira_ticket": 0})
+        self.categories = Counter({"technical": 0, "collaboration": 0, "delivery": 0})
+        self.collection_methods = Counter({"mcp": 0, "api": 0})
+    
+    def record(self, items: List[EvidenceItem]):
+        """Count newly collected items; items seen recently are skipped"""
+        now = time.monotonic()
+        for item in items:
+            expires = self._seen_ids.pop(item.id, None)
+            # Reinserting moves the ID to the most recently seen end
+            self._seen_ids[item.id] = now + STATS_DEDUP_TTL_SECONDS
+            if expires is not None and expires > now:
+                continue
+            self.total += 1
+            self.sources[item.source] += 1
+            self.categories[item.category] += 1
+            self.collection_methods[item.data_source.value] += 1
+        
+        # Evict the least recently seen IDs beyond the bound
+        while len(self._seen_ids) > _STATS_DEDUP_MAX_ENTRIES:
+            del self._seen_ids[next(iter(self._seen_ids))]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters in the /stats response shape"""
+        return {
+            "total_evidence_items": self.total,
+            "sources": dict(self.sources),
+            "categories": dict(self.categories),
+            "collection_methods": dict(self.collection_methods)
+        }
+
+_evidence_stats = EvidenceStatsCache()
+
+def _short(text: str, limit: int = 50, suffix: str = "...") -> str:
+    """Truncate text to limit characters, marking the cut with suffix"""
+    return text if len(text) <= limit else text[:limit] + suffix
+
+def _etag_response(request: Request, payload: Dict[str, Any]) -> Response:
+    """
+    Answer with payload, or 304 when the client already has this version
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        payload: JSON-serializable response body
+        
+    Returns:
+        304 with no body if an If-None-Match tag matches, otherwise the
+        payload as JSON; both carry a weak ETag of the encoded payload
+    """
+    body = orjson.dumps(payload)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison: W/ prefixes are ignored when matching tags
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def get_gitlab_client(request: Request) -> GitLabHybridClient:
+    """
+    Get the app-wide GitLab hybrid client, creating it on first use
+    
+    One client per app keeps the API fallback's connection pool warm across
+    requests; the app closes it on shutdown.
+    """
     if not GITLAB_TOKEN:
         raise HTTPException(status_code=500, detail="GitLab token not configured")
     
     if not GITLAB_PROJECT_ID:
         raise HTTPException(status_code=500, detail="GitLab project ID not configured")
     
-    client = create_gitlab_client(GITLAB_TOKEN, GITLAB_PROJECT_ID, gitlab_url=GITLAB_URL)
-    
+    client = getattr(request.app.state, "gitlab_client", None)
+    if client is None:
+        client = create_gitlab_client(GITLAB_TOKEN, GITLAB_PROJECT_ID, gitlab_url=GITLAB_URL)
+        request.app.state.gitlab_client = client
+    return client
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "healthy", "service": "evidence_collection"}
+
+@router.get("/gitlab/health")
+async def gitlab_health_check(request: Request, client: GitLabHybridClient = Depends(get_gitlab_client)):
+    """Check GitLab MCP and API health, answering 304 if unchanged since the client's ETag"""
     try:
         # Check MCP health
-        mcp_healthy = await client.check_mcp_health()
+        mcp_healthy = await _cached_probe(("mcp_health",), client.check_mcp_health)
         
         # Check API health by getting project details
         api_healthy = False
         try:
-            project_details = await client.api_client.get_project_details(GITLAB_PROJECT_ID)
+            project_details = await _cached_probe(
+                ("project_details", GITLAB_PROJECT_ID),
+                lambda: client.api_client.get_project_details(GITLAB_PROJECT_ID)
+            )
             api_healthy = bool(project_details.get("id"))
         except Exception as e:
-            logger.error(f"API health check failed: {e}")
+            logger.error("API health check failed: %s", e)
         
-        return {
+        return _etag_response(request, {
             "mcp_healthy": mcp_healthy,
             "api_healthy": api_healthy,
             "project_id": GITLAB_PROJECT_ID,
             "gitlab_url": GITLAB_URL
-        }
+        })
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
-@router.get("/gitlab/collect/{username}")
+@router.get("/gitlab/collect/{username}", response_class=ORJSONResponse, response_model=None)
 async def collect_gitlab_evidence(
     username: str,
-    days_back: int = Query(7, ge=1, le=90, description="Number of days to look back")
+    days_back: int = Query(7, ge=1, le=90, description="Number of days to look back"),
+    client: GitLabHybridClient = Depends(get_gitlab_client)
 ):
     """
     Collect GitLab evidence for a specific user
@@ -77,24 +213,25 @@ async def collect_gitlab_evidence(
     1. Try GitLab MCP server first
     2. Fallback to direct API if MCP fails
     """
-    if not GITLAB_TOKEN:
-        raise HTTPException(status_code=500, detail="GitLab token not configured")
-    
-    if not GITLAB_PROJECT_ID:
-        raise HTTPException(status_code=500, detail="GitLab project ID not configured")
-    
-    logger.info(f"Collecting GitLab evidence for {username}, {days_back} days back")
+    logger.info("Collecting GitLab evidence for %s, %s days back", username, days_back)
     
     try:
-        # Create hybrid client
-        client = create_gitlab_client(GITLAB_TOKEN, GITLAB_PROJECT_ID, gitlab_url=GITLAB_URL)
-        
         # Collect comprehensive evidence
         evidence_items = await client.get_comprehensive_evidence(username, days_back)
+        _evidence_stats.record(evidence_items)
         
-        # Transform to API response format
+        # Transform to API response format, tallying the summary in the same pass
         evidence_response = []
+        merge_requests = issues = mcp_items = api_items = 0
+        fallback_used = False
         for item in evidence_items:
+            data_source = item.data_source.value
+            merge_requests += item.source == "gitlab_mr"
+            issues += item.source == "gitlab_issue"
+            mcp_items += data_source == "mcp"
+            api_items += data_source == "api"
+            fallback_used = fallback_used or item.fallback_used
+            
             evidence_response.append({
                 "id": item.id,
                 "team_member_id": item.team_member_id,
@@ -103,53 +240,49 @@ async def collect_gitlab_evidence(
                 "description": item.description,
                 "source_url": item.source_url,
                 "category": item.category,
-                "evidence_date": item.evidence_date.isoformat(),
-                "created_at": item.created_at.isoformat(),
+                "evidence_date": item.evidence_date,
+                "created_at": item.created_at,
                 "metadata": {
                     **item.metadata,
-                    "data_source": item.data_source.value,
+                    "data_source": data_source,
                     "fallback_used": item.fallback_used
                 }
             })
         
-        return {
+        # Returned as a response object so FastAPI skips jsonable_encoder and
+        # orjson serializes the datetimes directly
+        return ORJSONResponse({
             "username": username,
             "days_back": days_back,
             "evidence_count": len(evidence_response),
             "evidence": evidence_response,
             "collection_summary": {
                 "total_items": len(evidence_response),
-                "merge_requests": len([e for e in evidence_response if e["source"] == "gitlab_mr"]),
-                "issues": len([e for e in evidence_response if e["source"] == "gitlab_issue"]),
-                "mcp_items": len([e for e in evidence_response if e["metadata"]["data_source"] == "mcp"]),
-                "api_items": len([e for e in evidence_response if e["metadata"]["data_source"] == "api"]),
-                "fallback_used": any(e["metadata"]["fallback_used"] for e in evidence_response)
+                "merge_requests": merge_requests,
+                "issues": issues,
+                "mcp_items": mcp_items,
+                "api_items": api_items,
+                "fallback_used": bool(fallback_used)
             }
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Failed to collect evidence for {username}: {e}")
+        logger.error("Failed to collect evidence for %s: %s", username, e)
         raise HTTPException(status_code=500, detail=f"Evidence collection failed: {str(e)}")
 
-@router.get("/gitlab/merge-requests/{username}")
+@router.get("/gitlab/merge-requests/{username}", response_class=ORJSONResponse, response_model=None)
 async def get_gitlab_merge_requests(
     username: str,
-    days_back: int = Query(7, ge=1, le=90)
+    days_back: int = Query(7, ge=1, le=90),
+    client: GitLabHybridClient = Depends(get_gitlab_client)
 ):
     """Get GitLab merge requests for a specific user"""
-    if not GITLAB_TOKEN:
-        raise HTTPException(status_code=500, detail="GitLab token not configured")
-    
-    if not GITLAB_PROJECT_ID:
-        raise HTTPException(status_code=500, detail="GitLab project ID not configured")
-    
     try:
-        client = create_gitlab_client(GITLAB_TOKEN, GITLAB_PROJECT_ID, gitlab_url=GITLAB_URL)
         since_date = datetime.now() - timedelta(days=days_back)
         
         evidence_items = await client.get_merge_requests(username, since_date)
         
-        return {
+        return ORJSONResponse({
             "username": username,
             "merge_requests": [
                 {
@@ -158,7 +291,7 @@ async def get_gitlab_merge_requests(
                     "description": item.description,
                     "source_url": item.source_url,
                     "category": item.category,
-                    "evidence_date": item.evidence_date.isoformat(),
+                    "evidence_date": item.evidence_date,
                     "metadata": {
                         **item.metadata,
                         "data_source": item.data_source.value,
@@ -167,31 +300,25 @@ async def get_gitlab_merge_requests(
                 }
                 for item in evidence_items
             ]
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get merge requests for {username}: {e}")
+        logger.error("Failed to get merge requests for %s: %s", username, e)
         raise HTTPException(status_code=500, detail=f"Failed to get merge requests: {str(e)}")
 
-@router.get("/gitlab/issues/{username}")
+@router.get("/gitlab/issues/{username}", response_class=ORJSONResponse, response_model=None)
 async def get_gitlab_issues(
     username: str,
-    days_back: int = Query(7, ge=1, le=90)
+    days_back: int = Query(7, ge=1, le=90),
+    client: GitLabHybridClient = Depends(get_gitlab_client)
 ):
     """Get GitLab issues for a specific user"""
-    if not GITLAB_TOKEN:
-        raise HTTPException(status_code=500, detail="GitLab token not configured")
-    
-    if not GITLAB_PROJECT_ID:
-        raise HTTPException(status_code=500, detail="GitLab project ID not configured")
-    
     try:
-        client = create_gitlab_client(GITLAB_TOKEN, GITLAB_PROJECT_ID, gitlab_url=GITLAB_URL)
         since_date = datetime.now() - timedelta(days=days_back)
         
         evidence_items = await client.get_issues(username, since_date)
         
-        return {
+        return ORJSONResponse({
             "username": username,
             "issues": [
                 {
@@ -200,7 +327,7 @@ async def get_gitlab_issues(
                     "description": item.description,
                     "source_url": item.source_url,
                     "category": item.category,
-                    "evidence_date": item.evidence_date.isoformat(),
+                    "evidence_date": item.evidence_date,
                     "metadata": {
                         **item.metadata,
                         "data_source": item.data_source.value,
@@ -209,55 +336,31 @@ async def get_gitlab_issues(
                 }
                 for item in evidence_items
             ]
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get issues for {username}: {e}")
+        logger.error("Failed to get issues for %s: %s", username, e)
         raise HTTPException(status_code=500, detail=f"Failed to get issues: {str(e)}")
 
 @router.get("/stats")
-async def get_evidence_stats():
-    """Get evidence collection statistics"""
-    # This would typically query the database for stored evidence
-    # For now, return basic stats
-    return {
-        "total_evidence_items": 0,
-        "sources": {
-            "gitlab_mr": 0,
-            "gitlab_issue": 0,
-            "jira_ticket": 0
-        },
-        "categories": {
-            "technical": 0,
-            "collaboration": 0,
-            "delivery": 0
-        },
-        "collection_methods": {
-            "mcp": 0,
-            "api": 0
-        }
-    }
+async def get_evidence_stats(request: Request):
+    """Get evidence collection statistics, answering 304 if unchanged since the client's ETag"""
+    # Counters are kept up to date by the collection endpoint
+    return _etag_response(request, _evidence_stats.snapshot())
 
 @router.post("/test-collection")
 async def test_evidence_collection(
-    username: str = Query(..., description="GitLab username to test")
+    username: str = Query(..., description="GitLab username to test"),
+    client: GitLabHybridClient = Depends(get_gitlab_client)
 ):
     """
     Test evidence collection for development/debugging
     """
-    if not GITLAB_TOKEN:
-        raise HTTPException(status_code=500, detail="GitLab token not configured")
-    
-    if not GITLAB_PROJECT_ID:
-        raise HTTPException(status_code=500, detail="GitLab project ID not configured")
-    
-    logger.info(f"Testing evidence collection for {username}")
+    logger.info("Testing evidence collection for %s", username)
     
     try:
-        client = create_gitlab_client(GITLAB_TOKEN, GITLAB_PROJECT_ID, gitlab_url=GITLAB_URL)
-        
         # Test MCP health
-        mcp_healthy = await client.check_mcp_health()
+        mcp_healthy = await _cached_probe(("mcp_health",), client.check_mcp_health)
         
         # Test basic collection (last 1 day)
         evidence_items = await client.get_comprehensive_evidence(username, days_back=1)
@@ -271,7 +374,7 @@ async def test_evidence_collection(
             "evidence_summary": [
                 {
                     "source": item.source,
-                    "title": item.title[:50] + "..." if len(item.title) > 50 else item.title,
+                    "title": _short(item.title),
                     "category": item.category,
                     "data_source": item.data_source.value,
                     "fallback_used": item.fallback_used
@@ -281,7 +384,7 @@ async def test_evidence_collection(
         }
         
     except Exception as e:
-        logger.error(f"Test collection failed: {e}")
+        logger.error("Test collection failed: %s", e)
         return {
             "test_results": {
                 "mcp_healthy": False,
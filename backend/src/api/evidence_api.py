@@ -1,63 +1,133 @@
 from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime
+import asyncio
+import hashlib
 import logging
+from typing import Dict, Iterator, List
+import orjson
 from uuid import UUID
-from ..services.correlation_engine import create_correlation_engine
-from ..services.database_service import DatabaseService
-from ..models.correlation_models import CorrelationRequest, CorrelationResponse
+from pydantic import TypeAdapter
+from ..services.correlation_engine import CorrelationEngine, create_correlation_engine
+from ..services.database_service import DatabaseService, get_database_service
+from ..models.correlation_models import CorrelationRequest, CorrelationResponse, EvidenceRelationship
 from ..models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.post("/correlate", response_model=CorrelationResponse)
-async def correlate_evidence(request: CorrelationRequest, db: DatabaseService = Depends(DatabaseService)):
+# Dumps a whole relationship list in one pydantic-core call
+_relationships_adapter = TypeAdapter(List[EvidenceRelationship])
+
+# Correlation engines shared by all requests, keyed by LLM setting
+_engines: Dict[bool, CorrelationEngine] = {}
+
+def _engine(enable_llm: bool) -> CorrelationEngine:
     """
-    Correlate evidence using the full 7-step pipeline including LLM enhancement.
-    If no evidence items are provided, fetches them from the database.
+    Get the correlation engine shared by all requests, one per LLM setting
+    
+    Building an engine sets up every algorithm and, with LLM enabled, the
+    LLM clients, their connection pool and the cost tracker, so it is done
+    once rather than per request.
     """
-    try:
-        logger.info(f"Received correlation request for team member: {request.team_member_id}")
-        logger.info(f"Request parameters: confidence_threshold={request.confidence_threshold}, "
-                   f"max_work_stories={request.max_work_stories}, "
-                   f"include_low_confidence={request.include_low_confidence}")
-
-        # If no evidence items provided but team_member_id is, fetch evidence
-        if not request.evidence_items and request.team_member_id:
-            logger.info(f"No evidence items provided, fetching from database for team member {request.team_member_id}")
-            raw_items = await db.get_evidence_items(UUID(request.team_member_id))
-
-            def map_platform(src: str) -> PlatformType:
-                if src.startswith("gitlab_"):
-                    return PlatformType.GITLAB
-                if src.startswith("jira_"):
-                    return PlatformType.JIRA
-                return PlatformType.DOCUMENT
-
-            unified_items = []
-            for db_item in raw_items:
-                try:
-                    unified_items.append(UnifiedEvidenceItem(
-                        id=str(db_item.id),
-                        team_member_id=str(db_item.team_member_id),
-                        source=db_item.source,
-                        title=db_item.title,
-                        description=db_item.description,
-                        category=db_item.category,
-                        evidence_date=db_item.evidence_date,
-                        source_url=db_item.source_url,
-                        platform=map_platform(db_item.source),
-                        data_source=DataSourceType.API,
-                        author_name=getattr(db_item, "author_name", None),
-                        author_email=getattr(db_item, "author_email", None),
-                        metadata=db_item.metadata or {},
-                    ))
-                except Exception as map_err:
-                    logger.warning(f"Failed to map DB evidence {db_item.id}: {map_err}")
-
-            request.evidence_items = unified_items
-            logger.info(f"Fetched {len(unified_items)} evidence items from database")
+    engine = _engines.get(enable_llm)
+    if engine is None:
+        engine = create_correlation_engine(enable_llm=enable_llm)
+        _engines[enable_llm] = engine
+    return engine
+
+def close_engines():
+    """Close the shared correlation engines' HTTP connections (app shutdown)"""
+    for engine in _engines.values():
+        engine.close()
+    _engines.clear()
+
+# In-flight LLM correlations keyed by request hash, shared by identical concurrent calls
+_inflight: Dict[str, asyncio.Task] = {}
+
+def _request_key(request: CorrelationRequest) -> str:
+    """Hash a correlation request so identical payloads map to the same key"""
+    payload = orjson.dumps(request.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _settle_inflight(key: str, task: asyncio.Task):
+    """Forget a finished correlation once its task is done"""
+    _inflight.pop(key, None)
+    # Retrieve the outcome so a failure nobody is awaiting any more (every
+    # caller disconnected) is not logged as "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+async def _correlate_single_flight(request: CorrelationRequest, db: DatabaseService) -> CorrelationResponse:
+    """
+    Run the LLM correlation pipeline once per distinct in-flight request
+    
+    Concurrent calls with the same payload (e.g. a polling UI) await the
+    task started by the first one instead of repeating the database fetch
+    and LLM calls. The task is shielded so a caller that disconnects does
+    not cancel the work the others are waiting on.
+    """
+    key = _request_key(request)
+    task = _inflight.get(key)
+    if task is None:
+        async def run() -> CorrelationResponse:
+            await _load_evidence_from_db(request, db)
+            return await _engine(True).correlate_evidence(request)
+        
+        # No await between lookup and insert, so no lock is needed
+        task = asyncio.ensure_future(run())
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _settle_inflight(key, done))
+    else:
+        logger.info("Joining in-flight correlation for team member: %s", request.team_member_id)
+    
+    return await asyncio.shield(task)
+
+# Platform of a stored evidence source, keyed by the part before "_" (gitlab_mr -> gitlab)
+_PLATFORM_BY_PREFIX = {"gitlab": PlatformType.GITLAB, "jira": PlatformType.JIRA}
+
+def _as_datetime(value: date) -> datetime:
+    """Widen a stored evidence date to the datetime the correlation models use"""
+    return value if isinstance(value, datetime) else datetime(value.year, value.month, value.day)
+
+async def _load_evidence_from_db(request: CorrelationRequest, db: DatabaseService):
+    """Fill request.evidence_items from the database when the request has none"""
+    if not request.evidence_items and request.team_member_id:
+        logger.info("No evidence items provided, fetching from database for team member %s", request.team_member_id)
+        raw_items = await db.get_evidence_items(UUID(request.team_member_id))
+
+        # Rows were validated into EvidenceItem by the database service, so
+        # they are copied across without a second validation pass; only the
+        # checks and conversions UnifiedEvidenceItem's validators would apply
+        # are kept (stripped non-empty text, enum values instead of members)
+        unified_items = []
+        for db_item in raw_items:
+            title = db_item.title.strip()
+            description = db_item.description.strip()
+            if not title or not description:
+                logger.warning("Failed to map DB evidence %s: title and description must not be empty", db_item.id)
+                continue
+
+            unified_items.append(UnifiedEvidenceItem.model_construct(
+                id=str(db_item.id),
+                team_member_id=str(db_item.team_member_id),
+                source=db_item.source,
+                title=title,
+                description=description,
+                category=db_item.category,
+                evidence_date=_as_datetime(db_item.evidence_date),
+                source_url=db_item.source_url,
+                platform=_PLATFORM_BY_PREFIX.get(db_item.source.split("_", 1)[0], PlatformType.DOCUMENT).value,
+                data_source=DataSourceType.API.value,
+                author_name=db_item.author_name,
+                author_email=db_item.author_email,
+                metadata=db_item.metadata or {},
+            ))
+
+        request.evidence_items = unified_items
+        logger.info("Fetched %s evidence items from database", len(unified_items))
+        if logger.isEnabledFor(logging.DEBUG):
             for item in unified_items:
                 logger.debug(
                     "Evidence item: id=%s, source=%s, platform=%s, date=%s",
@@ -67,14 +137,30 @@ async def correlate_evidence(request: CorrelationRequest, db: DatabaseService =
                     item.evidence_date,
                 )
 
-        correlation_engine = create_correlation_engine(enable_llm=True)
-        logger.info("Created correlation engine with LLM enabled")
-        
-        response = await correlation_engine.correlate_evidence(request)
+@router.post("/correlate", response_model=CorrelationResponse)
+async def correlate_evidence(request: CorrelationRequest, db: DatabaseService = Depends(get_database_service)):
+    """
+    Correlate evidence using the full 7-step pipeline including LLM enhancement.
+    If no evidence items are provided, fetches them from the database.
+    """
+    try:
+        logger.info("Received correlation request for team member: %s", request.team_member_id)
+        logger.info(
+            "Request parameters: confidence_threshold=%s, max_work_stories=%s, include_low_confidence=%s",
+            request.confidence_threshold,
+            request.max_work_stories,
+            request.include_low_confidence,
+        )
+
+        # If no evidence items provided but team_member_id is, evidence is fetched first
+        response = await _correlate_single_flight(request, db)
         
         # Log response details
-        logger.info(f"Correlation completed: success={response.success}, "
-                   f"processing_time={response.processing_time_ms}ms")
+        logger.info(
+            "Correlation completed: success=%s, processing_time=%sms",
+            response.success,
+            response.processing_time_ms,
+        )
         
         if response.correlated_collection:
             logger.info(
@@ -84,24 +170,25 @@ async def correlate_evidence(request: CorrelationRequest, db: DatabaseService =
             )
 
             # Detailed work story logs only in debug mode
-            for story in response.correlated_collection.work_stories:
-                logger.debug(
-                    "Work story: id=%s, title=%s, confidence=%s",
-                    story.id,
-                    story.title,
-                    story.confidence_score,
-                )
+            if logger.isEnabledFor(logging.DEBUG):
+                for story in response.correlated_collection.work_stories:
+                    logger.debug(
+                        "Work story: id=%s, title=%s, confidence=%s",
+                        story.id,
+                        story.title,
+                        story.confidence_score,
+                    )
         else:
             logger.warning("No correlated collection in response")
             
         if response.errors:
-            logger.error(f"Correlation errors: {response.errors}")
+            logger.error("Correlation errors: %s", response.errors)
         if response.warnings:
-            logger.warning(f"Correlation warnings: {response.warnings}")
+            logger.warning("Correlation warnings: %s", response.warnings)
             
         return response
     except Exception as e:
-        logger.error(f"Evidence correlation failed: {str(e)}", exc_info=True)
+        logger.error("Evidence correlation failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Correlation failed: {str(e)}")
 
 @router.post("/correlate-basic", response_model=CorrelationResponse)
@@ -110,12 +197,60 @@ async def correlate_evidence_basic(request: CorrelationRequest):
     Correlate evidence using only rule-based algorithms (without LLM)
     """
     try:
-        correlation_engine = create_correlation_engine(enable_llm=False)
+        correlation_engine = _engine(False)
         response = await correlation_engine.correlate_evidence(request)
         return response
     except Exception as e:
-        logger.error(f"Basic evidence correlation failed: {str(e)}")
+        logger.error("Basic evidence correlation failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Correlation failed: {str(e)}")
+
+def _ndjson_lines(response: CorrelationResponse) -> Iterator[bytes]:
+    """
+    Encode a correlation response as NDJSON, one record per line
+    
+    The first line is the summary (the response without its collection),
+    followed by the collection metadata, then one line per evidence item,
+    work story and relationship, so no single JSON document for the whole
+    response is ever built.
+    """
+    yield orjson.dumps({
+        "type": "summary",
+        "data": response.model_dump(mode="json", exclude={"correlated_collection"})
+    }) + b"\n"
+    
+    collection = response.correlated_collection
+    if collection is None:
+        return
+    
+    yield orjson.dumps({
+        "type": "collection",
+        "data": collection.model_dump(
+            mode="json", exclude={"evidence_items", "work_stories", "relationships"}
+        )
+    }) + b"\n"
+    
+    for record_type, records in (("evidence_item", collection.evidence_items),
+                                 ("work_story", collection.work_stories),
+                                 ("relationship", collection.relationships)):
+        for record in records:
+            yield orjson.dumps({"type": record_type, "data": record.model_dump(mode="json")}) + b"\n"
+
+@router.post("/correlate-stream")
+async def correlate_evidence_stream(request: CorrelationRequest, db: DatabaseService = Depends(get_database_service)):
+    """
+    Correlate evidence like /correlate, streaming the result as NDJSON
+    
+    Each line is {"type": ..., "data": ...} with type summary, collection,
+    evidence_item, work_story or relationship. Lines are encoded as they
+    are sent, keeping the serialized response out of memory.
+    """
+    try:
+        response = await _correlate_single_flight(request, db)
+    except Exception as e:
+        logger.error("Streaming evidence correlation failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Correlation failed: {str(e)}")
+    
+    return StreamingResponse(_ndjson_lines(response), media_type="application/x-ndjson")
 
 @router.post("/correlate-llm-only")
 async def correlate_with_llm_only(request: CorrelationRequest):
@@ -124,19 +259,21 @@ async def correlate_with_llm_only(request: CorrelationRequest):
     Useful for testing LLM correlation in isolation
     """
     try:
-        from ..services.llm_correlation_service import create_llm_correlation_service
+        # Reuse the LLM-enabled engine's service so usage is tracked in one place
+        llm_service = _engine(True).llm_service
+        if llm_service is None:
+            raise RuntimeError("LLM service not available")
         
-        llm_service = create_llm_correlation_service()
         relationships = await llm_service.correlate_evidence_with_llm(request.evidence_items)
         
         return {
             "success": True,
-            "relationships": [relationship.dict() for relationship in relationships],
+            "relationships": _relationships_adapter.dump_python(relationships, mode="json"),
             "usage_report": llm_service.get_usage_report(),
             "message": f"LLM correlation found {len(relationships)} relationships"
         }
     except Exception as e:
-        logger.error(f"LLM-only correlation failed: {str(e)}")
+        logger.error("LLM-only correlation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"LLM correlation failed: {str(e)}")
 
 @router.get("/engine-status")
@@ -145,7 +282,7 @@ async def get_engine_status():
     Get correlation engine status and capabilities
     """
     try:
-        correlation_engine = create_correlation_engine()
+        correlation_engine = _engine(True)
         status = correlation_engine.get_engine_status()
         
         # Add LLM usage information if available
@@ -155,20 +292,38 @@ async def get_engine_status():
         
         return status
     except Exception as e:
-        logger.error(f"Failed to get engine status: {str(e)}")
+        logger.error("Failed to get engine status: %s", e)
         raise HTTPException(status_code=500, detail=f"Status check failed: {str(e)}")
 
+# /llm-usage answer when the engine has no LLM service; it never changes, so it is built once
+_LLM_UNAVAILABLE_USAGE = {
+    "success": False,
+    "error": "LLM service not available",
+    "reason": "LLM service not initialized",
+    "fallback_mode": "rule-based"
+}
+
+# Usage report fields exposed by /llm-usage
+_USAGE_REPORT_FIELDS = (
+    "total_cost",
+    "embedding_requests",
+    "llm_requests",
+    "budget_limit",
+    "budget_remaining",
+    "cost_breakdown",
+    "usage_period"
+)
+
 @router.get("/llm-usage")
 async def get_llm_usage():
     """
     NEW - Phase 2.1.2: Get LLM usage and cost information
     """
     try:
-        # Get correlation engine instance
-        from ..services.correlation_engine import CorrelationEngine
-        engine = CorrelationEngine()
+        engine = _engine(True)
+        if engine.llm_service is None:
+            return _LLM_UNAVAILABLE_USAGE
         
-        # Get LLM status
         llm_status = engine.get_llm_status()
         
         if not llm_status['enabled']:
@@ -186,29 +341,16 @@ async def get_llm_usage():
                 "usage_report": llm_status['usage_report'],
                 "fallback_mode": llm_status['fallback_mode']
             }
-            
+        
+        usage_report = llm_status['usage_report']
         return {
             "success": True,
             "status": llm_status['status'],
-            "usage_report": {
-                "total_cost": llm_status['usage_report']['total_cost'],
-                "embedding_requests": llm_status['usage_report']['embedding_requests'],
-                "llm_requests": llm_status['usage_report']['llm_requests'],
-                "budget_limit": llm_status['usage_report']['budget_limit'],
-                "budget_remaining": llm_status['usage_report']['budget_remaining'],
-                "cost_breakdown": {
-                    "embeddings_cost": llm_status['usage_report']['cost_breakdown']['embeddings_cost'],
-                    "llm_cost": llm_status['usage_report']['cost_breakdown']['llm_cost']
-                },
-                "usage_period": {
-                    "start_date": llm_status['usage_report']['usage_period']['start_date'],
-                    "end_date": llm_status['usage_report']['usage_period']['end_date']
-                }
-            }
+            "usage_report": {key: usage_report[key] for key in _USAGE_REPORT_FIELDS}
         }
         
     except Exception as e:
-        logger.error(f"Failed to get LLM usage: {e}")
+        logger.error("Failed to get LLM usage: %s", e)
         return {
             "success": False,
             "error": "Failed to get LLM usage",
@@ -8,12 +8,11 @@ from pydantic import BaseModel
 from typing import List, Optional
 from uuid import UUID
 
-from ..api.auth import get_current_user
-from ..services.database_service import DatabaseService  
+from ..api.auth import get_current_user, auth_service
+from ..services.database_service import DatabaseService, get_database_service
 from ..models import ProfileCreate, DataConsentCreate
 
 router = APIRouter()
-db_service = DatabaseService()
 
 class TeamMemberCreate(BaseModel):
     full_name: str
@@ -40,7 +39,10 @@ class ConsentStatus(BaseModel):
     consented_at: Optional[str] = None
 
 @router.get("/members", response_model=List[TeamMemberResponse])
-async def get_team_members(current_user: dict = Depends(get_current_user)):
+async def get_team_members(
+    current_user: dict = Depends(get_current_user),
+    db_service: DatabaseService = Depends(get_database_service)
+):
     """
     Get all team members for the authenticated manager
     """
@@ -49,8 +51,9 @@ async def get_team_members(current_user: dict = Depends(get_current_user)):
         
         team_members = await db_service.get_team_members(manager_id)
         
+        # Profiles are already validated models; FastAPI validates the response once
         return [
-            TeamMemberResponse(
+            TeamMemberResponse.model_construct(
                 id=str(member.id),
                 full_name=member.full_name,
                 email=member.email,
@@ -71,7 +74,8 @@ async def get_team_members(current_user: dict = Depends(get_current_user)):
 @router.post("/members", response_model=TeamMemberResponse)
 async def create_team_member(
     member_data: TeamMemberCreate,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db_service: DatabaseService = Depends(get_database_service)
 ):
     """
     Add a new team member
@@ -95,14 +99,15 @@ async def create_team_member(
         
         profile = await db_service.create_profile(profile_data, new_member_id)
         
-        # Create default consent records (all false initially)
-        for source_type in ['gitlab', 'jira', 'documents']:
-            consent_data = DataConsentCreate(
+        # Create default consent records (all false initially) in one request
+        await db_service.create_consents([
+            DataConsentCreate(
                 team_member_id=profile.id,
                 source_type=source_type,
                 consented=False
             )
-            await db_service.create_consent(consent_data)
+            for source_type in ['gitlab', 'jira', 'documents']
+        ])
         
         return TeamMemberResponse(
             id=str(profile.id),
@@ -124,7 +129,8 @@ async def create_team_member(
 async def update_consent(
     member_id: UUID,
     consent_data: ConsentUpdate,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db_service: DatabaseService = Depends(get_database_service)
 ):
     """
     Update data collection consent for a team member
@@ -133,9 +139,6 @@ async def update_consent(
         manager_id = UUID(current_user["id"])
         
         # Verify manager has access to this team member
-        from ..services.auth_service import AuthService
-        auth_service = AuthService()
-        
         has_access = await auth_service.verify_manager_access(manager_id, member_id)
         if not has_access:
             raise HTTPException(
@@ -169,7 +172,8 @@ async def update_consent(
 @router.get("/members/{member_id}/consent", response_model=List[ConsentStatus])
 async def get_consent_status(
     member_id: UUID,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db_service: DatabaseService = Depends(get_database_service)
 ):
     """
     Get consent status for a team member
@@ -178,9 +182,6 @@ async def get_consent_status(
         manager_id = UUID(current_user["id"])
         
         # Verify manager has access to this team member
-        from ..services.auth_service import AuthService
-        auth_service = AuthService()
-        
         has_access = await auth_service.verify_manager_access(manager_id, member_id)
         if not has_access:
             raise HTTPException(
@@ -191,7 +192,7 @@ async def get_consent_status(
         consents = await db_service.get_consents(member_id)
         
         return [
-            ConsentStatus(
+            ConsentStatus.model_construct(
                 source_type=consent.source_type,
                 consented=consent.consented,
                 consented_at=consent.consented_at.isoformat() if consent.consented_at else None
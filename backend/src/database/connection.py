@@ -12,25 +12,52 @@ from supabase import create_client, Client
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables from specific .env file
-env_path = Path('/Users/aankur/workspace/PerformancePulse/backend/.env')
-if not env_path.exists():
-    raise FileNotFoundError(f"Required .env file not found at: {env_path}")
+# backend/.env; deployments may instead set the variables in the environment
+ENV_PATH = Path(__file__).resolve().parents[2] / '.env'
 
-load_result = load_dotenv(dotenv_path=env_path, verbose=True)
-if not load_result:
-    raise RuntimeError(f"Failed to load environment variables from: {env_path}")
+_configured = False
+
+def configure(env_path: Path = ENV_PATH) -> bool:
+    """
+    Load environment variables from the backend .env file, once per process
+    
+    A missing file is not an error: variables already set in the process
+    environment are used as-is (and always take precedence over the file).
+    
+    Args:
+        env_path: Path of the .env file to load
+        
+    Returns:
+        True if a .env file was loaded
+    """
+    global _configured
+    if _configured:
+        return False
+    _configured = True
+    
+    if load_dotenv(dotenv_path=env_path):
+        logger.debug(f"Loaded environment from {env_path}")
+        return True
+    
+    if not (os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_SERVICE_ROLE_KEY')):
+        logger.warning(f"No .env file at {env_path} and Supabase is not configured in the environment")
+    return False
 
 class DatabaseConnection:
     """Manages Supabase database connections with proper error handling"""
     
     def __init__(self):
         self.client: Optional[Client] = None
-        self._initialized = False
     
     def initialize(self) -> bool:
-        """Initialize Supabase client with environment variables"""
+        """
+        Create the Supabase client from environment variables
+        
+        Creating the client makes no network request; use health_check()
+        to verify the database is reachable.
+        """
         try:
+            configure()
             supabase_url = os.getenv('SUPABASE_URL')
             supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
             
@@ -38,15 +65,8 @@ class DatabaseConnection:
                 logger.error("Missing Supabase configuration in environment variables")
                 return False
             
-            # Initialize client
             logger.info(f"Initializing Supabase client with URL: {supabase_url}")
             self.client = create_client(supabase_url, supabase_key)
-            
-            # Test the connection with a simple query
-            logger.info("Testing connection with a simple query...")
-            self.client.table('profiles').select("*").limit(1).execute()
-            
-            self._initialized = True
             logger.info("✅ Supabase client initialized successfully")
             return True
             
@@ -57,10 +77,11 @@ class DatabaseConnection:
             return False
     
     def get_client(self) -> Client:
-        """Get the Supabase client, initializing if necessary"""
-        if not self._initialized or not self.client:
-            if not self.initialize():
-                raise ConnectionError("Unable to initialize Supabase client")
+        """Get the Supabase client, creating it on first use"""
+        if self.client is not None:
+            return self.client
+        if not self.initialize():
+            raise ConnectionError("Unable to initialize Supabase client")
         return self.client
     
     def health_check(self) -> bool:
@@ -8,10 +8,11 @@ Main entry point for the FastAPI backend that handles:
 - Background job management
 """
 
+import asyncio
 import os
-from pathlib import Path
-from dotenv import load_dotenv
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 import uvicorn
@@ -29,26 +30,41 @@ logger = logging.getLogger(__name__)
 # Reduce noise from uvicorn access logs
 logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
-# Load environment variables
-env_path = Path(__file__).parent.parent / '.env'
-logger.debug(f"Looking for .env file at: {env_path}")
-
-if not env_path.exists():
-    logger.error(f"Required .env file not found at {env_path}")
-    raise FileNotFoundError(f"Required .env file not found at {env_path}")
-
-load_dotenv(env_path)
+# Load backend/.env if present; routers read configuration when imported
+from src.database.connection import configure, test_database_connection
+configure()
 
 # Import routers - using the names as exported in their respective modules
 from src.api.auth import router as auth_router
 from src.api.team import router as team_router
-from src.api.evidence_api import router as evidence_api_router
+from src.api.evidence_api import router as evidence_api_router, close_engines
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Optionally check the database on startup; release app-wide clients on shutdown"""
+    # Requests never probe the database; this one-off check is for debugging
+    # connection problems (GET /api/auth/health runs the same query on demand)
+    if os.getenv('SUPABASE_PROBE_ON_STARTUP', 'false').lower() == 'true':
+        await asyncio.to_thread(test_database_connection)
+    
+    yield
+    
+    # Shared GitLab client, created on first use by the evidence endpoints
+    gitlab_client = getattr(app.state, "gitlab_client", None)
+    if gitlab_client is not None:
+        await gitlab_client.close()
+    
+    # Correlation engines and the LLM API connection pool they share
+    close_engines()
 
 # Create FastAPI app
 app = FastAPI(
     title="PerformancePulse API",
     description="Backend API for PerformancePulse - Performance Analytics Platform",
-    version="2.1.2"
+    version="2.1.2",
+    lifespan=lifespan,
+    # orjson encodes the large /correlate and team responses much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -4,7 +4,8 @@ Handles Google OAuth, session management, and user context
 """
 
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from uuid import UUID
 
 from ..database.connection import get_supabase_client
@@ -12,11 +13,25 @@ from ..models import Profile, ProfileCreate
 
 logger = logging.getLogger(__name__)
 
+# Manager/team member assignments rarely change, so access checks within
+# this window reuse the last answer instead of fetching the profile again
+ACCESS_CACHE_TTL_SECONDS = 60.0
+_ACCESS_CACHE_MAX_ENTRIES = 4096
+
 class AuthService:
     """Service for authentication and user session management"""
     
     def __init__(self):
         self.client = get_supabase_client()
+        self._db_service = None
+        self._access_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+    
+    def _get_db_service(self):
+        """Get the database service, creating it on first use"""
+        if self._db_service is None:
+            from ..services.database_service import DatabaseService
+            self._db_service = DatabaseService()
+        return self._db_service
     
     async def get_current_user(self, access_token: str) -> Optional[Dict[str, Any]]:
         """Get current user from access token"""
@@ -40,8 +55,7 @@ class AuthService:
     async def create_or_update_profile(self, user_data: Dict[str, Any]) -> Profile:
         """Create or update user profile after OAuth"""
         try:
-            from ..services.database_service import DatabaseService
-            db_service = DatabaseService()
+            db_service = self._get_db_service()
             
             user_id = UUID(user_data["id"])
             
@@ -76,17 +90,21 @@ class AuthService:
     
     async def verify_manager_access(self, user_id: UUID, team_member_id: UUID) -> bool:
         """Verify if user is manager of the team member"""
+        key = (str(user_id), str(team_member_id))
+        cached = self._access_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
-            from ..services.database_service import DatabaseService
-            db_service = DatabaseService()
-            
-            team_member = await db_service.get_profile(team_member_id)
-            
-            if not team_member:
-                return False
-            
-            return str(team_member.manager_id) == str(user_id)
+            team_member = await self._get_db_service().get_profile(team_member_id)
+            has_access = bool(team_member) and str(team_member.manager_id) == str(user_id)
             
         except Exception as e:
+            # Errors deny access but are not cached, so the next check retries
             logger.error(f"Error verifying manager access: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+        
+        if len(self._access_cache) >= _ACCESS_CACHE_MAX_ENTRIES:
+            self._access_cache.clear()
+        self._access_cache[key] = (time.monotonic() + ACCESS_CACHE_TTL_SECONDS, has_access)
+        return has_access
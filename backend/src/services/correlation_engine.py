@@ -11,6 +11,9 @@ import logging
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import time
+from collections import Counter
+from itertools import chain
+
 
 from src.models.correlation_models import (
     EvidenceRelationship,
@@ -73,6 +76,11 @@ class CorrelationEngine:
         
         logger.info(f"Correlation Engine initialized successfully (LLM enabled: {self.enable_llm})")
     
+    def close(self):
+        """Release the LLM service's HTTP connections"""
+        if self.llm_service:
+            self.llm_service.close()
+    
     def get_llm_status(self) -> Dict[str, Any]:
         """Get current LLM service status"""
         if not self.llm_service:
@@ -173,8 +181,8 @@ class CorrelationEngine:
                     else:
                         logger.info("Step 7 - LLM enhancement skipped (already attempted or disabled)")
                     
-                    # Create correlated collection
-                    correlated_collection = CorrelatedCollection(
+                    # Create correlated collection; every part is an already-validated model
+                    correlated_collection = CorrelatedCollection.model_construct(
                         evidence_items=evidence_items,
                         total_evidence_count=len(evidence_items),
                         work_stories=work_stories,
@@ -229,7 +237,7 @@ class CorrelationEngine:
             jira_items = [item for item in evidence_items if item.platform == PlatformType.JIRA]
 
             try:
-                jira_gitlab_relationships = await self.jira_gitlab_linker.detect_relationships(
+                jira_gitlab_relationships = self.jira_gitlab_linker.detect_relationships(
                     gitlab_items, jira_items
                 )
                 relationships.extend(jira_gitlab_relationships)
@@ -244,9 +252,15 @@ class CorrelationEngine:
             tech_relationships = self.technology_detector.detect_tech_relationships(evidence_items)
             relationships.extend(tech_relationships)
             
-            # Score confidence for all relationships
-            for rel in relationships:
-                rel.confidence_score = self.confidence_scorer.score_relationship(rel)
+            # Score confidence for all relationships in one batch
+            items_by_id = {item.id: item for item in evidence_items}
+            scorable = [
+                rel for rel in relationships
+                if rel.primary_evidence_id in items_by_id and rel.related_evidence_id in items_by_id
+            ]
+            scores = self.confidence_scorer.score_relationships(scorable, items_by_id, items_by_id)
+            for rel, score in zip(scorable, scores.tolist()):
+                rel.confidence_score = score
             
             # Filter by confidence threshold
             relationships = [r for r in relationships if r.confidence_score >= self.default_confidence_threshold]
@@ -287,8 +301,8 @@ class CorrelationEngine:
             else:
                 logger.info("Step 7 - LLM enhancement skipped (already attempted or disabled)")
             
-            # Create correlated collection
-            correlated_collection = CorrelatedCollection(
+            # Create correlated collection; every part is an already-validated model
+            correlated_collection = CorrelatedCollection.model_construct(
                 evidence_items=evidence_items,
                 total_evidence_count=len(evidence_items),
                 work_stories=work_stories,
@@ -357,7 +371,7 @@ class CorrelationEngine:
     async def _analyze_work_patterns(self, work_stories: List[WorkStory]) -> List[WorkStory]:
         """Analyze timeline patterns in work stories"""
         for story in work_stories:
-            timeline_data = await self.timeline_analyzer.analyze_work_story(story)
+            timeline_data = self.timeline_analyzer.analyze_work_story(story)
             story.timeline.update(timeline_data.get("timeline", {}))
             story.metadata.update(timeline_data.get("patterns", {}))
         
@@ -367,11 +381,11 @@ class CorrelationEngine:
     async def _detect_technology_stacks(self, work_stories: List[WorkStory]) -> List[WorkStory]:
         """Detect technology stacks in work stories"""
         for story in work_stories:
-            technologies = await self.technology_detector.detect_technologies(story)
+            technologies = self.technology_detector.detect_technologies(story)
             story.technology_stack = technologies
             
             # Calculate complexity score based on technology diversity and evidence
-            complexity = await self.technology_detector.calculate_complexity(story)
+            complexity = self.technology_detector.calculate_complexity(story)
             story.complexity_score = complexity
         
         logger.info(f"Detected technology stacks for {len(work_stories)} work stories")
@@ -388,13 +402,12 @@ class CorrelationEngine:
         avg_confidence = sum(r.confidence_score for r in relationships) / len(relationships) if relationships else 0.0
         
         # Technology distribution
-        technology_distribution = {}
-        for story in work_stories:
-            for tech in story.technology_stack:
-                technology_distribution[tech] = technology_distribution.get(tech, 0) + 1
+        technology_distribution = dict(Counter(
+            chain.from_iterable(story.technology_stack for story in work_stories)
+        ))
         
         # Work patterns analysis
-        work_patterns = await self.timeline_analyzer.analyze_overall_patterns(work_stories)
+        work_patterns = self.timeline_analyzer.analyze_overall_patterns(work_stories)
         
         # Performance metrics
         sprint_metrics = await self._calculate_sprint_metrics(evidence_items, work_stories)
@@ -570,4 +583,4 @@ class CorrelationEngine:
 # Factory function for creating correlation engine
 def create_correlation_engine(enable_llm: bool = True) -> CorrelationEngine:
     """Create and configure correlation engine with optional LLM enhancement"""
-    return CorrelationEngine(enable_llm=enable_llm) 
\ No newline at end of file
+    return CorrelationEngine(enable_llm=enable_llm)
\ No newline at end of file
@@ -3,11 +3,15 @@ Database service layer for PerformancePulse
 Handles all database operations with proper error handling and consent checking
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
+from fastapi import Request
+
 from ..database.connection import get_supabase_client  
 from ..models import (
     Profile, ProfileCreate, ProfileUpdate,
@@ -17,6 +21,14 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# supabase-py is synchronous; queries run on these threads so a slow round
+# trip does not block the event loop serving other requests
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="supabase")
+
+async def _execute(query):
+    """Run a built Supabase query on the database thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, query.execute)
+
 class DatabaseService:
     """Service layer for database operations with consent and RLS enforcement"""
     
@@ -31,7 +43,7 @@ class DatabaseService:
             data = profile_data.model_dump(exclude_unset=True)
             data['id'] = str(user_id)
             
-            result = self.client.table('profiles').insert(data).execute()
+            result = await _execute(self.client.table('profiles').insert(data))
             
             if not result.data:
                 raise ValueError("Failed to create profile")
@@ -45,7 +57,7 @@ class DatabaseService:
     async def get_profile(self, user_id: UUID) -> Optional[Profile]:
         """Get profile by user ID"""
         try:
-            result = self.client.table('profiles').select('*').eq('id', str(user_id)).execute()
+            result = await _execute(self.client.table('profiles').select('*').eq('id', str(user_id)))
             
             if result.data:
                 return Profile(**result.data[0])
@@ -58,7 +70,7 @@ class DatabaseService:
     async def get_team_members(self, manager_id: UUID) -> List[Profile]:
         """Get all team members for a manager"""
         try:
-            result = self.client.table('profiles').select('*').eq('manager_id', str(manager_id)).execute()
+            result = await _execute(self.client.table('profiles').select('*').eq('manager_id', str(manager_id)))
             
             return [Profile(**item) for item in result.data]
             
@@ -75,7 +87,7 @@ class DatabaseService:
                 # No changes to make
                 return await self.get_profile(user_id)
             
-            result = self.client.table('profiles').update(data).eq('id', str(user_id)).execute()
+            result = await _execute(self.client.table('profiles').update(data).eq('id', str(user_id)))
             
             if not result.data:
                 raise ValueError("Failed to update profile")
@@ -102,7 +114,7 @@ class DatabaseService:
             data = evidence_data.model_dump(exclude_unset=True)
             data['team_member_id'] = str(data['team_member_id'])
             
-            result = self.client.table('evidence_items').insert(data).execute()
+            result = await _execute(self.client.table('evidence_items').insert(data))
             
             if not result.data:
                 raise ValueError("Failed to create evidence item")
@@ -116,12 +128,11 @@ class DatabaseService:
     async def get_evidence_items(self, team_member_id: UUID, limit: int = 100) -> List[EvidenceItem]:
         """Get evidence items for a team member"""
         try:
-            result = (self.client.table('evidence_items')
-                     .select('*')
-                     .eq('team_member_id', str(team_member_id))
-                     .order('evidence_date', desc=True)
-                     .limit(limit)
-                     .execute())
+            result = await _execute(self.client.table('evidence_items')
+                                   .select('*')
+                                   .eq('team_member_id', str(team_member_id))
+                                   .order('evidence_date', desc=True)
+                                   .limit(limit))
             
             return [EvidenceItem(**item) for item in result.data]
             
@@ -139,11 +150,10 @@ class DatabaseService:
             if not team_member_ids:
                 return []
             
-            result = (self.client.table('evidence_items')
-                     .select('*')
-                     .in_('team_member_id', team_member_ids)
-                     .order('evidence_date', desc=True)
-                     .execute())
+            result = await _execute(self.client.table('evidence_items')
+                                   .select('*')
+                                   .in_('team_member_id', team_member_ids)
+                                   .order('evidence_date', desc=True))
             
             return [EvidenceItem(**item) for item in result.data]
             
@@ -152,22 +162,27 @@ class DatabaseService:
             raise
     
     # Consent Management
+    @staticmethod
+    def _consent_row(consent_data: DataConsentCreate) -> Dict[str, Any]:
+        """Build the data_consents row for a consent"""
+        data = consent_data.model_dump(exclude_unset=True)
+        data['team_member_id'] = str(data['team_member_id'])
+        
+        if data['consented']:
+            data['consented_at'] = datetime.utcnow().isoformat()
+            data['revoked_at'] = None
+        else:
+            data['revoked_at'] = datetime.utcnow().isoformat()
+        return data
+    
     async def create_consent(self, consent_data: DataConsentCreate) -> DataConsent:
         """Create or update data consent"""
         try:
-            data = consent_data.model_dump(exclude_unset=True)
-            data['team_member_id'] = str(data['team_member_id'])
-            
-            if data['consented']:
-                data['consented_at'] = datetime.utcnow().isoformat()
-                data['revoked_at'] = None
-            else:
-                data['revoked_at'] = datetime.utcnow().isoformat()
+            data = self._consent_row(consent_data)
             
             # Use upsert to handle existing consents
-            result = (self.client.table('data_consents')
-                     .upsert(data, on_conflict='team_member_id,source_type')
-                     .execute())
+            result = await _execute(self.client.table('data_consents')
+                                   .upsert(data, on_conflict='team_member_id,source_type'))
             
             if not result.data:
                 raise ValueError("Failed to create consent")
@@ -178,13 +193,29 @@ class DatabaseService:
             logger.error(f"Error creating consent: {str(e)}")
             raise
     
+    async def create_consents(self, consents: List[DataConsentCreate]) -> List[DataConsent]:
+        """Create or update several data consents in one request"""
+        try:
+            rows = [self._consent_row(consent_data) for consent_data in consents]
+            
+            result = await _execute(self.client.table('data_consents')
+                                   .upsert(rows, on_conflict='team_member_id,source_type'))
+            
+            if len(result.data or []) != len(rows):
+                raise ValueError("Failed to create consents")
+            
+            return [DataConsent(**item) for item in result.data]
+            
+        except Exception as e:
+            logger.error(f"Error creating consents: {str(e)}")
+            raise
+    
     async def get_consents(self, team_member_id: UUID) -> List[DataConsent]:
         """Get all consents for a team member"""
         try:
-            result = (self.client.table('data_consents')
-                     .select('*')
-                     .eq('team_member_id', str(team_member_id))
-                     .execute())
+            result = await _execute(self.client.table('data_consents')
+                                   .select('*')
+                                   .eq('team_member_id', str(team_member_id)))
             
             return [DataConsent(**item) for item in result.data]
             
@@ -206,11 +237,10 @@ class DatabaseService:
             else:
                 data['revoked_at'] = datetime.utcnow().isoformat()
             
-            result = (self.client.table('data_consents')
-                     .update(data)
-                     .eq('team_member_id', str(team_member_id))
-                     .eq('source_type', source_type)
-                     .execute())
+            result = await _execute(self.client.table('data_consents')
+                                   .update(data)
+                                   .eq('team_member_id', str(team_member_id))
+                                   .eq('source_type', source_type))
             
             if not result.data:
                 raise ValueError("Failed to update consent")
@@ -225,11 +255,10 @@ class DatabaseService:
     async def _check_consent(self, team_member_id: UUID, source_type: str) -> bool:
         """Check if team member has consented to data collection"""
         try:
-            result = (self.client.table('data_consents')
-                     .select('consented')
-                     .eq('team_member_id', str(team_member_id))
-                     .eq('source_type', source_type)
-                     .execute())
+            result = await _execute(self.client.table('data_consents')
+                                   .select('consented')
+                                   .eq('team_member_id', str(team_member_id))
+                                   .eq('source_type', source_type))
             
             if result.data:
                 return result.data[0]['consented']
@@ -256,7 +285,7 @@ class DatabaseService:
         """Perform database health check"""
         try:
             # Test basic connectivity
-            result = self.client.table('profiles').select('count').limit(1).execute()
+            result = await _execute(self.client.table('profiles').select('count').limit(1))
             
             return {
                 "status": "healthy",
@@ -271,4 +300,17 @@ class DatabaseService:
                 "database": "disconnected",
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat()
-            } 
\ No newline at end of file
+            } 
+
+def get_database_service(request: Request) -> DatabaseService:
+    """
+    Get the app-wide database service, creating it on first use
+    
+    Used as a FastAPI dependency so endpoints share one service instead of
+    constructing a new one per request.
+    """
+    service = getattr(request.app.state, "database_service", None)
+    if service is None:
+        service = DatabaseService()
+        request.app.state.database_service = service
+    return service
@@ -22,9 +22,22 @@ from dataclasses import dataclass
 from enum import Enum
 import httpx
 
+try:
+    import h2
+except ImportError:  # Optional: lets httpx multiplex requests over HTTP/2
+    h2 = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Connection pool and timeouts for the API fallback
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client for GitLab API calls, using HTTP/2 when available"""
+    return httpx.AsyncClient(http2=h2 is not None, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
 class DataSource(Enum):
     MCP = "mcp"
     API = "api"
@@ -178,13 +191,30 @@ class GitLabMCPClient:
 class GitLabAPIClient:
     """GitLab API client for fallback"""
     
-    def __init__(self, gitlab_token: str, gitlab_url: str = "https://gitlab.com/api/v4"):
+    def __init__(self, gitlab_token: str, gitlab_url: str = "https://gitlab.com/api/v4",
+                 http_client: Optional[httpx.AsyncClient] = None):
         self.gitlab_token = gitlab_token
         self.gitlab_url = gitlab_url
         self.headers = {
             "Authorization": f"Bearer {gitlab_token}",
             "Content-Type": "application/json"
         }
+        
+        # An injected client is shared with its owner, who is responsible for closing it
+        self._http = http_client
+        self._owns_http = http_client is None
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use"""
+        if self._http is None or (self._owns_http and self._http.is_closed):
+            self._http = create_http_client()
+        return self._http
+    
+    async def close(self):
+        """Close pooled HTTP connections"""
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     async def get_merge_requests(self, project_id: str, username: str, since_date: datetime) -> List[Dict]:
         """Get merge requests via direct API"""
@@ -196,19 +226,17 @@ class GitLabAPIClient:
             "state": "all"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_http().get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return response.json()
     
     async def get_project_details(self, project_id: str) -> Dict:
         """Get project details via direct API"""
         url = f"{self.gitlab_url}/projects/{project_id}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_http().get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
     
     async def get_issues(self, project_id: str, username: str, since_date: datetime) -> List[Dict]:
         """Get issues via direct API"""
@@ -219,10 +247,9 @@ class GitLabAPIClient:
             "per_page": 50
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_http().get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return response.json()
 
 class GitLabHybridClient:
     """
@@ -243,17 +270,22 @@ class GitLabHybridClient:
     def __init__(self, 
                  gitlab_token: str,
                  project_id: str,
-                 gitlab_url: str = "https://gitlab.com/api/v4"):
+                 gitlab_url: str = "https://gitlab.com/api/v4",
+                 http_client: Optional[httpx.AsyncClient] = None):
         self.gitlab_token = gitlab_token
         self.project_id = project_id
         self.gitlab_url = gitlab_url
         
         # Initialize both clients
         self.mcp_client = GitLabMCPClient(gitlab_token, gitlab_url)
-        self.api_client = GitLabAPIClient(gitlab_token, gitlab_url)
+        self.api_client = GitLabAPIClient(gitlab_token, gitlab_url, http_client=http_client)
         
         logger.info(f"GitLab Hybrid Client initialized for project {project_id}")
     
+    async def close(self):
+        """Release pooled connections held by the API fallback"""
+        await self.api_client.close()
+    
     async def check_mcp_health(self) -> bool:
         """Check if MCP server is available and working"""
         try:
@@ -327,18 +359,22 @@ class GitLabHybridClient:
         
         logger.info(f"Getting comprehensive evidence for {username} since {since_date}")
         
-        # Collect all evidence types
+        # Collect all evidence types concurrently; each source falls back
+        # from MCP to API on its own
         evidence_items = []
-        
-        # Get merge requests
-        mrs = await self.get_merge_requests(username, since_date)
-        evidence_items.extend(mrs)
-        logger.info(f"Collected {len(mrs)} merge requests")
-        
-        # Get issues
-        issues = await self.get_issues(username, since_date)
-        evidence_items.extend(issues)
-        logger.info(f"Collected {len(issues)} issues")
+        mrs, issues = await asyncio.gather(
+            self.get_merge_requests(username, since_date),
+            self.get_issues(username, since_date),
+            return_exceptions=True
+        )
+        
+        # A failed source contributes nothing rather than failing the whole collection
+        for label, result in (("merge requests", mrs), ("issues", issues)):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to collect {label}: {result}")
+                continue
+            evidence_items.extend(result)
+            logger.info(f"Collected {len(result)} {label}")
         
         # Sort by evidence date (most recent first)
         evidence_items.sort(key=lambda x: x.evidence_date, reverse=True)
@@ -15,6 +15,7 @@ from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 import logging
 
+import httpx
 from anthropic import Anthropic
 import openai
 from openai import OpenAI
@@ -33,6 +34,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+def create_http_client() -> httpx.Client:
+    """
+    Create the pooled HTTP client shared by the Anthropic and OpenAI SDK clients
+    
+    No timeout is set on the client, so each SDK keeps its own default
+    request timeout.
+    """
+    return httpx.Client(limits=_HTTP_LIMITS)
+
 @dataclass
 class CostTracker:
     """Track LLM usage costs with monthly budget limits"""
@@ -100,7 +112,7 @@ class CostTracker:
 class EmbeddingService:
     """Handle embedding generation for semantic similarity"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.Client] = None):
         logger.debug("Initializing EmbeddingService")
         openai_key = os.getenv('OPENAI_API_KEY')
         if not openai_key:
@@ -111,7 +123,7 @@ class EmbeddingService:
         logger.debug(f"OpenAI API key found (starts with: {openai_key[:4]}...)")
         
         try:
-            self.client = OpenAI(api_key=openai_key)
+            self.client = OpenAI(api_key=openai_key, http_client=http_client)
             # Test the client
             response = self.client.embeddings.create(
                 model="text-embedding-3-small",
@@ -158,6 +170,70 @@ class EmbeddingService:
             logger.error(f"Failed cosine similarity calculation: {e}")
             return 0.0
 
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests into shared API calls
+    
+    Requests arriving within max_delay seconds of each other (from the same
+    correlation or from concurrent ones) are sent as one embeddings call,
+    with duplicate texts embedded once, and the vectors are split back to
+    each caller in order.
+    """
+    
+    def __init__(self, embedding_service: EmbeddingService, max_batch_size: int = 256, max_delay: float = 0.05):
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size  # Texts per call before flushing early
+        self.max_delay = max_delay
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_texts = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+    
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for texts, batched with other pending requests"""
+        if not texts:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((texts, future))
+        self._pending_texts += len(texts)
+        
+        if self._pending_texts >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Send everything pending as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending, self._pending_texts = self._pending, [], 0
+        if batch:
+            asyncio.ensure_future(self._embed_batch(batch))
+    
+    async def _embed_batch(self, batch: List[Tuple[List[str], asyncio.Future]]):
+        """Embed the unique texts of a batch and resolve each caller's future"""
+        unique_texts = list(dict.fromkeys(text for texts, _ in batch for text in texts))
+        try:
+            embeddings = await self.embedding_service.get_embeddings(unique_texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        logger.debug(f"Embedded {len(unique_texts)} unique texts for {len(batch)} requests")
+        
+        # A failed call yields no embeddings; every caller sees that as []
+        by_text = dict(zip(unique_texts, embeddings)) if len(embeddings) == len(unique_texts) else None
+        for texts, future in batch:
+            if not future.done():
+                future.set_result([by_text[text] for text in texts] if by_text else [])
+
 class LLMCorrelationService:
     """
     LLM-based correlation service for evidence analysis
@@ -167,10 +243,21 @@ class LLMCorrelationService:
     3. LLM resolution (expensive, edge cases only)
     """
     
-    def __init__(self):
-        """Initialize LLM correlation service with cost tracking and API clients"""
+    def __init__(self, http_client: Optional[httpx.Client] = None):
+        """
+        Initialize LLM correlation service with cost tracking and API clients
+        
+        Args:
+            http_client: Shared HTTP client for the embedding, Anthropic and
+                         OpenAI clients; one is created (and owned) if omitted
+        """
         logger.debug("Initializing LLMCorrelationService")
         
+        # One connection pool for every API client, so keep-alive connections
+        # and TLS sessions are reused across calls
+        self._owns_http = http_client is None
+        self.http_client = create_http_client() if http_client is None else http_client
+        
         # Load and validate environment variables
         openai_key = os.getenv('OPENAI_API_KEY')
         anthropic_key = os.getenv('ANTHROPIC_API_KEY')
@@ -187,16 +274,19 @@ class LLMCorrelationService:
         # Initialize embedding service first
         try:
             logger.debug("Initializing EmbeddingService")
-            self.embedding_service = EmbeddingService()
+            self.embedding_service = EmbeddingService(http_client=self.http_client)
+            self.embedding_batcher = EmbeddingBatcher(self.embedding_service)
         except Exception as e:
             logger.error(f"Failed to initialize EmbeddingService: {e}")
+            # The service is never returned, so nothing else would close this
+            self.close()
             raise
         
         # Initialize LLM clients with validation
         try:
             if anthropic_key:
                 try:
-                    self.anthropic_client = Anthropic(api_key=anthropic_key)
+                    self.anthropic_client = Anthropic(api_key=anthropic_key, http_client=self.http_client)
                     # Test the client
                     response = self.anthropic_client.messages.create(
                         model="claude-3-haiku-20240307",
@@ -217,7 +307,7 @@ class LLMCorrelationService:
             
             if openai_key:
                 try:
-                    self.openai_client = OpenAI(api_key=openai_key)
+                    self.openai_client = OpenAI(api_key=openai_key, http_client=self.http_client)
                     # Test the client
                     response = self.openai_client.chat.completions.create(
                         model="gpt-3.5-turbo",
@@ -396,11 +486,14 @@ class LLMCorrelationService:
         try:
             relationships = []
             
-            # Process in batches to avoid API limits
+            # Chunks are submitted together; the batcher merges them (and any
+            # concurrent correlations) into as few API calls as it can
             batch_size = 20
-            for i in range(0, len(evidence_pairs), batch_size):
-                batch = evidence_pairs[i:i+batch_size]
-                batch_relationships = await self._process_embedding_batch(batch)
+            batch_results = await asyncio.gather(*(
+                self._process_embedding_batch(evidence_pairs[i:i+batch_size])
+                for i in range(0, len(evidence_pairs), batch_size)
+            ))
+            for batch_relationships in batch_results:
                 relationships.extend(batch_relationships)
             
             # Record cost
@@ -425,7 +518,7 @@ class LLMCorrelationService:
             texts.extend([text1, text2])
         
         # Get embeddings
-        embeddings = await self.embedding_service.get_embeddings(texts)
+        embeddings = await self.embedding_batcher.get_embeddings(texts)
         
         if len(embeddings) != len(texts):
             logger.error("Embedding count mismatch")
@@ -619,6 +712,7 @@ Date: {item2.evidence_date}
         # Import existing rule-based algorithms
         from ..algorithms.jira_gitlab_linker import JiraGitLabLinker
         from ..algorithms.confidence_scorer import ConfidenceScorer
+        from ..models.unified_evidence import PlatformType
         
         linker = JiraGitLabLinker()
         scorer = ConfidenceScorer()
@@ -627,7 +721,10 @@ Date: {item2.evidence_date}
         
         for item1, item2 in evidence_pairs:
             # Use existing rule-based detection
-            detected_relationships = linker.detect_relationships([item1, item2])
+            pair = (item1, item2)
+            gitlab_items = [item for item in pair if item.platform == PlatformType.GITLAB]
+            jira_items = [item for item in pair if item.platform == PlatformType.JIRA]
+            detected_relationships = linker.detect_relationships(gitlab_items, jira_items)
             for rel in detected_relationships:
                 # Update detection method to indicate fallback
                 rel.metadata = rel.metadata or {}
@@ -636,6 +733,11 @@ Date: {item2.evidence_date}
         
         return relationships
     
+    def close(self):
+        """Close the HTTP client if this service created it"""
+        if self._owns_http:
+            self.http_client.close()
+    
     def get_usage_report(self) -> Dict[str, Any]:
         """Get current usage and cost report"""
         now = datetime.now(timezone.utc)
@@ -693,6 +795,7 @@ def create_llm_correlation_service() -> Optional[LLMCorrelationService]:
         # Verify service initialization
         if not (service.anthropic_client or service.openai_client):
             logger.error("LLM service failed to initialize API clients")
+            service.close()
             return None
         
         # Log configuration status
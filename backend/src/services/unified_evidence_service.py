@@ -470,6 +470,11 @@ class UnifiedEvidenceService:
     
     async def close(self):
         """Close all platform clients"""
+        try:
+            await self.gitlab_client.close()
+        except Exception as e:
+            logger.warning(f"Error closing GitLab client: {e}")
+        
         try:
             await self.jira_client.close()
         except Exception as e:
@@ -0,0 +1,59 @@
+"""
+Test suite for AuthService
+Tests manager access checks with a mocked database
+"""
+
+import pytest
+from unittest.mock import Mock, patch, AsyncMock
+from uuid import uuid4
+
+from src.services import auth_service as auth_module
+from src.services.auth_service import AuthService
+
+@pytest.fixture
+def auth_service():
+    """Create AuthService instance with a mocked database service"""
+    with patch('src.services.auth_service.get_supabase_client'):
+        service = AuthService()
+    service._db_service = Mock()
+    return service, service._db_service
+
+class TestVerifyManagerAccess:
+    """Test manager access verification and its cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_checks_use_cache(self, auth_service):
+        service, db_service = auth_service
+        manager_id, member_id = uuid4(), uuid4()
+        db_service.get_profile = AsyncMock(return_value=Mock(manager_id=manager_id))
+
+        assert await service.verify_manager_access(manager_id, member_id) is True
+        assert await service.verify_manager_access(manager_id, member_id) is True
+
+        db_service.get_profile.assert_awaited_once_with(member_id)
+
+    @pytest.mark.asyncio
+    async def test_other_manager_denied(self, auth_service):
+        service, db_service = auth_service
+        db_service.get_profile = AsyncMock(return_value=Mock(manager_id=uuid4()))
+
+        assert await service.verify_manager_access(uuid4(), uuid4()) is False
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, auth_service):
+        service, db_service = auth_service
+        manager_id, member_id = uuid4(), uuid4()
+        db_service.get_profile = AsyncMock(side_effect=[Exception("timeout"), Mock(manager_id=manager_id)])
+
+        assert await service.verify_manager_access(manager_id, member_id) is False
+        assert await service.verify_manager_access(manager_id, member_id) is True
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refreshed(self, auth_service, monkeypatch):
+        service, db_service = auth_service
+        manager_id, member_id = uuid4(), uuid4()
+        db_service.get_profile = AsyncMock(side_effect=[Mock(manager_id=manager_id), None])
+        monkeypatch.setattr(auth_module, "ACCESS_CACHE_TTL_SECONDS", 0.0)
+
+        assert await service.verify_manager_access(manager_id, member_id) is True
+        assert await service.verify_manager_access(manager_id, member_id) is False
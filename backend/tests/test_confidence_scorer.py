@@ -0,0 +1,149 @@
+"""Unit tests for ConfidenceScorer algorithm"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.algorithms.confidence_scorer import ConfidenceScorer
+from src.models.correlation_models import (
+    EvidenceRelationship,
+    RelationshipType,
+    DetectionMethod
+)
+from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
+
+
+class TestConfidenceScorer:
+    """Test ConfidenceScorer algorithm"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.scorer = ConfidenceScorer()
+        self.base_date = datetime(2024, 1, 10, 12, 0, 0)
+    
+    def create_item(self, item_id: str, platform: PlatformType, days_offset: int = 0,
+                    author: str = "user1", title: str = "Fix login flow") -> UnifiedEvidenceItem:
+        """Create a test evidence item"""
+        return UnifiedEvidenceItem(
+            id=item_id,
+            team_member_id="user1",
+            source="jira_ticket" if platform == PlatformType.JIRA else "gitlab_commit",
+            title=title,
+            description="Session handling update",
+            category="technical",
+            evidence_date=self.base_date + timedelta(days=days_offset),
+            platform=platform,
+            data_source=DataSourceType.API,
+            metadata={"author": author}
+        )
+    
+    def create_relationship(self, primary_id: str, related_id: str,
+                            method: DetectionMethod = DetectionMethod.ISSUE_KEY,
+                            rel_type: RelationshipType = RelationshipType.RELATED_TO,
+                            confidence: float = 0.9) -> EvidenceRelationship:
+        """Create a test relationship"""
+        return EvidenceRelationship(
+            primary_evidence_id=primary_id,
+            related_evidence_id=related_id,
+            relationship_type=rel_type,
+            confidence_score=confidence,
+            detection_method=method
+        )
+    
+    def test_score_relationship_issue_key(self):
+        """Test single relationship scoring combines all bonuses"""
+        gitlab_item = self.create_item("gl1", PlatformType.GITLAB)
+        jira_item = self.create_item("jira1", PlatformType.JIRA)
+        rel = self.create_relationship("gl1", "jira1", rel_type=RelationshipType.SOLVES)
+        
+        score = self.scorer.score_relationship(rel, gitlab_item, jira_item)
+        
+        # 0.9 base + 0.1 same day + 0.1 same author + overlap + 0.1 solves, clipped
+        assert score == 1.0
+    
+    def test_batch_scores_match_single_scores(self):
+        """Test batch scoring matches scoring relationships one at a time"""
+        items = {
+            "gl1": self.create_item("gl1", PlatformType.GITLAB),
+            "gl2": self.create_item("gl2", PlatformType.GITLAB, days_offset=3, author="user2"),
+            "jira1": self.create_item("jira1", PlatformType.JIRA, days_offset=-1, title="Login timeout"),
+            "jira2": self.create_item("jira2", PlatformType.JIRA, days_offset=-20, author="user3")
+        }
+        relationships = [
+            self.create_relationship("gl1", "jira1", DetectionMethod.BRANCH_NAME, RelationshipType.REFERENCES),
+            self.create_relationship("gl2", "jira1", DetectionMethod.TEMPORAL_PROXIMITY),
+            self.create_relationship("gl2", "jira2", DetectionMethod.LLM_SEMANTIC,
+                                     RelationshipType.SEMANTIC_SIMILARITY),
+        ]
+        content_rel = self.create_relationship("gl1", "jira2", DetectionMethod.CONTENT_ANALYSIS)
+        content_rel.metadata["similarity_score"] = 0.5
+        relationships.append(content_rel)
+        
+        batch_scores = self.scorer.score_relationships(relationships, items, items)
+        
+        assert len(batch_scores) == len(relationships)
+        for rel, batch_score in zip(relationships, batch_scores):
+            single_score = self.scorer.score_relationship(
+                rel, items[rel.primary_evidence_id], items[rel.related_evidence_id]
+            )
+            assert batch_score == pytest.approx(single_score)
+            assert 0.0 <= batch_score <= 1.0
+    
+    def test_batch_temporal_decay(self):
+        """Test temporal bonus decays linearly and vanishes after a week"""
+        items = {"gl1": self.create_item("gl1", PlatformType.GITLAB, author="a")}
+        for days in (0, 3, 7, 30):
+            items[f"jira{days}"] = self.create_item(f"jira{days}", PlatformType.JIRA,
+                                                    days_offset=days, author="b", title="Unrelated")
+        relationships = [
+            self.create_relationship("gl1", f"jira{days}", DetectionMethod.TEMPORAL_PROXIMITY)
+            for days in (0, 3, 7, 30)
+        ]
+        
+        scores = self.scorer.score_relationships(relationships, items, items)
+        
+        assert scores[0] > scores[1] > scores[2]
+        assert scores[2] == pytest.approx(scores[3])
+    
+    def test_batch_temporal_uses_elapsed_days(self):
+        """Test items a few hours apart across midnight still get the same-day bonus"""
+        after_midnight = self.create_item("gl1", PlatformType.GITLAB, author="a")
+        after_midnight.evidence_date = datetime(2024, 1, 11, 1, 0)
+        before_midnight = self.create_item("jira1", PlatformType.JIRA, author="b", title="Unrelated")
+        before_midnight.evidence_date = datetime(2024, 1, 10, 23, 30)
+        items = {"gl1": after_midnight, "jira1": before_midnight}
+        rel = self.create_relationship("gl1", "jira1", DetectionMethod.TEMPORAL_PROXIMITY)
+        
+        scores = self.scorer.score_relationships([rel], items, items)
+        
+        assert scores[0] == pytest.approx(
+            0.3 + 0.1 + self.scorer._calculate_content_bonus(rel, after_midnight, before_midnight)
+        )
+    
+    def test_validate_batch_mask(self):
+        """Test batch validation applies self-reference, threshold and platform rules"""
+        items = {
+            "gl1": self.create_item("gl1", PlatformType.GITLAB),
+            "gl2": self.create_item("gl2", PlatformType.GITLAB),
+            "jira1": self.create_item("jira1", PlatformType.JIRA)
+        }
+        relationships = [
+            self.create_relationship("gl1", "jira1", confidence=0.5),   # cross-platform
+            self.create_relationship("gl1", "gl1", confidence=0.9),     # self reference
+            self.create_relationship("gl1", "jira1", confidence=0.05),  # too low
+            self.create_relationship("gl1", "gl2", confidence=0.5),     # weak same-platform
+            self.create_relationship("gl1", "gl2", confidence=0.8),     # strong same-platform
+            self.create_relationship("gl1", "gl2", rel_type=RelationshipType.DUPLICATE, confidence=0.4),
+        ]
+        
+        valid = self.scorer.validate_batch(relationships, items, items)
+        
+        assert valid.tolist() == [True, False, False, False, True, True]
+        for rel, expected in zip(relationships, valid.tolist()):
+            assert self.scorer.validate_relationship_logic(
+                rel, items[rel.primary_evidence_id], items[rel.related_evidence_id]
+            ) is expected
+    
+    def test_batch_empty(self):
+        """Test batch scoring with no relationships"""
+        scores = self.scorer.score_relationships([], {}, {})
+        assert len(scores) == 0
@@ -3,6 +3,8 @@ Test suite for DatabaseService
 Tests all database operations with proper mocking for MVP
 """
 
+import asyncio
+import threading
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from uuid import uuid4, UUID
@@ -248,6 +250,38 @@ class TestConsentOperations:
         assert result.source_type == "gitlab"
         assert result.consented is True
     
+    @pytest.mark.asyncio
+    async def test_create_consents_in_one_upsert(self, db_service):
+        service, mock_client = db_service
+        member_id = uuid4()
+        source_types = ["gitlab", "jira", "documents"]
+        
+        # Mock successful bulk upsert returning one row per consent
+        mock_client.table().upsert().execute.return_value = Mock(
+            data=[{
+                "id": str(uuid4()),
+                "team_member_id": str(member_id),
+                "source_type": source_type,
+                "consented": False,
+                "consented_at": None,
+                "revoked_at": datetime.utcnow().isoformat(),
+                "created_at": datetime.utcnow().isoformat(),
+                "updated_at": datetime.utcnow().isoformat()
+            } for source_type in source_types]
+        )
+        mock_client.table().upsert.reset_mock()
+        
+        result = await service.create_consents([
+            DataConsentCreate(team_member_id=member_id, source_type=source_type, consented=False)
+            for source_type in source_types
+        ])
+        
+        assert [consent.source_type for consent in result] == source_types
+        mock_client.table().upsert.assert_called_once()
+        rows = mock_client.table().upsert.call_args.args[0]
+        assert [row["source_type"] for row in rows] == source_types
+        assert all(row["team_member_id"] == str(member_id) for row in rows)
+    
     @pytest.mark.asyncio
     async def test_check_consent_exists(self, db_service):
         service, mock_client = db_service
@@ -309,4 +343,61 @@ class TestHealthCheck:
         assert result["status"] == "unhealthy"
         assert result["database"] == "disconnected"
         assert "error" in result
-        assert "timestamp" in result 
\ No newline at end of file
+        assert "timestamp" in result 
+
+
+class TestQueryExecution:
+    """Test that blocking Supabase calls stay off the event loop"""
+    
+    @pytest.mark.asyncio
+    async def test_queries_run_on_worker_threads(self, db_service):
+        service, mock_client = db_service
+        loop_thread = threading.get_ident()
+        query_threads = []
+        release = threading.Event()
+        
+        def blocking_execute():
+            query_threads.append(threading.get_ident())
+            release.wait(timeout=1)
+            return Mock(data=[])
+        
+        mock_client.table().select().eq().execute.side_effect = blocking_execute
+        
+        fetch = asyncio.ensure_future(service.get_consents(uuid4()))
+        # The loop keeps running while the query blocks its thread
+        while not query_threads:
+            await asyncio.sleep(0.01)
+        release.set()
+        
+        assert await fetch == []
+        assert query_threads[0] != loop_thread
+
+
+class TestDatabaseConnection:
+    """Test Supabase client creation"""
+    
+    def test_client_created_once_without_queries(self, monkeypatch):
+        from src.database import connection
+        
+        # Keep a local .env from overriding the test environment
+        monkeypatch.setattr(connection, '_configured', True)
+        monkeypatch.setenv('SUPABASE_URL', 'https://example.supabase.co')
+        monkeypatch.setenv('SUPABASE_SERVICE_ROLE_KEY', 'key')
+        with patch('src.database.connection.create_client') as create_client:
+            db_connection = connection.DatabaseConnection()
+            
+            client = db_connection.get_client()
+            assert db_connection.get_client() is client
+        
+        create_client.assert_called_once_with('https://example.supabase.co', 'key')
+        client.table.assert_not_called()
+    
+    def test_missing_configuration_raises(self, monkeypatch):
+        from src.database import connection
+        
+        monkeypatch.setattr(connection, '_configured', True)
+        monkeypatch.delenv('SUPABASE_URL', raising=False)
+        monkeypatch.delenv('SUPABASE_SERVICE_ROLE_KEY', raising=False)
+        
+        with pytest.raises(ConnectionError):
+            connection.DatabaseConnection().get_client()
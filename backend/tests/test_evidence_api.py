@@ -0,0 +1,333 @@
+"""Unit tests for the correlation API endpoints"""
+
+import asyncio
+import gc
+import httpx
+import orjson
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+from fastapi import FastAPI
+
+from src.api import evidence_api
+from src.models.correlation_models import (
+    CorrelatedCollection,
+    CorrelationRequest,
+    CorrelationResponse,
+    DetectionMethod,
+    EvidenceRelationship,
+    RelationshipType,
+    WorkStory
+)
+from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
+from src.models.evidence import EvidenceItem
+from src.services.database_service import get_database_service
+
+
+def make_item(item_id: str) -> UnifiedEvidenceItem:
+    """Create a test evidence item"""
+    return UnifiedEvidenceItem(
+        id=item_id,
+        team_member_id="user1",
+        source="gitlab_commit",
+        title=f"Item {item_id}",
+        description="Test description",
+        category="technical",
+        evidence_date=datetime(2024, 1, 15),
+        platform=PlatformType.GITLAB,
+        data_source=DataSourceType.API
+    )
+
+
+class FakeEngine:
+    """Correlation engine returning a canned response"""
+
+    def __init__(self, response: CorrelationResponse):
+        self.response = response
+
+    async def correlate_evidence(self, request):
+        return self.response
+
+
+async def post(app: FastAPI, path: str, payload: dict) -> httpx.Response:
+    """Call the app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(path, json=payload)
+
+
+class FakeDatabase:
+    """Database service returning fixed evidence rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def get_evidence_items(self, team_member_id, limit=100):
+        return self.rows
+
+
+class TestLoadEvidenceFromDatabase:
+    """Test mapping stored evidence rows into correlation items"""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_mapped_without_revalidation(self):
+        """Test ids, platforms, dates and text match what validation would produce"""
+        member_id = uuid4()
+        rows = [
+            EvidenceItem(
+                id=uuid4(),
+                team_member_id=member_id,
+                title=" Fix login ",
+                description="Auth fix",
+                source=source,
+                evidence_date=date(2024, 1, 15),
+                created_at=datetime(2024, 1, 16),
+                updated_at=datetime(2024, 1, 16)
+            )
+            for source in ("gitlab_mr", "jira_ticket", "document")
+        ]
+        blank = rows[0].model_copy(update={"id": uuid4(), "description": "   "})
+        request = CorrelationRequest(team_member_id=str(member_id))
+
+        await evidence_api._load_evidence_from_db(request, FakeDatabase(rows + [blank]))
+
+        items = request.evidence_items
+        assert [item.id for item in items] == [str(row.id) for row in rows]
+        assert [item.platform for item in items] == ["gitlab", "jira", "document"]
+        assert type(items[0].platform) is str and type(items[0].data_source) is str
+        assert items[0].team_member_id == str(member_id)
+        assert items[0].title == "Fix login"
+        assert items[0].evidence_date == datetime(2024, 1, 15)
+        assert items[0].data_source == DataSourceType.API
+        assert items[0].model_dump(mode="json")["evidence_date"] == "2024-01-15T00:00:00"
+
+
+class TestCorrelateStream:
+    """Test the NDJSON /correlate-stream endpoint"""
+
+    def setup_method(self):
+        """Serve the router without a database"""
+        self.app = FastAPI()
+        self.app.include_router(evidence_api.router, prefix="/api")
+        self.app.dependency_overrides[get_database_service] = lambda: None
+
+    @pytest.mark.asyncio
+    async def test_streams_one_record_per_line(self, monkeypatch):
+        """Test the summary comes first, followed by items, stories and relationships"""
+        items = [make_item("a"), make_item("b")]
+        relationship = EvidenceRelationship(
+            primary_evidence_id="a",
+            related_evidence_id="b",
+            relationship_type=RelationshipType.RELATED_TO,
+            confidence_score=0.8,
+            detection_method=DetectionMethod.CONTENT_ANALYSIS
+        )
+        story = WorkStory(title="Story", evidence_items=items, relationships=[relationship])
+        response = CorrelationResponse(
+            success=True,
+            correlated_collection=CorrelatedCollection(
+                evidence_items=items,
+                total_evidence_count=2,
+                work_stories=[story],
+                relationships=[relationship]
+            ),
+            processing_time_ms=5,
+            items_processed=2,
+            relationships_detected=1,
+            work_stories_created=1
+        )
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: FakeEngine(response))
+
+        result = await post(self.app, "/api/correlate-stream", {
+            "team_member_id": "user1",
+            "evidence_items": [item.model_dump(mode="json") for item in items]
+        })
+
+        assert result.status_code == 200
+        assert result.headers["content-type"] == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in result.content.splitlines()]
+        assert [line["type"] for line in lines] == [
+            "summary", "collection", "evidence_item", "evidence_item", "work_story", "relationship"
+        ]
+        assert "correlated_collection" not in lines[0]["data"]
+        assert lines[0]["data"]["work_stories_created"] == 1
+        assert lines[1]["data"]["total_evidence_count"] == 2
+        assert lines[4]["data"]["title"] == "Story"
+        assert lines[5]["data"]["id"] == relationship.id
+
+    @pytest.mark.asyncio
+    async def test_failed_correlation_streams_summary_only(self, monkeypatch):
+        """Test a response without a collection is a single summary line"""
+        response = CorrelationResponse(
+            success=False,
+            processing_time_ms=1,
+            items_processed=0,
+            relationships_detected=0,
+            work_stories_created=0,
+            errors=["No evidence items provided for correlation"]
+        )
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: FakeEngine(response))
+
+        result = await post(self.app, "/api/correlate-stream", {
+            "team_member_id": "user1",
+            "evidence_items": [make_item("a").model_dump(mode="json")]
+        })
+
+        lines = [orjson.loads(line) for line in result.content.splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["data"]["errors"] == ["No evidence items provided for correlation"]
+
+
+class CountingEngine:
+    """Correlation engine that blocks until released and counts calls"""
+
+    def __init__(self, response: CorrelationResponse):
+        self.response = response
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def correlate_evidence(self, request):
+        self.calls += 1
+        await self.release.wait()
+        return self.response
+
+
+class TestCorrelateSingleFlight:
+    """Test coalescing of identical concurrent correlation requests"""
+
+    def setup_method(self):
+        """Set up a canned response"""
+        self.response = CorrelationResponse(
+            success=True,
+            processing_time_ms=1,
+            items_processed=1,
+            relationships_detected=0,
+            work_stories_created=0
+        )
+
+    async def run_concurrently(self, engine: CountingEngine, requests):
+        """Start every request, then let the engine finish"""
+        tasks = [asyncio.ensure_future(evidence_api._correlate_single_flight(request, None)) for request in requests]
+        await asyncio.sleep(0)
+        engine.release.set()
+        return await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_run(self, monkeypatch):
+        """Test identical in-flight requests run the pipeline once"""
+        engine = CountingEngine(self.response)
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: engine)
+        item = make_item("a")
+
+        results = await self.run_concurrently(
+            engine, [CorrelationRequest(team_member_id="user1", evidence_items=[item]) for _ in range(3)]
+        )
+
+        assert engine.calls == 1
+        assert all(result is self.response for result in results)
+        assert evidence_api._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_requests_run_separately(self, monkeypatch):
+        """Test requests with different payloads are not coalesced"""
+        engine = CountingEngine(self.response)
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: engine)
+
+        await self.run_concurrently(engine, [
+            CorrelationRequest(team_member_id="user1", evidence_items=[make_item("a")]),
+            CorrelationRequest(team_member_id="user1", evidence_items=[make_item("b")])
+        ])
+
+        assert engine.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_abandoned_failure_is_retrieved(self, monkeypatch):
+        """Test a run that fails after every caller left is not reported as unretrieved"""
+        class FailingEngine(CountingEngine):
+            async def correlate_evidence(self, request):
+                await super().correlate_evidence(request)
+                raise RuntimeError("LLM down")
+
+        engine = FailingEngine(self.response)
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: engine)
+        unretrieved = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+
+        caller = asyncio.ensure_future(evidence_api._correlate_single_flight(
+            CorrelationRequest(team_member_id="user1", evidence_items=[make_item("a")]), None
+        ))
+        await asyncio.sleep(0)
+        task = evidence_api._inflight[next(iter(evidence_api._inflight))]
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        # Poll rather than await the task, which would retrieve the exception
+        engine.release.set()
+        while not task.done():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        del task, caller
+        gc.collect()
+
+        assert unretrieved == []
+        assert evidence_api._inflight == {}
+
+
+class TestLLMUsage:
+    """Test the /llm-usage endpoint"""
+
+    def setup_method(self):
+        """Serve the router without a database"""
+        self.app = FastAPI()
+        self.app.include_router(evidence_api.router, prefix="/api")
+
+    async def get_usage(self) -> dict:
+        """Fetch /llm-usage in-process"""
+        transport = httpx.ASGITransport(app=self.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return (await client.get("/api/llm-usage")).json()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_llm_returns_static_answer(self, monkeypatch):
+        """Test a missing LLM service is reported without reading a usage report"""
+        engine = type("Engine", (), {"llm_service": None})()
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: engine)
+
+        assert await self.get_usage() == {
+            "success": False,
+            "error": "LLM service not available",
+            "reason": "LLM service not initialized",
+            "fallback_mode": "rule-based"
+        }
+
+    @pytest.mark.asyncio
+    async def test_usage_report_fields(self, monkeypatch):
+        """Test only the public usage report fields are returned"""
+        report = {
+            "total_cost": 1.5,
+            "embedding_requests": 0,
+            "llm_requests": 0,
+            "budget_limit": 15.0,
+            "budget_remaining": 13.5,
+            "can_afford_llm_calls": True,
+            "cost_breakdown": {"embeddings_cost": 0.0, "llm_cost": 1.5},
+            "usage_period": {"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T23:59:59"},
+            "budget_utilization": 10.0
+        }
+
+        class Engine:
+            llm_service = object()
+
+            def get_llm_status(self):
+                return {"enabled": True, "status": "ready", "usage_report": report, "fallback_mode": None}
+
+        monkeypatch.setattr(evidence_api, "_engine", lambda enable_llm: Engine())
+
+        body = await self.get_usage()
+
+        assert body["success"] is True
+        assert body["usage_report"]["budget_remaining"] == 13.5
+        assert body["usage_report"]["usage_period"] == report["usage_period"]
+        assert "can_afford_llm_calls" not in body["usage_report"]
+        assert "budget_utilization" not in body["usage_report"]
@@ -0,0 +1,206 @@
+"""Unit tests for the GitLab evidence collection endpoints"""
+
+import asyncio
+import pytest
+from datetime import datetime
+import httpx
+from fastapi import FastAPI
+
+from src.api.endpoints import evidence
+from src.services.gitlab_hybrid_client import DataSource, EvidenceItem
+
+
+def make_item(item_id: str, source: str, data_source: DataSource, fallback_used: bool = False) -> EvidenceItem:
+    """Create a test GitLab evidence item"""
+    return EvidenceItem(
+        id=item_id,
+        team_member_id="dev",
+        source=source,
+        title=f"Item {item_id}",
+        description="",
+        source_url=None,
+        category="technical",
+        evidence_date=datetime(2024, 1, 15, 9, 30),
+        created_at=datetime(2024, 1, 16),
+        metadata={"state": "merged"},
+        data_source=data_source,
+        fallback_used=fallback_used
+    )
+
+
+class FakeGitLabClient:
+    """Stand-in for the shared hybrid client"""
+
+    def __init__(self, items):
+        self.items = items
+
+    async def get_comprehensive_evidence(self, username, days_back=7):
+        return self.items
+
+
+async def get(items, path: str, headers=None) -> httpx.Response:
+    """Call the evidence router in-process with a fake GitLab client"""
+    app = FastAPI()
+    app.include_router(evidence.router)
+    app.dependency_overrides[evidence.get_gitlab_client] = lambda: FakeGitLabClient(items)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+class TestCollectGitLabEvidence:
+    """Test the /gitlab/collect endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_collection_summary(self):
+        """Test the summary tallies sources, data sources and fallbacks"""
+        items = [
+            make_item("mr1", "gitlab_mr", DataSource.MCP),
+            make_item("mr2", "gitlab_mr", DataSource.API, fallback_used=True),
+            make_item("issue1", "gitlab_issue", DataSource.API, fallback_used=True),
+        ]
+
+        response = await get(items, "/api/evidence/gitlab/collect/dev")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["evidence_count"] == 3
+        assert body["collection_summary"] == {
+            "total_items": 3,
+            "merge_requests": 2,
+            "issues": 1,
+            "mcp_items": 1,
+            "api_items": 2,
+            "fallback_used": True
+        }
+        assert body["evidence"][0]["evidence_date"] == "2024-01-15T09:30:00"
+        assert body["evidence"][0]["metadata"] == {"state": "merged", "data_source": "mcp", "fallback_used": False}
+
+    @pytest.mark.asyncio
+    async def test_empty_collection(self):
+        """Test an empty collection reports zero counts and no fallback"""
+        body = (await get([], "/api/evidence/gitlab/collect/dev")).json()
+
+        assert body["collection_summary"]["total_items"] == 0
+        assert body["collection_summary"]["fallback_used"] is False
+
+
+class TestEvidenceStats:
+    """Test the in-process evidence statistics"""
+
+    @pytest.mark.asyncio
+    async def test_stats_count_distinct_collected_items(self, monkeypatch):
+        """Test collected evidence updates /stats once per distinct item"""
+        monkeypatch.setattr(evidence, "_evidence_stats", evidence.EvidenceStatsCache())
+        items = [
+            make_item("mr1", "gitlab_mr", DataSource.MCP),
+            make_item("issue1", "gitlab_issue", DataSource.API, fallback_used=True),
+        ]
+
+        assert (await get([], "/api/evidence/stats")).json()["total_evidence_items"] == 0
+
+        await get(items, "/api/evidence/gitlab/collect/dev")
+        await get(items[:1], "/api/evidence/gitlab/collect/dev")
+        stats = (await get([], "/api/evidence/stats")).json()
+
+        assert stats == {
+            "total_evidence_items": 2,
+            "sources": {"gitlab_mr": 1, "gitlab_issue": 1, "jira_ticket": 0},
+            "categories": {"technical": 2, "collaboration": 0, "delivery": 0},
+            "collection_methods": {"mcp": 1, "api": 1}
+        }
+
+    def test_seen_ids_are_bounded_and_expire(self, monkeypatch):
+        """Test the dedup set keeps only recent IDs and expired IDs count again"""
+        monkeypatch.setattr(evidence, "_STATS_DEDUP_MAX_ENTRIES", 2)
+        stats = evidence.EvidenceStatsCache()
+        items = [make_item(f"mr{index}", "gitlab_mr", DataSource.MCP) for index in range(3)]
+
+        stats.record(items)
+        assert list(stats._seen_ids) == ["mr1", "mr2"]
+        assert stats.snapshot()["total_evidence_items"] == 3
+
+        # mr2 is still fresh once, then its expired entry no longer dedups
+        monkeypatch.setattr(evidence, "STATS_DEDUP_TTL_SECONDS", -1.0)
+        stats.record(items[2:])
+        stats.record(items[2:])
+        assert stats.snapshot()["total_evidence_items"] == 4
+        assert stats.snapshot()["sources"]["gitlab_mr"] == 4
+
+
+class TestETags:
+    """Test conditional GETs on polled endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_stats_not_modified_until_counters_change(self, monkeypatch):
+        """Test a matching If-None-Match gets an empty 304 until new evidence arrives"""
+        monkeypatch.setattr(evidence, "_evidence_stats", evidence.EvidenceStatsCache())
+
+        first = await get([], "/api/evidence/stats")
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+
+        cached = await get([], "/api/evidence/stats", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        await get([make_item("mr1", "gitlab_mr", DataSource.MCP)], "/api/evidence/gitlab/collect/dev")
+        changed = await get([], "/api/evidence/stats", headers={"If-None-Match": etag})
+
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["total_evidence_items"] == 1
+
+    @pytest.mark.asyncio
+    async def test_strong_and_listed_tags_match(self):
+        """Test weak comparison across tag lists and strong forms"""
+        etag = (await get([], "/api/evidence/stats")).headers["etag"]
+        strong = etag.removeprefix("W/")
+
+        response = await get([], "/api/evidence/stats", headers={"If-None-Match": f'"other", {strong}'})
+
+        assert response.status_code == 304
+
+
+class TestHealthProbeCache:
+    """Test the TTL cache in front of GitLab health probes"""
+
+    def setup_method(self):
+        """Start every test with an empty cache"""
+        evidence.invalidate_health_cache()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_run_once(self):
+        """Test callers within the TTL share one probe call"""
+        calls = []
+
+        async def probe():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return True
+
+        results = await asyncio.gather(*(evidence._cached_probe(("mcp_health",), probe) for _ in range(5)))
+
+        assert results == [True] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_and_failed_probes_are_retried(self, monkeypatch):
+        """Test failures are not cached and expired entries are refreshed"""
+        results = iter([RuntimeError("down"), {"id": 1}, {"id": 2}])
+
+        async def probe():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with pytest.raises(RuntimeError):
+            await evidence._cached_probe(("project_details", "1"), probe)
+        assert await evidence._cached_probe(("project_details", "1"), probe) == {"id": 1}
+        assert await evidence._cached_probe(("project_details", "1"), probe) == {"id": 1}
+
+        monkeypatch.setattr(evidence, "HEALTH_CACHE_TTL_SECONDS", 0.0)
+        evidence.invalidate_health_cache()
+        assert await evidence._cached_probe(("project_details", "1"), probe) == {"id": 2}
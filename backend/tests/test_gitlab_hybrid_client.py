@@ -0,0 +1,98 @@
+"""Unit tests for the GitLab hybrid client"""
+
+import asyncio
+import httpx
+import pytest
+from datetime import datetime, timedelta
+
+from src.services.gitlab_hybrid_client import DataSource, EvidenceItem, create_gitlab_client
+
+
+def make_item(item_id: str, source: str, days_ago: int) -> EvidenceItem:
+    """Create a test GitLab evidence item"""
+    return EvidenceItem(
+        id=item_id,
+        team_member_id="dev",
+        source=source,
+        title=f"Item {item_id}",
+        description="",
+        source_url=None,
+        category="technical",
+        evidence_date=datetime(2024, 1, 15) - timedelta(days=days_ago),
+        created_at=datetime(2024, 1, 15),
+        metadata={},
+        data_source=DataSource.API,
+        fallback_used=True
+    )
+
+
+class TestGitLabHybridClient:
+    """Test GitLabHybridClient collection"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.client = create_gitlab_client("token", "123")
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_evidence_fetches_sources_concurrently(self, monkeypatch):
+        """Test merge requests and issues are fetched together and merged newest first"""
+        started = []
+        both_started = asyncio.Event()
+
+        async def fetch(items):
+            started.append(items[0].source)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return items
+
+        mrs = [make_item("mr1", "gitlab_mr", 3)]
+        issues = [make_item("issue1", "gitlab_issue", 1), make_item("issue2", "gitlab_issue", 5)]
+        monkeypatch.setattr(self.client, "get_merge_requests", lambda username, since: fetch(mrs))
+        monkeypatch.setattr(self.client, "get_issues", lambda username, since: fetch(issues))
+
+        evidence = await self.client.get_comprehensive_evidence("dev", days_back=7)
+
+        assert [item.id for item in evidence] == ["issue1", "mr1", "issue2"]
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_evidence_survives_failed_source(self, monkeypatch):
+        """Test one failing source does not drop the other's evidence"""
+        async def fail(username, since):
+            raise RuntimeError("boom")
+
+        async def issues(username, since):
+            return [make_item("issue1", "gitlab_issue", 1)]
+
+        monkeypatch.setattr(self.client, "get_merge_requests", fail)
+        monkeypatch.setattr(self.client, "get_issues", issues)
+
+        evidence = await self.client.get_comprehensive_evidence("dev")
+
+        assert [item.id for item in evidence] == ["issue1"]
+
+    @pytest.mark.asyncio
+    async def test_api_client_reuses_pooled_connection(self):
+        """Test the API fallback keeps one HTTP client until closed"""
+        api_client = self.client.api_client
+        http = api_client._get_http()
+
+        assert api_client._get_http() is http
+
+        await self.client.close()
+
+        assert http.is_closed
+        assert api_client._http is None
+
+    @pytest.mark.asyncio
+    async def test_injected_http_client_is_left_open(self):
+        """Test a shared HTTP client passed in is used but not closed by the GitLab client"""
+        shared = httpx.AsyncClient()
+        client = create_gitlab_client("token", "123", http_client=shared)
+
+        assert client.api_client._get_http() is shared
+
+        await client.close()
+
+        assert not shared.is_closed
+        await shared.aclose()
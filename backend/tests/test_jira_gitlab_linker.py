@@ -73,13 +73,12 @@ class TestJiraGitLabLinker:
             }
         )
     
-    @pytest.mark.asyncio
-    async def test_detect_issue_key_in_title(self):
+    def test_detect_issue_key_in_title(self):
         """Test detecting JIRA key in GitLab title"""
         jira_ticket = self.create_jira_ticket("TEST-123")
         gitlab_commit = self.create_gitlab_commit("TEST-123: Fix authentication bug")
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         assert len(relationships) == 1
         rel = relationships[0]
@@ -88,14 +87,13 @@ class TestJiraGitLabLinker:
         assert rel.confidence_score == 0.9  # High confidence for exact key match
         assert "TEST-123" in rel.evidence_summary
     
-    @pytest.mark.asyncio
-    async def test_detect_issue_key_in_description(self):
+    def test_detect_issue_key_in_description(self):
         """Test detecting JIRA key in GitLab description"""
         jira_ticket = self.create_jira_ticket("TEST-456")
         gitlab_commit = self.create_gitlab_commit("Fix bug")
         gitlab_commit.description = "This commit fixes the issue described in TEST-456"
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         assert len(relationships) == 1
         rel = relationships[0]
@@ -103,8 +101,7 @@ class TestJiraGitLabLinker:
         assert rel.detection_method == DetectionMethod.ISSUE_KEY
         assert "TEST-456" in rel.evidence_summary
     
-    @pytest.mark.asyncio
-    async def test_detect_branch_name_pattern(self):
+    def test_detect_branch_name_pattern(self):
         """Test detecting JIRA key in branch name"""
         jira_ticket = self.create_jira_ticket("PROJ-789")
         gitlab_commit = self.create_gitlab_commit(
@@ -112,7 +109,7 @@ class TestJiraGitLabLinker:
             branch="feature/PROJ-789-auth-fix"
         )
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         assert len(relationships) == 1
         rel = relationships[0]
@@ -121,8 +118,7 @@ class TestJiraGitLabLinker:
         assert rel.confidence_score == 0.9  # High confidence for key references
         assert "PROJ-789" in rel.evidence_summary
     
-    @pytest.mark.asyncio
-    async def test_content_similarity_detection(self):
+    def test_content_similarity_detection(self):
         """Test content similarity detection"""
         jira_ticket = self.create_jira_ticket("BUG-001")
         jira_ticket.title = "Authentication timeout issue"
@@ -135,7 +131,7 @@ class TestJiraGitLabLinker:
         # Ensure no JIRA key in branch name
         gitlab_commit.metadata["branch_name"] = "feature/auth-timeout-fix"
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         # Content similarity should be detected since no direct key references and high similarity
         assert len(relationships) >= 1
@@ -144,8 +140,7 @@ class TestJiraGitLabLinker:
         assert rel.detection_method == DetectionMethod.CONTENT_ANALYSIS
         assert rel.confidence_score > 0.3  # Should have some similarity
     
-    @pytest.mark.asyncio
-    async def test_temporal_proximity_detection(self):
+    def test_temporal_proximity_detection(self):
         """Test temporal proximity detection"""
         jira_ticket = self.create_jira_ticket("TIME-001")
         jira_ticket.evidence_date = datetime.now() - timedelta(hours=2)
@@ -156,15 +151,14 @@ class TestJiraGitLabLinker:
         gitlab_commit.team_member_id = "user1"  # Same author
         gitlab_commit.metadata["branch_name"] = "hotfix/urgent-issue"  # No JIRA key
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         # Should detect content similarity since no direct references
         # Note: temporal proximity and author correlation are not implemented in current version
         # The implementation only does content similarity as fallback
         assert len(relationships) >= 0  # May or may not find relationships based on content
     
-    @pytest.mark.asyncio
-    async def test_author_correlation_detection(self):
+    def test_author_correlation_detection(self):
         """Test author correlation detection"""
         jira_ticket = self.create_jira_ticket("AUTH-001")
         jira_ticket.metadata["assignee"] = "john.doe"
@@ -174,14 +168,13 @@ class TestJiraGitLabLinker:
         gitlab_commit.metadata["author"] = "john.doe"
         gitlab_commit.metadata["branch_name"] = "feature/new-feature"  # No JIRA key
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         # Current implementation only does content similarity as fallback
         # Author correlation is not implemented yet
         assert len(relationships) >= 0  # May or may not find relationships based on content
     
-    @pytest.mark.asyncio
-    async def test_multiple_detection_methods(self):
+    def test_multiple_detection_methods(self):
         """Test multiple detection methods for same relationship"""
         jira_ticket = self.create_jira_ticket("MULTI-123")
         
@@ -191,7 +184,7 @@ class TestJiraGitLabLinker:
         )
         gitlab_commit.description = "Resolves MULTI-123 by fixing the critical authentication bug"
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         # Should detect multiple methods but return unique relationships
         assert len(relationships) >= 1
@@ -201,8 +194,7 @@ class TestJiraGitLabLinker:
         assert rel.confidence_score >= 0.9
         assert "MULTI-123" in rel.evidence_summary
     
-    @pytest.mark.asyncio
-    async def test_no_relationships_detected(self):
+    def test_no_relationships_detected(self):
         """Test when no relationships should be detected"""
         jira_ticket = self.create_jira_ticket("UNRELATED-001")
         jira_ticket.title = "Database performance issue"
@@ -213,20 +205,19 @@ class TestJiraGitLabLinker:
         gitlab_commit.team_member_id = "different_user"
         gitlab_commit.evidence_date = datetime.now() - timedelta(days=30)
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         # Should not detect any strong relationships
         assert len(relationships) == 0 or all(r.confidence_score < 0.3 for r in relationships)
     
-    @pytest.mark.asyncio
-    async def test_multiple_jira_tickets(self):
+    def test_multiple_jira_tickets(self):
         """Test linking with multiple JIRA tickets"""
         jira1 = self.create_jira_ticket("TASK-001")
         jira2 = self.create_jira_ticket("TASK-002")
         
         gitlab_commit = self.create_gitlab_commit("TASK-001 TASK-002: Combined fix")
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira1, jira2])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira1, jira2])
         
         # Should detect relationships with both JIRA tickets
         assert len(relationships) >= 2
@@ -241,8 +232,7 @@ class TestJiraGitLabLinker:
         assert "TASK-001" in jira_keys_found
         assert "TASK-002" in jira_keys_found
     
-    @pytest.mark.asyncio
-    async def test_gitlab_mr_relationships(self):
+    def test_gitlab_mr_relationships(self):
         """Test relationships with GitLab merge requests"""
         jira_ticket = self.create_jira_ticket("MR-001")
         
@@ -251,7 +241,7 @@ class TestJiraGitLabLinker:
             branch="feature/MR-001-auth"
         )
         
-        relationships = await self.linker.detect_relationships([gitlab_mr], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_mr], [jira_ticket])
         
         assert len(relationships) >= 1
         rel = relationships[0]
@@ -259,14 +249,13 @@ class TestJiraGitLabLinker:
         assert rel.relationship_type == RelationshipType.SOLVES
         assert "MR-001" in rel.evidence_summary
     
-    @pytest.mark.asyncio
-    async def test_confidence_scoring(self):
+    def test_confidence_scoring(self):
         """Test confidence scoring logic"""
         # Test high confidence (exact key match in title)
         jira_ticket = self.create_jira_ticket("CONF-123")
         gitlab_commit = self.create_gitlab_commit("CONF-123: Exact match")
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         high_conf_rel = relationships[0]
         assert high_conf_rel.confidence_score >= 0.9
@@ -278,15 +267,14 @@ class TestJiraGitLabLinker:
         )
         gitlab_commit2.description = "Generic fix"  # No key in description
         
-        relationships2 = await self.linker.detect_relationships([gitlab_commit2], [jira_ticket])
+        relationships2 = self.linker.detect_relationships([gitlab_commit2], [jira_ticket])
         
         # Branch name detection is handled by issue key method, so still gets 0.9 confidence
         medium_conf_rel = relationships2[0]
         assert medium_conf_rel.confidence_score == 0.9  # Still high confidence for key detection
         assert medium_conf_rel.detection_method == DetectionMethod.ISSUE_KEY
     
-    @pytest.mark.asyncio
-    async def test_deduplication(self):
+    def test_deduplication(self):
         """Test that duplicate relationships are removed"""
         jira_ticket = self.create_jira_ticket("DUP-001")
         
@@ -297,7 +285,7 @@ class TestJiraGitLabLinker:
         )
         gitlab_commit.description = "This commit resolves DUP-001"
         
-        relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
         
         # Should only return one relationship despite multiple detection methods
         assert len(relationships) == 1
@@ -306,26 +294,24 @@ class TestJiraGitLabLinker:
         rel = relationships[0]
         assert rel.confidence_score >= 0.9
     
-    @pytest.mark.asyncio
-    async def test_edge_cases(self):
+    def test_edge_cases(self):
         """Test edge cases and error handling"""
         # Empty evidence list
-        relationships = await self.linker.detect_relationships([], [])
+        relationships = self.linker.detect_relationships([], [])
         assert len(relationships) == 0
         
         # Single evidence item
         jira_ticket = self.create_jira_ticket("SINGLE-001")
-        relationships = await self.linker.detect_relationships([], [jira_ticket])
+        relationships = self.linker.detect_relationships([], [jira_ticket])
         assert len(relationships) == 0
         
         # Only GitLab items (no JIRA)
         gitlab1 = self.create_gitlab_commit("Fix bug")
         gitlab2 = self.create_gitlab_commit("Add feature")
-        relationships = await self.linker.detect_relationships([gitlab1, gitlab2], [])
+        relationships = self.linker.detect_relationships([gitlab1, gitlab2], [])
         assert len(relationships) == 0  # No JIRA tickets to link to
     
-    @pytest.mark.asyncio
-    async def test_jira_key_patterns(self):
+    def test_jira_key_patterns(self):
         """Test various JIRA key patterns"""
         test_cases = [
             ("PROJ-123", "PROJ-123: Standard format"),
@@ -338,8 +324,113 @@ class TestJiraGitLabLinker:
             jira_ticket = self.create_jira_ticket(jira_key)
             gitlab_commit = self.create_gitlab_commit(commit_title)
             
-            relationships = await self.linker.detect_relationships([gitlab_commit], [jira_ticket])
+            relationships = self.linker.detect_relationships([gitlab_commit], [jira_ticket])
             
             assert len(relationships) >= 1, f"Failed to detect {jira_key}"
             # Check that JIRA key is mentioned in evidence summary
-            assert jira_key in relationships[0].evidence_summary or relationships[0].detection_method == DetectionMethod.CONTENT_ANALYSIS 
\ No newline at end of file
+            assert jira_key in relationships[0].evidence_summary or relationships[0].detection_method == DetectionMethod.CONTENT_ANALYSIS
+    
+    def test_prefix_sharing_jira_keys(self):
+        """Test that keys sharing a prefix are matched exactly"""
+        jira_short = self.create_jira_ticket("PREF-12")
+        jira_long = self.create_jira_ticket("PREF-123")
+        
+        gitlab_commit = self.create_gitlab_commit("PREF-123: Update handler")
+        
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_short, jira_long])
+        
+        key_relationships = [r for r in relationships if r.detection_method == DetectionMethod.ISSUE_KEY]
+        assert len(key_relationships) == 1
+        assert key_relationships[0].related_evidence_id == jira_long.id
+        assert key_relationships[0].metadata["found_in"] == ["title"]
+    
+    def test_content_similarity_batch_pairs(self):
+        """Test content similarity pairs each GitLab item with its matching ticket"""
+        jira_auth = self.create_jira_ticket("BATCH-001")
+        jira_auth.title = "Authentication timeout issue"
+        jira_auth.description = "Users experiencing session timeout during login"
+        jira_cache = self.create_jira_ticket("BATCH-002")
+        jira_cache.title = "Redis cache eviction"
+        jira_cache.description = "Cache entries evicted before expiry window"
+        
+        commit_auth = self.create_gitlab_commit("Fix authentication timeout issue", branch="feature/auth")
+        commit_auth.description = "Fixed session timeout during login authentication"
+        commit_cache = self.create_gitlab_commit("Tune redis cache eviction", branch="feature/cache")
+        commit_cache.description = "Cache entries evicted before expiry"
+        
+        relationships = self.linker.detect_relationships(
+            [commit_auth, commit_cache], [jira_auth, jira_cache]
+        )
+        
+        pairs = {(r.primary_evidence_id, r.related_evidence_id) for r in relationships}
+        assert pairs == {(commit_auth.id, jira_auth.id), (commit_cache.id, jira_cache.id)}
+        assert all(r.detection_method == DetectionMethod.CONTENT_ANALYSIS for r in relationships)
+    
+    def test_jira_key_map_title_and_fallbacks(self):
+        """Test key map takes title keys first, then metadata and description"""
+        titled = self.create_jira_ticket("MAP-1")
+        from_metadata = self.create_jira_ticket("MAP-2")
+        from_metadata.title = "Ticket without key in title"
+        from_description = self.create_jira_ticket("MAP-3")
+        from_description.title = "Another plain title"
+        from_description.description = "Tracked as MAP-3 in the backlog"
+        from_description.metadata = {}
+        
+        jira_key_map = self.linker._create_jira_key_map([titled, from_metadata, from_description])
+        
+        assert jira_key_map == {
+            "MAP-1": titled,
+            "MAP-2": from_metadata,
+            "MAP-3": from_description
+        }
+
+    def test_jira_key_ignores_non_string_metadata(self):
+        """Test an unhashable metadata key falls back to the description"""
+        ticket = self.create_jira_ticket("MAP-4")
+        ticket.title = "Plain title"
+        ticket.description = "Tracked as MAP-4"
+        ticket.metadata = {"key": ["MAP-4", "MAP-5"]}
+
+        assert self.linker._extract_jira_key_from_item(ticket) == "MAP-4"
+
+    def test_branch_name_pattern_detection(self):
+        """Test branch name strategy finds the key once per branch"""
+        jira_ticket = self.create_jira_ticket("BR-42")
+        jira_key_map = {"BR-42": jira_ticket}
+        
+        for branch in ("feature/BR-42-login", "hotfix/BR-42", "BR-42_cleanup", "users/dev/BR-42"):
+            gitlab_commit = self.create_gitlab_commit("Update login", branch=branch)
+            
+            relationships = self.linker._detect_branch_name_patterns(gitlab_commit, [jira_ticket], jira_key_map)
+            
+            assert len(relationships) == 1, f"Failed for branch {branch}"
+            assert relationships[0].detection_method == DetectionMethod.BRANCH_NAME
+            assert relationships[0].metadata["jira_key"] == "BR-42"
+    
+    def test_relationship_type_keywords_match_whole_words(self):
+        """Test solve/reference keywords only count as whole words"""
+        jira_ticket = self.create_jira_ticket("WORD-7")
+        
+        prefixed = self.create_gitlab_commit("WORD-7: Add prefix to cache keys")
+        referenced = self.create_gitlab_commit("See WORD-7 for background")
+        
+        prefixed_rel = self.linker.detect_relationships([prefixed], [jira_ticket])[0]
+        referenced_rel = self.linker.detect_relationships([referenced], [jira_ticket])[0]
+        
+        assert prefixed_rel.relationship_type == RelationshipType.RELATED_TO
+        assert referenced_rel.relationship_type == RelationshipType.REFERENCES
+    
+    def test_automaton_matches_like_regex(self, monkeypatch):
+        """Test the Aho-Corasick matcher finds the same keys as the regex alternation"""
+        pytest.importorskip("ahocorasick")
+        from src.algorithms import jira_gitlab_linker
+        
+        monkeypatch.setattr(jira_gitlab_linker, "_AUTOMATON_MIN_KEYS", 1)
+        jira_short = self.create_jira_ticket("AHO-1")
+        jira_long = self.create_jira_ticket("AHO-12")
+        gitlab_commit = self.create_gitlab_commit("AHO-12: Fix parser, see AHO-1", branch="feature/AHO-123")
+        
+        relationships = self.linker.detect_relationships([gitlab_commit], [jira_short, jira_long])
+        
+        found = {r.metadata["jira_key"]: r.metadata["found_in"] for r in relationships}
+        assert found == {"AHO-12": ["title"], "AHO-1": ["title"]}
@@ -5,6 +5,7 @@ Tests the 3-tier cost-optimized correlation pipeline
 
 import pytest
 import asyncio
+import httpx
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timezone, timedelta
 from typing import List
@@ -12,7 +13,9 @@ from typing import List
 from src.services.llm_correlation_service import (
     LLMCorrelationService, 
     EmbeddingService, 
+    EmbeddingBatcher,
     CostTracker,
+    create_http_client,
     create_llm_correlation_service
 )
 from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
@@ -123,6 +126,98 @@ class TestEmbeddingService:
         
         assert embeddings == []
 
+class TestEmbeddingBatcher:
+    """Test coalescing of concurrent embedding requests"""
+    
+    @pytest.fixture
+    def embedding_service(self):
+        service = Mock()
+        service.get_embeddings = AsyncMock(side_effect=lambda texts: [[float(len(text))] for text in texts])
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self, embedding_service):
+        batcher = EmbeddingBatcher(embedding_service, max_delay=0.01)
+        
+        first, second = await asyncio.gather(
+            batcher.get_embeddings(["a", "bb"]),
+            batcher.get_embeddings(["bb", "ccc"])
+        )
+        
+        assert first == [[1.0], [2.0]]
+        assert second == [[2.0], [3.0]]
+        # Duplicate texts are embedded once
+        embedding_service.get_embeddings.assert_awaited_once_with(["a", "bb", "ccc"])
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self, embedding_service):
+        batcher = EmbeddingBatcher(embedding_service, max_batch_size=2, max_delay=60)
+        
+        result = await asyncio.wait_for(batcher.get_embeddings(["a", "bb"]), timeout=1)
+        
+        assert result == [[1.0], [2.0]]
+    
+    @pytest.mark.asyncio
+    async def test_failed_call_returns_empty_for_every_caller(self, embedding_service):
+        embedding_service.get_embeddings = AsyncMock(return_value=[])
+        batcher = EmbeddingBatcher(embedding_service, max_delay=0.01)
+        
+        results = await asyncio.gather(batcher.get_embeddings(["a"]), batcher.get_embeddings(["b"]))
+        
+        assert results == [[], []]
+
+class TestSharedHTTPClient:
+    """Test the API clients share one HTTP connection pool"""
+    
+    @pytest.fixture
+    def sdk_mocks(self):
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'ANTHROPIC_API_KEY': 'test-key'}), \
+             patch('src.services.llm_correlation_service.EmbeddingService') as embedding, \
+             patch('src.services.llm_correlation_service.Anthropic') as anthropic, \
+             patch('src.services.llm_correlation_service.OpenAI') as openai_client:
+            yield embedding, anthropic, openai_client
+    
+    def test_injected_client_is_shared_and_left_open(self, sdk_mocks):
+        embedding, anthropic, openai_client = sdk_mocks
+        shared = httpx.Client()
+        
+        service = LLMCorrelationService(http_client=shared)
+        
+        embedding.assert_called_once_with(http_client=shared)
+        assert anthropic.call_args.kwargs['http_client'] is shared
+        assert openai_client.call_args.kwargs['http_client'] is shared
+        
+        service.close()
+        assert not shared.is_closed
+        shared.close()
+    
+    def test_owned_client_is_closed(self, sdk_mocks):
+        service = LLMCorrelationService()
+        
+        service.close()
+        
+        assert service.http_client.is_closed
+    
+    def test_owned_client_is_closed_when_init_fails(self, sdk_mocks):
+        embedding, _, _ = sdk_mocks
+        embedding.side_effect = ValueError("OpenAI API key not configured")
+        owned = httpx.Client()
+        
+        with patch('src.services.llm_correlation_service.create_http_client', return_value=owned):
+            with pytest.raises(ValueError):
+                LLMCorrelationService()
+        
+        assert owned.is_closed
+    
+    def test_sdk_default_timeout_is_kept(self):
+        from openai import OpenAI
+        from openai._constants import DEFAULT_TIMEOUT
+        
+        with create_http_client() as http_client:
+            client = OpenAI(api_key='test-key', http_client=http_client)
+            
+            assert client.timeout == DEFAULT_TIMEOUT
+
 class TestLLMCorrelationService:
     """Test main LLM correlation service functionality"""
     
@@ -0,0 +1,181 @@
+"""Unit tests for TechnologyDetector algorithm"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.algorithms import technology_detector
+from src.algorithms.technology_detector import TechnologyDetector, _literal_pattern
+from src.models.correlation_models import WorkStory
+from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
+
+
+class TestTechnologyDetector:
+    """Test TechnologyDetector algorithm"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.detector = TechnologyDetector()
+
+    def create_item(self, title: str, description: str = "Test description",
+                    metadata: dict = None, days_ago: int = 1) -> UnifiedEvidenceItem:
+        """Create a test GitLab evidence item"""
+        return UnifiedEvidenceItem(
+            id=f"item_{hash((title, description, days_ago))}",
+            team_member_id="user1",
+            source="gitlab_commit",
+            title=title,
+            description=description,
+            category="technical",
+            evidence_date=datetime(2024, 1, 15) - timedelta(days=days_ago),
+            platform=PlatformType.GITLAB,
+            data_source=DataSourceType.API,
+            metadata=metadata or {}
+        )
+
+    def test_detect_from_content(self):
+        """Test technology detection from title and description"""
+        item = self.create_item(
+            "Add Redis cache to FastAPI service",
+            "Deploy with Docker and run pytest"
+        )
+
+        technologies = self.detector._detect_from_content(item)
+
+        assert {"Redis", "FastAPI", "Docker", "Pytest"} <= technologies
+        assert "Django" not in technologies
+
+    def test_detect_from_content_respects_word_boundaries(self):
+        """Test that patterns anchored on word boundaries do not match substrings"""
+        item = self.create_item("Update gitignore and pipeline", "Minor housekeeping")
+
+        technologies = self.detector._detect_from_content(item)
+
+        assert "Git" not in technologies
+        assert "pip" not in technologies
+
+    def test_detect_from_metadata_labels(self):
+        """Test technology detection from labels"""
+        item = self.create_item(
+            "Routine change",
+            metadata={"labels": ["kubernetes", "PostgreSQL"], "tags": "flutter"}
+        )
+
+        technologies = self.detector._detect_from_metadata(item)
+
+        assert technologies == {"Kubernetes", "PostgreSQL", "Flutter"}
+
+    def test_detect_overlapping_technologies(self):
+        """Test that technologies sharing a match position are all reported"""
+        item = self.create_item("Upgrade react native bridge", "Touches the gitlab-ci config")
+
+        technologies = self.detector._detect_from_content(item)
+
+        assert {"React", "React Native", "GitLab CI"} <= technologies
+
+    def test_matcher_agrees_with_individual_patterns(self):
+        """Test that the matcher finds the same set as per-pattern search"""
+        text = ("next-auth on node with express, mongo and elastic; docker compose, "
+                "kubectl apply, aws lambda, google cloud run, .github/workflows, "
+                "ruby on rails and spring-boot, react-native app, ios swift build")
+
+        expected = {
+            tech for tech, compiled in self.detector._compiled_patterns.items()
+            if any(cre.search(text) for cre in compiled)
+        }
+
+        assert self.detector._match_technologies(text) == expected
+
+    def test_literal_pattern_split(self):
+        """Test which patterns are treated as plain literals"""
+        assert _literal_pattern(r'\breact\b') == ('react', True, True)
+        assert _literal_pattern(r'\.vue') == ('.vue', False, False)
+        assert _literal_pattern(r'\.github/workflows') == ('.github/workflows', False, False)
+        assert _literal_pattern(r'react.?native') is None
+        assert _literal_pattern(r'\bnext\.?js\b') is None
+
+    def test_automaton_and_regex_matchers_agree(self, monkeypatch):
+        """Test that the Aho-Corasick path matches the regex-only fallback"""
+        pytest.importorskip("ahocorasick")
+        text = ("next.js frontend, vue-router and @angular/core, psql migration, "
+                "objective-c bridge, gitignore tweak, pipeline via gitlab ci, jsx")
+
+        automaton_detector = TechnologyDetector()
+        monkeypatch.setattr(technology_detector, "ahocorasick", None)
+        regex_detector = TechnologyDetector()
+
+        assert automaton_detector._literal_automaton is not None
+        assert regex_detector._literal_automaton is None
+        assert automaton_detector._match_technologies(text) == regex_detector._match_technologies(text)
+
+    def test_detect_from_file_extensions(self):
+        """Test technology detection from changed file paths"""
+        item = self.create_item(
+            "Routine change",
+            metadata={
+                "files_changed": ["src/App.TSX", "api/main.py", "deploy/Dockerfile", "README"],
+                "added_files": "infra/main.tf"
+            }
+        )
+
+        technologies = self.detector._detect_from_file_extensions(item)
+
+        assert technologies == {"React", "Python", "Docker", "Terraform"}
+
+    def test_detect_skill_level(self):
+        """Test skill level heuristic over story content"""
+        story = WorkStory(
+            title="Redis work",
+            evidence_items=[
+                self.create_item("Add Redis cache", "Performance optimization", days_ago=3),
+                self.create_item("Tune REDIS eviction", "Scalable architecture", days_ago=2),
+                self.create_item("Redis cleanup", "Remove dead keys", days_ago=1),
+            ]
+        )
+
+        assert self.detector.detect_skill_level(story, "Redis") == "advanced"
+        assert self.detector.detect_skill_level(story, "Django") == "beginner"
+
+    def test_content_complexity_counts_distinct_indicators(self):
+        """Test complexity scoring counts each indicator once, as substrings"""
+        story = WorkStory(
+            title="Service work",
+            evidence_items=[
+                self.create_item("Distributed cache rapid rollout", "Database performance"),
+                self.create_item("Performance follow-up", "Distributed tracing", days_ago=2),
+            ]
+        )
+
+        # high: distributed, performance; medium: api (in "rapid"), database
+        assert self.detector._analyze_content_complexity(story) == pytest.approx(0.16)
+
+        story.evidence_items.append(self.create_item("Fix typo", "Minor bug fix", days_ago=3))
+        assert self.detector._analyze_content_complexity(story) == pytest.approx(0.08)
+
+    def test_generate_technology_insights(self):
+        """Test technology insights aggregate usage, sources and date range"""
+        first = self.create_item("Add Redis cache", days_ago=10)
+        second = self.create_item("Redis tuning", days_ago=2)
+        third = self.create_item("FastAPI endpoint", days_ago=5)
+        stories = [
+            WorkStory(title="Cache", evidence_items=[first, second], technology_stack=["Redis", "Python"]),
+            WorkStory(title="API", evidence_items=[third, second], technology_stack=["Python"]),
+        ]
+
+        insights = self.detector.generate_technology_insights(stories)
+        by_tech = {insight.technology: insight for insight in insights}
+
+        assert insights[0].technology == "Python"
+        assert by_tech["Python"].usage_count == 2
+        assert sorted(by_tech["Python"].evidence_sources) == sorted({first.id, second.id, third.id})
+        assert by_tech["Python"].first_seen == first.evidence_date
+        assert by_tech["Python"].last_seen == second.evidence_date
+        assert by_tech["Redis"].first_seen == first.evidence_date
+        assert by_tech["Redis"].confidence_score == pytest.approx(0.1)
+
+    def test_technology_names_are_interned(self):
+        """Test detected names are the shared interned vocabulary objects"""
+        names = {name: name for name in self.detector.technology_names}
+        item = self.create_item("React Native app", metadata={"files_changed": ["App.tsx"]})
+
+        for tech in self.detector._detect_from_content(item) | self.detector._detect_from_file_extensions(item):
+            assert tech is names[tech]
@@ -0,0 +1,164 @@
+"""Unit tests for TimelineAnalyzer algorithm"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.algorithms.timeline_analyzer import TimelineAnalyzer, _partition
+from src.models.correlation_models import WorkStory
+from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
+
+
+class TestTimelineAnalyzer:
+    """Test TimelineAnalyzer algorithm"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.analyzer = TimelineAnalyzer()
+        self.base_date = datetime(2024, 1, 15, 10, 0)  # A Monday
+
+    def create_item(self, days: float, platform: PlatformType = PlatformType.GITLAB,
+                    source: str = "gitlab_commit", title: str = "Test item") -> UnifiedEvidenceItem:
+        """Create a test evidence item dated relative to the base date"""
+        return UnifiedEvidenceItem(
+            id=f"{platform}_{source}_{days}",
+            team_member_id="user1",
+            source=source,
+            title=title,
+            description="Test description",
+            category="technical",
+            evidence_date=self.base_date + timedelta(days=days),
+            platform=platform,
+            data_source=DataSourceType.API,
+        )
+
+    def test_detect_development_patterns(self):
+        """Test day, platform and intensity metrics from one pass"""
+        items = [
+            self.create_item(0),
+            self.create_item(1, PlatformType.JIRA, "jira_ticket"),
+            self.create_item(7),
+            self.create_item(2),
+        ]
+
+        patterns = self.analyzer._detect_development_patterns(items)
+
+        assert patterns["day_distribution"] == {"Monday": 2, "Tuesday": 1, "Wednesday": 1}
+        assert patterns["platform_distribution"] == {PlatformType.GITLAB: 3, PlatformType.JIRA: 1}
+        assert patterns["activities_per_day"] == pytest.approx(4 / 8)
+
+    def test_detect_development_patterns_empty(self):
+        """Test that no items yields empty distributions and no intensity"""
+        patterns = self.analyzer._detect_development_patterns([])
+
+        assert patterns == {"day_distribution": {}, "platform_distribution": {}}
+
+    def test_calculate_work_velocity(self):
+        """Test weekly buckets follow Monday-aligned calendar weeks"""
+        items = [
+            self.create_item(-1),   # Sunday, previous week
+            self.create_item(0),    # Monday
+            self.create_item(6),    # Sunday, same week as Monday
+            self.create_item(6.5),
+            self.create_item(21),   # Two weeks later; the gap week is not counted
+        ]
+
+        velocity = self.analyzer._calculate_work_velocity(items)
+
+        assert velocity == {
+            "avg_weekly_activity": pytest.approx(5 / 3),
+            "max_weekly_activity": 3,
+            "min_weekly_activity": 1,
+            "velocity_consistency": pytest.approx(1 / 3),
+        }
+        assert type(velocity["max_weekly_activity"]) is int
+        assert self.analyzer._calculate_work_velocity([]) == {}
+
+    def test_detect_sprint_boundaries(self):
+        """Test sprints split on gaps of more than three days once they have three items"""
+        offsets = [0, 1, 2, 10, 11, 20, 21, 22, 23, 40, 41]
+        items = [self.create_item(days) for days in reversed(offsets)]
+
+        sprints = self.analyzer.detect_sprint_boundaries(items)
+
+        # The 10/11 pair is too small to close on its own and joins the next run
+        assert [(s["item_count"], s["duration_days"]) for s in sprints] == [(3, 2), (6, 13)]
+        assert sprints[0]["start_date"] == self.base_date
+        assert sprints[1]["end_date"] == self.base_date + timedelta(days=23)
+        assert self.analyzer.detect_sprint_boundaries([]) == []
+
+    def test_analyze_overall_patterns(self):
+        """Test commit frequency and ticket resolution patterns"""
+        stories = [
+            WorkStory(title="Story one", evidence_items=[
+                self.create_item(0),
+                self.create_item(0.2),
+                self.create_item(3),
+                self.create_item(1, source="gitlab_mr"),
+                self.create_item(5, source="gitlab_mr"),
+                self.create_item(-2, PlatformType.JIRA, "jira_ticket"),
+                self.create_item(6, PlatformType.JIRA, "jira_ticket"),
+            ]),
+            WorkStory(title="Story two", evidence_items=[
+                self.create_item(10),
+                self.create_item(11, PlatformType.JIRA, "jira_ticket"),
+            ]),
+        ]
+
+        patterns = self.analyzer.analyze_overall_patterns(stories)
+        by_type = {pattern.pattern_type: pattern for pattern in patterns}
+
+        commit = by_type["commit_frequency"]
+        assert commit.frequency == pytest.approx(6 / 5)
+        assert commit.evidence_count == 6
+        assert commit.time_period == {"start": self.base_date, "end": self.base_date + timedelta(days=10)}
+
+        resolution = by_type["ticket_resolution"]
+        assert resolution.frequency == pytest.approx(1 / 4)
+        assert resolution.evidence_count == 2
+
+    def test_analyze_cross_platform_timing(self):
+        """Test JIRA/GitLab date ranges come from the sorted partitions"""
+        items = [
+            self.create_item(3),
+            self.create_item(-2, PlatformType.JIRA, "jira_ticket"),
+            self.create_item(9),
+            self.create_item(12, PlatformType.JIRA, "jira_ticket"),
+            self.create_item(1),
+        ]
+
+        gitlab_items, jira_items, other_items = _partition(sorted(items, key=lambda item: item.evidence_date))
+        timing = self.analyzer._analyze_cross_platform_timing(gitlab_items, jira_items)
+
+        assert timing == {
+            "jira_to_gitlab_delay_days": 3,
+            "development_duration_days": 8,
+            "total_cycle_time_days": 14,
+        }
+        assert [item.evidence_date.day for item in gitlab_items] == [16, 18, 24]
+        assert len(jira_items) == 2 and other_items == []
+        assert self.analyzer._analyze_cross_platform_timing(gitlab_items, []) == {}
+
+    def test_analyze_work_sequence_truncates_long_titles(self):
+        """Test sequence entries keep short titles and cut long ones at 50 chars"""
+        long_title = "x" * 60
+        items = [self.create_item(0, title=long_title), self.create_item(1, title="Short title")]
+
+        sequence = self.analyzer._analyze_work_sequence(items)
+
+        assert [entry["title"] for entry in sequence["sequence"]] == ["x" * 50 + "...", "Short title"]
+        assert sequence["duration_days"] == 1
+
+    def test_analyze_work_story(self):
+        """Test the per-story analysis wires every helper together"""
+        story = WorkStory(title="Story", evidence_items=[
+            self.create_item(-1, PlatformType.JIRA, "jira_ticket"),
+            self.create_item(0),
+            self.create_item(2),
+        ])
+
+        result = self.analyzer.analyze_work_story(story)
+
+        assert result["timeline"]["cross_platform_timing"]["jira_to_gitlab_delay_days"] == 1
+        assert result["timeline"]["work_sequence"]["patterns"] == ["ticket_driven_development", "quick_turnaround"]
+        assert result["patterns"]["velocity_metrics"]["max_weekly_activity"] == 2
+        assert self.analyzer.analyze_work_story(WorkStory(title="Empty")) == {"timeline": {}, "patterns": {}}
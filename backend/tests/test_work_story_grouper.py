@@ -0,0 +1,210 @@
+"""Unit tests for WorkStoryGrouper algorithm"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.algorithms.work_story_grouper import WorkStoryGrouper
+from src.models.correlation_models import (
+    EvidenceRelationship,
+    RelationshipType,
+    DetectionMethod,
+    CorrelationRequest
+)
+from src.models.unified_evidence import UnifiedEvidenceItem, PlatformType, DataSourceType
+
+
+class TestWorkStoryGrouper:
+    """Test WorkStoryGrouper algorithm"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.grouper = WorkStoryGrouper()
+        self.base_date = datetime(2024, 1, 15, 10, 0)
+
+    def create_item(self, item_id: str, platform: PlatformType = PlatformType.GITLAB,
+                    days: float = 0, title: str = None, metadata: dict = None) -> UnifiedEvidenceItem:
+        """Create a test evidence item"""
+        is_jira = platform == PlatformType.JIRA
+        return UnifiedEvidenceItem(
+            id=item_id,
+            team_member_id="user1",
+            source="jira_ticket" if is_jira else "gitlab_commit",
+            title=title or f"Item {item_id}",
+            description="Test description",
+            category="technical",
+            evidence_date=self.base_date + timedelta(days=days),
+            platform=platform,
+            data_source=DataSourceType.API,
+            metadata=metadata or {}
+        )
+
+    def create_relationship(self, primary: str, related: str, confidence: float = 0.9,
+                            relationship_type: RelationshipType = RelationshipType.SOLVES) -> EvidenceRelationship:
+        """Create a test relationship"""
+        return EvidenceRelationship(
+            primary_evidence_id=primary,
+            related_evidence_id=related,
+            relationship_type=relationship_type,
+            confidence_score=confidence,
+            detection_method=DetectionMethod.ISSUE_KEY
+        )
+
+    def test_components_via_union_find(self):
+        """Test components of the relationship graph, including outside endpoints"""
+        items = [self.create_item(f"i{index}") for index in range(6)]
+        relationships = [
+            self.create_relationship("i0", "i1"),
+            self.create_relationship("i2", "i1"),
+            self.create_relationship("i3", "i4"),
+            self.create_relationship("i4", "external"),
+        ]
+
+        components = self.grouper._components_via_union_find(items, relationships)
+
+        assert sorted(map(sorted, components)) == [["external", "i3", "i4"], ["i0", "i1", "i2"], ["i5"]]
+
+        components = self.grouper._components_via_union_find(items, relationships, min_size=2)
+
+        assert sorted(map(sorted, components)) == [["external", "i3", "i4"], ["i0", "i1", "i2"]]
+
+    def test_components_via_union_find_long_chain(self):
+        """Test a long chain collapses into one component"""
+        size = 5000
+        items = [self.create_item(f"i{index}") for index in range(size)]
+        relationships = [self.create_relationship(f"i{index}", f"i{index + 1}") for index in range(size - 1)]
+
+        components = self.grouper._components_via_union_find(items, relationships)
+
+        assert len(components) == 1
+        assert len(components[0]) == size
+
+    @pytest.mark.asyncio
+    async def test_create_work_stories(self):
+        """Test stories are built per component and ordered by size"""
+        items = [
+            self.create_item("jira1", PlatformType.JIRA, days=-3, title="PROJ-1: Login flow",
+                             metadata={"key": "PROJ-1", "status": "Done", "assignee": "alice"}),
+            self.create_item("mr1", days=-1, title="PROJ-1 implement login", metadata={"author": "bob"}),
+            self.create_item("c1", days=0, title="PROJ-1 fix tests", metadata={"author": "bob"}),
+            self.create_item("jira2", PlatformType.JIRA, days=-10, title="PROJ-2: Search",
+                             metadata={"key": "PROJ-2", "status": "Blocked"}),
+            self.create_item("mr2", days=-8, title="Search backend"),
+            self.create_item("lonely", days=-30, title="Unrelated"),
+        ]
+        relationships = [
+            self.create_relationship("mr1", "jira1"),
+            self.create_relationship("c1", "jira1", relationship_type=RelationshipType.REFERENCES),
+            self.create_relationship("mr2", "jira2"),
+            self.create_relationship("lonely", "jira2", confidence=0.2),
+        ]
+
+        stories = await self.grouper.create_work_stories(items, relationships, CorrelationRequest(team_member_id="user1"))
+
+        assert len(stories) == 2
+        first, second = stories
+        assert {item.id for item in first.evidence_items} == {"jira1", "mr1", "c1"}
+        assert first.title == "PROJ-1: Login flow"
+        assert first.primary_jira_ticket == "PROJ-1"
+        assert first.status == "completed"
+        assert sorted(first.team_members_involved) == ["alice", "bob"]
+        assert first.primary_platform == PlatformType.GITLAB
+        assert first.complexity_score == pytest.approx(0.5)
+        assert first.timeline["start"] == self.base_date - timedelta(days=3)
+        assert first.timeline["last_gitlab_activity"] == self.base_date
+        assert first.duration == timedelta(days=3)
+        assert len(first.relationships) == 2
+
+        assert {item.id for item in second.evidence_items} == {"jira2", "mr2"}
+        assert second.primary_jira_ticket == "PROJ-2"
+        assert second.status == "blocked"
+
+        limited = await self.grouper.create_work_stories(
+            items, relationships, CorrelationRequest(team_member_id="user1", max_work_stories=1)
+        )
+        assert [story.title for story in limited] == [first.title]
+
+    @pytest.mark.asyncio
+    async def test_create_work_stories_drops_unrelated_items(self):
+        """Test items of sub-threshold components do not become stories"""
+        items = [
+            self.create_item("c1", days=0, title="Tidy config"),
+            self.create_item("c2", days=2, title="Bump dependencies"),
+            self.create_item("old", days=-30, title="Old change"),
+        ]
+
+        stories = await self.grouper.create_work_stories(items, [], CorrelationRequest(team_member_id="user1"))
+
+        assert stories == []
+
+    def test_summarize_component_status_fallback(self):
+        """Test status falls back to recent activity when JIRA has no known status"""
+        now = datetime.utcnow()
+        recent = self.create_item("recent", PlatformType.JIRA, metadata={"status": "Triage"})
+        recent.evidence_date = now - timedelta(days=2)
+        stale = self.create_item("stale")
+        stale.evidence_date = now - timedelta(days=40)
+
+        assert self.grouper._summarize_component([stale, recent]).status == "in_progress"
+        assert self.grouper._summarize_component([stale]).status == "unknown"
+
+        # (now - date).days <= 7 still counts an item seven and a half days old
+        stale.evidence_date = now - timedelta(days=7, hours=12)
+        assert self.grouper._summarize_component([stale]).status == "in_progress"
+        stale.evidence_date = now - timedelta(days=40)
+
+        summary = self.grouper._summarize_component([stale, recent])
+        assert summary.timeline == {
+            "start": stale.evidence_date,
+            "end": recent.evidence_date,
+            "first_gitlab_activity": stale.evidence_date,
+            "last_gitlab_activity": stale.evidence_date,
+            "first_jira_activity": recent.evidence_date,
+            "last_jira_activity": recent.evidence_date,
+        }
+        assert summary.primary_platform == PlatformType.GITLAB
+        assert summary.platforms == {"gitlab", "jira"}
+        assert summary.complexity_score == pytest.approx(0.4)
+
+    def test_generate_story_description(self):
+        """Test the description lists platforms and relationship types in first-seen order"""
+        relationships = [
+            self.create_relationship("a", "b"),
+            self.create_relationship("c", "b", relationship_type=RelationshipType.REFERENCES),
+            self.create_relationship("d", "b"),
+        ]
+
+        description = self.grouper._generate_story_description(3, ["gitlab", "jira"], relationships)
+
+        assert description == ("Work story involving 3 evidence items across gitlab, jira platforms. "
+                               "Relationship types: solves, references.")
+
+    def test_find_primary_jira_ticket(self):
+        """Test the first solved JIRA ticket wins, with a fallback to any JIRA key"""
+        items = [
+            self.create_item("jira1", PlatformType.JIRA, title="PROJ-1: First"),
+            self.create_item("jira2", PlatformType.JIRA, title="Second", metadata={"key": "PROJ-2"}),
+            self.create_item("mr", title="Work"),
+        ]
+        evidence_map = {item.id: item for item in items}
+        relationships = [
+            self.create_relationship("mr", "jira1", relationship_type=RelationshipType.REFERENCES),
+            self.create_relationship("mr", "jira2"),
+            self.create_relationship("mr", "jira1"),
+        ]
+
+        assert self.grouper._find_primary_jira_ticket(items, relationships, evidence_map) == "PROJ-2"
+        assert self.grouper._find_primary_jira_ticket(items, relationships[:1], evidence_map) == "PROJ-1"
+        assert self.grouper._find_primary_jira_ticket(items[2:], [], evidence_map) is None
+
+    def test_generate_story_title(self):
+        """Test the title prefers the exact ticket key, then a title match, then the longest title"""
+        items = [
+            self.create_item("jira1", PlatformType.JIRA, title="Follow-up to PROJ-1 rollout"),
+            self.create_item("jira2", PlatformType.JIRA, title="PROJ-1: Add caching", metadata={"key": "PROJ-1"}),
+            self.create_item("mr", title="A much longer merge request title"),
+        ]
+
+        assert self.grouper._generate_story_title(items, "PROJ-1") == "PROJ-1: Add caching"
+        assert self.grouper._generate_story_title(items[:1] + items[2:], "PROJ-1") == "Follow-up to PROJ-1 rollout"
+        assert self.grouper._generate_story_title(items, None) == "A much longer merge request title"
+        assert self.grouper._generate_story_title([], None) == "Work Story"
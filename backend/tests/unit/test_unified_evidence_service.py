@@ -432,6 +432,7 @@ class TestUnifiedEvidenceService:
         
         await service.close()
         
+        mock_gitlab_client.close.assert_called_once()
         mock_jira_client.close.assert_called_once()
 
 class TestFactoryFunction: